@@ -0,0 +1,141 @@
+"""
+Load test for the PM-GPT HTTP service (service/server.py).
+
+    python benchmarks/load_test.py --spawn --requests 2000 --concurrency 64
+    python benchmarks/load_test.py --url http://127.0.0.1:8888 --endpoint cluster
+
+--spawn starts a local instance on --port for the duration of the run;
+otherwise the service at --url must already be running.
+"""
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+
+from tornado.httpclient import AsyncHTTPClient, HTTPClientError
+
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+PROBLEMS = [
+    "Users abandon onboarding due to unclear verification steps",
+    "The dashboard is very slow to load during peak hours",
+    "Customers churn right after the free trial ends",
+    "Users are confused by pricing tiers and upgrade paths",
+    "Checkout fails intermittently and payments time out",
+    "Teams stop using reports because insights are hard to find",
+]
+
+
+def request_body(endpoint: str, i: int) -> dict:
+    if endpoint == "cluster":
+        return {"texts": [f"{p} (ticket {i}-{j})" for j, p in enumerate(PROBLEMS * 5)]}
+    return {"problem_text": PROBLEMS[i % len(PROBLEMS)]}
+
+
+def percentile(sorted_values, q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(q * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+async def run_load(url: str, endpoint: str, total: int, concurrency: int) -> dict:
+    client = AsyncHTTPClient(max_clients=concurrency)
+    latencies = []
+    errors = 0
+    next_request = iter(range(total))
+
+    async def worker():
+        nonlocal errors
+        for i in next_request:
+            start = time.perf_counter()
+            try:
+                await client.fetch(
+                    f"{url}/{endpoint}",
+                    method="POST",
+                    body=json.dumps(request_body(endpoint, i)),
+                    headers={"Content-Type": "application/json"},
+                    request_timeout=120,
+                )
+            except (HTTPClientError, OSError):
+                errors += 1
+                continue
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        "endpoint": endpoint,
+        "requests": total,
+        "concurrency": concurrency,
+        "errors": errors,
+        "seconds": round(elapsed, 3),
+        "throughput_rps": round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        "p50_ms": round(percentile(latencies, 0.50) * 1000, 2),
+        "p90_ms": round(percentile(latencies, 0.90) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 2),
+    }
+
+
+async def wait_until_ready(url: str, timeout: float = 30.0) -> None:
+    client = AsyncHTTPClient()
+    deadline = time.monotonic() + timeout
+
+    while True:
+        try:
+            await client.fetch(f"{url}/analyze", method="POST", body="{}", raise_error=False)
+            return
+        except OSError:
+            if time.monotonic() > deadline:
+                raise RuntimeError(f"Service at {url} did not start within {timeout}s")
+            await asyncio.sleep(0.2)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Load-test the PM-GPT HTTP service.")
+    parser.add_argument("--url", default=None, help="Service base URL (default: local --port)")
+    parser.add_argument("--port", type=int, default=8888)
+    parser.add_argument("--spawn", action="store_true", help="Start a local service for the run")
+    parser.add_argument("--endpoint", choices=["analyze", "cluster", "export"], default="analyze")
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--batch-window-ms", type=float, default=5.0, help="Passed to a spawned service")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    url = (args.url or f"http://127.0.0.1:{args.port}").rstrip("/")
+
+    server = None
+    if args.spawn:
+        server = subprocess.Popen(
+            [
+                sys.executable, "-m", "service.server",
+                "--port", str(args.port),
+                "--batch-window-ms", str(args.batch_window_ms),
+            ],
+            cwd=ROOT_DIR,
+        )
+
+    try:
+        asyncio.run(wait_until_ready(url))
+        report = asyncio.run(run_load(url, args.endpoint, args.requests, args.concurrency))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    print(json.dumps(report, indent=2))
+    return 1 if report["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
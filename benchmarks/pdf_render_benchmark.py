@@ -0,0 +1,132 @@
+"""
+PDF render time and memory against backlog size.
+
+    python benchmarks/pdf_render_benchmark.py --items 100 1000 5000 20000
+
+Each (mode, item count) renders export_full_analysis() in a fresh process
+so peak RSS is not inherited from earlier runs. "stream" feeds ReportLab
+from generators (RoadmapExporter default); "list" materializes the whole
+story first, as the exporter used to.
+"""
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+
+def synthetic_analysis(items: int) -> dict:
+    features = [
+        f"Feature {i}: " + "improve the onboarding verification flow " * (1 + i % 4)
+        for i in range(items)
+    ]
+    third = max(1, items // 3)
+
+    return {
+        "problem": {"summary": "Synthetic backlog for render benchmarking."},
+        "features": features,
+        "framework": "RICE",
+        "prioritization": [
+            {"feature": f, "score": round(100 - i * 0.01, 2)} for i, f in enumerate(features)
+        ],
+        "roadmap": {
+            "Month 0–2": features[:third],
+            "Month 2–4": features[third:2 * third],
+            "Month 4–6": features[2 * third:],
+        },
+    }
+
+
+def max_rss_mb() -> float:
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+
+
+def run_one(mode: str, items: int, trace: bool = False) -> dict:
+    from roadmap.roadmap_exporter import RoadmapExporter
+
+    analysis = synthetic_analysis(items)
+    baseline_rss = max_rss_mb()
+
+    with tempfile.TemporaryDirectory() as export_dir:
+        exporter = RoadmapExporter(export_dir, streaming=(mode == "stream"))
+
+        start = time.perf_counter()
+        path = exporter.export_full_analysis(analysis)
+        seconds = time.perf_counter() - start
+        size = os.path.getsize(path)
+        rss = max_rss_mb()
+
+        peak = None
+        if trace:
+            # Second, traced render (tracemalloc slows rendering ~10x)
+            os.remove(path)
+            tracemalloc.start()
+            exporter.export_full_analysis(analysis)
+            peak = round(tracemalloc.get_traced_memory()[1] / (1024 * 1024), 2)
+            tracemalloc.stop()
+
+    return {
+        "mode": mode,
+        "items": items,
+        "seconds": round(seconds, 3),
+        "max_rss_mb": round(rss, 1),
+        "rss_growth_mb": round(rss - baseline_rss, 1),
+        "tracemalloc_peak_mb": peak,
+        "pdf_kb": round(size / 1024, 1),
+    }
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark PDF export against item count.")
+    parser.add_argument("--items", type=int, nargs="+", default=[100, 1000, 5000])
+    parser.add_argument("--modes", nargs="+", choices=["stream", "list"], default=["stream", "list"])
+    parser.add_argument(
+        "--tracemalloc", action="store_true",
+        help="Also report peak Python allocations (slow: renders twice)"
+    )
+    parser.add_argument("--child", nargs=2, metavar=("MODE", "ITEMS"), help=argparse.SUPPRESS)
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+
+    if args.child:
+        mode, items = args.child
+        print(json.dumps(run_one(mode, int(items), args.tracemalloc)))
+        return 0
+
+    print(f"{'mode':<8}{'items':>8}{'seconds':>10}{'max RSS MB':>12}{'RSS +MB':>10}{'py peak MB':>12}{'PDF KB':>10}")
+
+    for items in args.items:
+        for mode in args.modes:
+            command = [sys.executable, os.path.abspath(__file__), "--child", mode, str(items)]
+            if args.tracemalloc:
+                command.append("--tracemalloc")
+
+            out = subprocess.run(
+                command,
+                check=True, capture_output=True, text=True, cwd=ROOT_DIR,
+            ).stdout
+            r = json.loads(out)
+            print(
+                f"{r['mode']:<8}{r['items']:>8}{r['seconds']:>10}{r['max_rss_mb']:>12}"
+                f"{r['rss_growth_mb']:>10}{str(r['tracemalloc_peak_mb'] or '-'):>12}{r['pdf_kb']:>10}"
+            )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
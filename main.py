@@ -1,56 +1,95 @@
-from nlp.text_cleaner import TextCleaner
-from nlp.sentiment import SentimentAnalyzer
-from nlp.clustering import ProblemClusterer
-from product.problem_mapper import ProblemMapper
-from product.feature_generator import FeatureGenerator
-from product.rice_scoring import RiceScorer
-from roadmap.roadmap_generator import RoadmapGenerator
+import argparse
+import sys
+
+from pipeline.feedback_reader import FeedbackReader
+from pipeline.batch_pipeline import BatchPipeline
+
+
+def cluster_count(value: str):
+    if value == "auto":
+        return value
+
+    count = int(value)
+    if count < 1:
+        raise argparse.ArgumentTypeError("--clusters must be >= 1 or 'auto'")
+    return count
+
+
+def chunk_size(value: str) -> int:
+    size = int(value)
+    if size < 1:
+        raise argparse.ArgumentTypeError("--chunk-size must be >= 1")
+    return size
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Stream user feedback from CSV/JSONL/text files through the PM-GPT pipeline."
+    )
+    parser.add_argument(
+        "inputs", nargs="+",
+        help="Feedback files (.csv, .tsv, .jsonl/.ndjson or .txt with one feedback per line), e.g. data/reviews.csv"
+    )
+    parser.add_argument(
+        "-o", "--output", default="-",
+        help="JSONL file to write cluster results to ('-' for stdout)"
+    )
+    parser.add_argument(
+        "--text-field", default=None,
+        help="Column / key holding the feedback text (auto-detected by default)"
+    )
+    parser.add_argument(
+        "--chunk-size", type=chunk_size, default=1000,
+        help="Rows processed per chunk; bounds peak memory"
+    )
+    parser.add_argument(
+        "--clusters", type=cluster_count, default=3,
+        help="Clusters per chunk, or 'auto' to pick k per corpus"
+    )
+    parser.add_argument(
+        "--incremental", action="store_true",
+        help="Update one online clustering model across chunks (stable cluster ids)"
+    )
+    parser.add_argument(
+        "--framework", default="RICE",
+        choices=["RICE", "ICE", "MoSCoW", "Kano"],
+        help="Prioritization framework"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+
+    pipeline = BatchPipeline(
+        num_clusters=args.clusters,
+        framework=args.framework,
+        incremental=args.incremental
+    )
+
+    def chunks():
+        for path in args.inputs:
+            reader = FeedbackReader(
+                path,
+                text_field=args.text_field,
+                chunk_size=args.chunk_size
+            )
+            yield from reader.chunks()
+
+    out = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    try:
+        totals = pipeline.run(chunks(), out)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    print(
+        f"📅 PM-GPT processed {totals['rows']} feedback rows in {totals['chunks']} chunks "
+        f"→ {totals['clusters']} problem clusters",
+        file=sys.stderr
+    )
+    return 0
 
 
 if __name__ == "__main__":
-    cleaner = TextCleaner()
-    sentiment_analyzer = SentimentAnalyzer()
-    clusterer = ProblemClusterer(num_clusters=2)
-    problem_mapper = ProblemMapper()
-    feature_generator = FeatureGenerator()
-    rice_scorer = RiceScorer()
-    roadmap_generator = RoadmapGenerator()
-
-    feedbacks = [
-        "Payment failed again and I am very frustrated",
-        "Checkout process keeps crashing",
-        "Search results are very inaccurate",
-        "I cannot find relevant products using search"
-    ]
-
-    cleaned_texts = [cleaner.clean(text) for text in feedbacks]
-    clusters = clusterer.cluster(cleaned_texts)
-
-    scored_features = []
-
-    for items in clusters.values():
-        problem = problem_mapper.map_problem(items)
-        features = feature_generator.generate_features(problem)
-
-        for feature in features:
-            metrics = {
-                "reach": 1000,
-                "impact": 3,
-                "confidence": 0.8,
-                "effort": 2
-            }
-
-            score = rice_scorer.score(feature, metrics)
-            scored_features.append({
-                "feature": feature,
-                "score": score
-            })
-
-    roadmap = roadmap_generator.generate(scored_features)
-
-    print("\n📅 PM-GPT Product Roadmap\n")
-    for phase, features in roadmap.items():
-        print(f"{phase}:")
-        for feature in features:
-            print(f"  - {feature}")
-        print()
+    sys.exit(main())
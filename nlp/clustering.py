@@ -1,16 +1,103 @@
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.cluster import KMeans
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from typing import Union
+
+import numpy as np
+from joblib import Parallel, delayed
+from sklearn.feature_extraction.text import TfidfVectorizer, HashingVectorizer
+from sklearn.cluster import KMeans, MiniBatchKMeans
+from sklearn.metrics import silhouette_score
+
+
+AUTO = "auto"
+
+# Bump when the on-disk layout written by ProblemClusterer.save() changes
+MODEL_FORMAT_VERSION = 1
+
+MANIFEST_FILE = "manifest.json"
+VOCABULARY_FILE = "vocabulary.json"
+IDF_FILE = "idf.npy"
+CENTROIDS_FILE = "centroids.npy"
+
+
+def _fit_candidate(vectors, k: int, selection: str) -> float:
+    model = KMeans(n_clusters=k, random_state=42, n_init=3)
+    labels = model.fit_predict(vectors)
+
+    if selection == "elbow":
+        return model.inertia_
+
+    if len(set(labels)) < 2:
+        return -1.0
+
+    return silhouette_score(vectors, labels)
 
 
 class ProblemClusterer:
     """
     Clusters user feedback into product problem groups.
+
+    Two modes:
+    - cluster(): full TF-IDF + KMeans refit over the given corpus
+    - partial_cluster(): online mode; a stateless hashing vectorizer feeds
+      MiniBatchKMeans.partial_fit, so each new batch updates the existing
+      centroids without revisiting earlier feedback
+
+    Pass num_clusters="auto" to pick k automatically: candidate k values are
+    swept in parallel on a sample and scored by silhouette (or the inertia
+    elbow). The chosen k is cached per corpus fingerprint.
+
+    A fitted model can be saved and loaded back (vocabulary, IDF weights
+    and centroids; arrays are memory-mapped), after which predict() assigns
+    new feedback to the existing clusters without refitting.
     """
 
-    def __init__(self, num_clusters: int = 3):
+    # corpus fingerprint -> chosen k, shared by all instances
+    _k_cache = OrderedDict()
+    K_CACHE_SIZE = 256
+
+    def __init__(
+        self,
+        num_clusters: Union[int, str] = 3,
+        hash_features: int = 2 ** 18,
+        max_clusters: int = 10,
+        sample_size: int = 2000,
+        k_selection: str = "silhouette",
+        n_jobs: int = -1,
+    ):
+        if k_selection not in ("silhouette", "elbow"):
+            raise ValueError("k_selection must be 'silhouette' or 'elbow'")
+
         self.num_clusters = num_clusters
+        self.auto_k = num_clusters == AUTO
+        self.max_clusters = max_clusters
+        self.sample_size = sample_size
+        self.k_selection = k_selection
+        self.n_jobs = n_jobs
+
+        initial_k = 2 if self.auto_k else num_clusters
+
         self.vectorizer = TfidfVectorizer(stop_words="english")
-        self.model = KMeans(n_clusters=self.num_clusters, random_state=42)
+        self.model = KMeans(n_clusters=initial_k, random_state=42)
+
+        # Online mode state
+        self.hashing_vectorizer = HashingVectorizer(
+            stop_words="english",
+            n_features=hash_features,
+            alternate_sign=False
+        )
+        self.online_model = MiniBatchKMeans(
+            n_clusters=initial_k,
+            random_state=42,
+            n_init=3
+        )
+        self.online_fitted = False
+        self._pending = []
+
+        # Lightweight predict() state, set by load() or built on demand
+        self._artifacts = None
 
     def cluster(self, texts: list[str]) -> dict:
         """
@@ -25,9 +112,312 @@ class ProblemClusterer:
         if not texts:
             return {}
 
+        if len(texts) < 2:
+            return {0: list(texts)}
+
         vectors = self.vectorizer.fit_transform(texts)
+
+        if self.auto_k:
+            k = self.choose_k(texts, vectors)
+        else:
+            # Never ask KMeans for more clusters than there are texts
+            k = min(self.num_clusters, len(texts))
+
+        self.model.set_params(n_clusters=k)
         labels = self.model.fit_predict(vectors)
+        self._artifacts = None
+
+        return self._group(texts, labels)
+
+    def partial_cluster(self, texts: list[str], final: bool = False) -> dict:
+        """
+        Update the online clusters with a new batch and assign it.
+
+        Cluster ids stay stable across calls. Until `num_clusters` texts have
+        been seen, texts are held back and returned with the first batch
+        that initializes the model. In auto mode k is chosen once, from that
+        first batch.
+
+        Pass `final=True` with the last batch (or call finalize()) so texts
+        still held back at end of input are clustered too, with k reduced
+        to the number of texts if needed.
+
+        Args:
+            texts (list[str]): Cleaned user feedback texts (new batch only)
+            final (bool): No more batches will follow
+
+        Returns:
+            dict: cluster_id -> list of feedback from this batch
+        """
+        if not self.online_fitted:
+            texts = self._pending + list(texts)
+
+            if len(texts) < self.online_model.n_clusters:
+                if not final or not texts:
+                    self._pending = texts
+                    return {}
+
+                # Never ask MiniBatchKMeans for more clusters than texts
+                self.online_model.set_params(n_clusters=len(texts))
+
+            self._pending = []
+
+        if not texts:
+            return {}
+
+        vectors = self.hashing_vectorizer.transform(texts)
+
+        if not self.online_fitted and self.auto_k:
+            self.online_model.set_params(
+                n_clusters=min(len(texts), max(2, self.choose_k(texts, vectors)))
+            )
+
+        self.online_model.partial_fit(vectors)
+        self.online_fitted = True
+        self._artifacts = None
+
+        return self._group(texts, self.online_model.predict(vectors))
+
+    def finalize(self) -> dict:
+        """
+        Cluster any texts partial_cluster() is still holding back.
+        """
+        return self.partial_cluster([], final=True)
+
+    # --------------------------------------------------
+    # PERSISTED MODEL ARTIFACTS
+    # --------------------------------------------------
+    def save(self, path: str, online: bool = False) -> str:
+        """
+        Persist the fitted clustering model to a directory.
+
+        Args:
+            path (str): Target directory (created if missing)
+            online (bool): Save the partial_cluster() model instead of
+                the cluster() model
+
+        Returns:
+            str: The directory written
+        """
+        mode, vocabulary, idf, centroids = self._export_artifacts(online)
+
+        os.makedirs(path, exist_ok=True)
+
+        self._write_array(path, CENTROIDS_FILE, centroids)
+        if mode == "tfidf":
+            self._write_array(path, IDF_FILE, idf)
+
+            terms = [None] * len(vocabulary)
+            for term, index in vocabulary.items():
+                terms[index] = term
+            self._write_json(path, VOCABULARY_FILE, terms)
+
+        # Manifest last: a directory without one is never loadable
+        self._write_json(path, MANIFEST_FILE, {
+            "format_version": MODEL_FORMAT_VERSION,
+            "mode": mode,
+            "num_clusters": int(centroids.shape[0]),
+            "n_features": int(centroids.shape[1]),
+        })
+
+        return path
+
+    @classmethod
+    def load(cls, path: str) -> "ProblemClusterer":
+        """
+        Load a model written by save(). Arrays are memory-mapped read-only.
+
+        Raises:
+            ValueError: If the artifact format version is not supported
+        """
+        with open(os.path.join(path, MANIFEST_FILE), encoding="utf-8") as f:
+            manifest = json.load(f)
+
+        version = manifest.get("format_version")
+        if version != MODEL_FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported clustering model format version {version} "
+                f"(expected {MODEL_FORMAT_VERSION})"
+            )
+
+        mode = manifest["mode"]
+        centroids = np.load(os.path.join(path, CENTROIDS_FILE), mmap_mode="r")
+
+        clusterer = cls(
+            num_clusters=manifest["num_clusters"],
+            hash_features=manifest["n_features"] if mode == "hashing" else 2 ** 18
+        )
+
+        if mode == "tfidf":
+            with open(os.path.join(path, VOCABULARY_FILE), encoding="utf-8") as f:
+                terms = json.load(f)
+            vocabulary = {term: index for index, term in enumerate(terms)}
+            idf = np.load(os.path.join(path, IDF_FILE), mmap_mode="r")
+        else:
+            vocabulary, idf = None, None
+
+        clusterer._artifacts = clusterer._build_predictor(mode, vocabulary, idf, centroids)
+        return clusterer
+
+    def predict(self, texts: list[str]) -> np.ndarray:
+        """
+        Assign cleaned texts to the nearest existing cluster (no refit).
+
+        Returns:
+            np.ndarray: Cluster id per text
+        """
+        if self._artifacts is None:
+            self._artifacts = self._build_predictor(*self._export_artifacts(self._prefer_online()))
+
+        if not texts:
+            return np.zeros(0, dtype=np.int32)
+
+        project, half_sq_norms = self._artifacts
+
+        # argmin ||x - c||^2 == argmax (x·c - ||c||^2 / 2)
+        return np.argmax(project(texts) - half_sq_norms, axis=1).astype(np.int32)
+
+    def _prefer_online(self) -> bool:
+        return self.online_fitted and not hasattr(self.model, "cluster_centers_")
+
+    def _export_artifacts(self, online: bool):
+        if online:
+            if not self.online_fitted:
+                raise ValueError("Online clustering model is not fitted yet")
+            return "hashing", None, None, self.online_model.cluster_centers_
+
+        if not hasattr(self.model, "cluster_centers_"):
+            raise ValueError("Clustering model is not fitted yet; call cluster() first")
+
+        return (
+            "tfidf",
+            self.vectorizer.vocabulary_,
+            self.vectorizer.idf_,
+            self.model.cluster_centers_,
+        )
+
+    def _build_predictor(self, mode: str, vocabulary, idf, centroids):
+        centroids_t = np.asarray(centroids, dtype=np.float64).T.copy()
+
+        if mode == "tfidf":
+            # Same tokenization and weighting as the fitted TfidfVectorizer
+            # (raw tf * idf, L2-normalized), without sklearn's per-call
+            # validation overhead: each text only touches its own terms
+            analyze = TfidfVectorizer(stop_words="english").build_analyzer()
+            idf = np.asarray(idf, dtype=np.float64)
+            lookup = vocabulary.get
+
+            def project(texts):
+                projected = np.zeros((len(texts), centroids_t.shape[1]))
+
+                for row, text in enumerate(texts):
+                    counts = {}
+                    for index in map(lookup, analyze(text)):
+                        if index is not None:
+                            counts[index] = counts.get(index, 0) + 1
+                    if not counts:
+                        continue
+
+                    indices = np.fromiter(counts.keys(), dtype=np.intp, count=len(counts))
+                    weights = np.fromiter(counts.values(), dtype=np.float64, count=len(counts))
+                    weights *= idf[indices]
+                    projected[row] = (weights / np.sqrt(weights @ weights)) @ centroids_t[indices]
+
+                return projected
+        else:
+            hashing_vectorizer = self.hashing_vectorizer
+
+            def project(texts):
+                return np.asarray(hashing_vectorizer.transform(texts) @ centroids_t)
+
+        return project, 0.5 * (centroids_t ** 2).sum(axis=0)
+
+    @staticmethod
+    def _write_array(path: str, name: str, array) -> None:
+        target = os.path.join(path, name)
+        tmp = f"{target}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            np.save(f, np.asarray(array))
+        os.replace(tmp, target)
+
+    @staticmethod
+    def _write_json(path: str, name: str, data) -> None:
+        target = os.path.join(path, name)
+        tmp = f"{target}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp, target)
+
+    # --------------------------------------------------
+    # AUTO-K SELECTION
+    # --------------------------------------------------
+    def choose_k(self, texts: list[str], vectors) -> int:
+        """
+        Pick k for this corpus, reusing a cached choice when the same
+        corpus has been seen before.
+        """
+        fingerprint = self._fingerprint(texts, vectors.shape[1])
+        cache = ProblemClusterer._k_cache
+
+        if fingerprint in cache:
+            cache.move_to_end(fingerprint)
+            return cache[fingerprint]
+
+        k = self._sweep_k(vectors)
+
+        cache[fingerprint] = k
+        if len(cache) > self.K_CACHE_SIZE:
+            cache.popitem(last=False)
+
+        return k
+
+    def _sweep_k(self, vectors) -> int:
+        n = vectors.shape[0]
+
+        if n > self.sample_size:
+            rng = np.random.default_rng(42)
+            vectors = vectors[np.sort(rng.choice(n, self.sample_size, replace=False))]
+            n = self.sample_size
+
+        # Silhouette is only defined for 2 <= k <= n - 1
+        candidates = list(range(2, min(self.max_clusters, n - 1) + 1))
+        if not candidates:
+            return 1
+
+        scores = Parallel(n_jobs=self.n_jobs, prefer="threads")(
+            delayed(_fit_candidate)(vectors, k, self.k_selection) for k in candidates
+        )
+
+        if self.k_selection == "elbow":
+            return candidates[self._elbow_index(scores)]
+
+        return candidates[int(np.argmax(scores))]
+
+    @staticmethod
+    def _elbow_index(inertias) -> int:
+        # Point furthest from the line joining the first and last inertia
+        y = np.asarray(inertias, dtype=np.float64)
+        if len(y) < 3 or y[0] == y[-1]:
+            return 0
+
+        x = np.linspace(0.0, 1.0, len(y))
+        y = (y - y[-1]) / (y[0] - y[-1])
+
+        return int(np.argmax(np.abs(y - (1.0 - x))))
+
+    def _fingerprint(self, texts: list[str], n_features: int) -> str:
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(
+            f"{self.k_selection}|{self.max_clusters}|{self.sample_size}|{n_features}".encode()
+        )
+        for text in texts:
+            digest.update(text.encode("utf-8"))
+            digest.update(b"\x00")
+
+        return digest.hexdigest()
 
+    @staticmethod
+    def _group(texts: list[str], labels) -> dict:
         clusters = {}
         for text, label in zip(texts, labels):
             clusters.setdefault(label, []).append(text)
@@ -1,18 +1,40 @@
-import nltk
-from nltk.sentiment.vader import SentimentIntensityAnalyzer
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from nlp.vader_lexicon import shared_analyzer
+
+
+SENTIMENT_FIELDS = ("neg", "neu", "pos", "compound")
+
+# Per-process analyzer used by analyze_many() workers
+_worker_analyzer = None
+
+
+def _init_worker():
+    global _worker_analyzer
+    _worker_analyzer = SentimentAnalyzer()
+    shared_analyzer()  # load the lexicon once, up front
+
+
+def _score_shard(texts: List[str]) -> np.ndarray:
+    return _worker_analyzer._score_rows(texts)
 
 
 class SentimentAnalyzer:
     """
     Analyzes sentiment of user feedback to estimate urgency and polarity.
+
+    The VADER lexicon is never downloaded at runtime: it is loaded lazily
+    from the local cache (see nlp.vader_lexicon) on first use and shared by
+    every instance in the process, so construction itself is free.
     """
 
-    def __init__(self):
-        try:
-            self.analyzer = SentimentIntensityAnalyzer()
-        except LookupError:
-            nltk.download("vader_lexicon")
-            self.analyzer = SentimentIntensityAnalyzer()
+    @property
+    def analyzer(self):
+        return shared_analyzer()
 
     def analyze(self, text: str) -> dict:
         """
@@ -28,3 +50,56 @@ class SentimentAnalyzer:
             return {"neg": 0, "neu": 1, "pos": 0, "compound": 0}
 
         return self.analyzer.polarity_scores(text)
+
+    def analyze_many(
+        self,
+        texts: List[str],
+        workers: Optional[int] = None,
+        shard_size: int = 5000,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Score many texts, sharding the work across a process pool.
+
+        Each worker loads the VADER lexicon once and scores whole shards,
+        so per-text overhead is a single polarity_scores() call.
+
+        Args:
+            texts (list[str]): Cleaned user feedback
+            workers (int, optional): Worker processes (default: CPU count).
+                Use 1 to score in the current process.
+            shard_size (int): Texts sent to a worker per task
+
+        Returns:
+            dict: Column name ("neg", "neu", "pos", "compound") -> float64 array,
+                  aligned with the input order
+        """
+        texts = list(texts)
+        workers = workers or os.cpu_count() or 1
+
+        if workers == 1 or len(texts) <= shard_size:
+            matrix = self._score_rows(texts)
+        else:
+            shards = [
+                texts[start:start + shard_size]
+                for start in range(0, len(texts), shard_size)
+            ]
+            with ProcessPoolExecutor(
+                max_workers=min(workers, len(shards)),
+                initializer=_init_worker
+            ) as pool:
+                matrix = np.concatenate(list(pool.map(_score_shard, shards)), axis=1)
+
+        return {field: matrix[i] for i, field in enumerate(SENTIMENT_FIELDS)}
+
+    def _score_rows(self, texts: List[str]) -> np.ndarray:
+        # One contiguous row per field, one column per text
+        matrix = np.zeros((len(SENTIMENT_FIELDS), len(texts)), dtype=np.float64)
+        matrix[1] = 1.0  # neutral default for empty / non-string input
+
+        polarity_scores = self.analyzer.polarity_scores
+        for col, text in enumerate(texts):
+            if isinstance(text, str) and text.strip():
+                scores = polarity_scores(text)
+                matrix[:, col] = [scores[field] for field in SENTIMENT_FIELDS]
+
+        return matrix
@@ -1,6 +1,31 @@
 import re
 import string
-from typing import List
+from typing import Iterable, List
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:  # pyarrow is optional; Arrow inputs are then unsupported
+    pa = None
+    pc = None
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+
+# Precompiled once at import instead of on every clean() call
+WHITESPACE_RE = re.compile(r"\s+")
+
+# Joins a whole batch into one string so lower()/translate()/sub() run once.
+# NUL is neither punctuation nor whitespace, so it survives cleaning intact.
+_BATCH_SEPARATOR = "\x00"
+
+# RE2 equivalents of the Python patterns above, for pyarrow.compute kernels.
+# `\s` in RE2 is ASCII-only, so spell out the characters str.isspace() accepts.
+_ARROW_WHITESPACE = r"[\t-\r\x{1c}-\x{1f}\x{85}\p{Z}]+"
+_ARROW_PUNCTUATION = "[" + re.escape(string.punctuation) + "]"
 
 
 class TextCleaner:
@@ -21,7 +46,7 @@ class TextCleaner:
 
         text = text.lower()
         text = text.translate(self.punctuation_table)
-        text = re.sub(r"\s+", " ", text).strip()
+        text = WHITESPACE_RE.sub(" ", text).strip()
 
         return text
 
@@ -31,3 +56,81 @@ class TextCleaner:
         """
         cleaned_text = self.clean(text)
         return cleaned_text.split()
+
+    # --------------------------------------------------
+    # BATCH API
+    # --------------------------------------------------
+    def clean_batch(self, texts):
+        """
+        Clean many texts in one pass. Output matches clean() per item.
+
+        Accepts a list (or any iterable) of strings, a pandas Series or a
+        pyarrow string Array / ChunkedArray, and returns the same kind of
+        container. Arrow inputs are cleaned with pyarrow.compute kernels.
+        """
+        if self._is_arrow(texts):
+            return self._clean_arrow(texts)
+
+        if pd is not None and isinstance(texts, pd.Series):
+            return pd.Series(
+                self._clean_list(texts.tolist()),
+                index=texts.index,
+                name=texts.name
+            )
+
+        return self._clean_list(texts)
+
+    def tokenize_batch(self, texts):
+        """
+        Tokenize many texts in one pass.
+
+        Returns a list of token lists, a pandas Series of token lists, or a
+        pyarrow ListArray, matching the input container.
+        """
+        if self._is_arrow(texts):
+            cleaned = self._clean_arrow(texts)
+            tokens = pc.split_pattern(cleaned, " ")
+            # "".split() is [] in Python, but split_pattern yields [""]
+            return pc.if_else(
+                pc.equal(cleaned, ""),
+                pa.scalar([], type=tokens.type),
+                tokens
+            )
+
+        cleaned = self.clean_batch(texts)
+
+        if pd is not None and isinstance(cleaned, pd.Series):
+            return cleaned.str.split()
+
+        return [text.split() for text in cleaned]
+
+    def _clean_list(self, texts: Iterable) -> List[str]:
+        texts = [text if isinstance(text, str) else "" for text in texts]
+        if not texts:
+            return []
+
+        joined = _BATCH_SEPARATOR.join(texts)
+
+        if joined.count(_BATCH_SEPARATOR) != len(texts) - 1:
+            # Input already contains the separator; fall back to per-item
+            return [self.clean(text) for text in texts]
+
+        joined = joined.lower().translate(self.punctuation_table)
+        joined = WHITESPACE_RE.sub(" ", joined)
+
+        return [text.strip() for text in joined.split(_BATCH_SEPARATOR)]
+
+    def _clean_arrow(self, texts):
+        if not pa.types.is_string(texts.type) and not pa.types.is_large_string(texts.type):
+            texts = pc.cast(texts, pa.string())
+
+        texts = pc.fill_null(texts, "")
+        texts = pc.utf8_lower(texts)
+        texts = pc.replace_substring_regex(texts, _ARROW_PUNCTUATION, "")
+        texts = pc.replace_substring_regex(texts, _ARROW_WHITESPACE, " ")
+
+        return pc.utf8_trim_whitespace(texts)
+
+    @staticmethod
+    def _is_arrow(texts) -> bool:
+        return pa is not None and isinstance(texts, (pa.Array, pa.ChunkedArray))
@@ -0,0 +1,153 @@
+"""
+Offline VADER lexicon cache.
+
+The NLTK lexicon text is parsed once and stored as two .npy files
+(fixed-width words + float64 valences). Loading them is a pair of array
+reads instead of a text parse; VADER then looks words up in a plain dict,
+built once per process.
+Nothing here ever touches the network: the lexicon must already be on
+disk, either as a cache built at deploy time or as NLTK data.
+
+Build the cache on a machine that has the lexicon:
+
+    python -m nlp.vader_lexicon                      # from NLTK data
+    python -m nlp.vader_lexicon path/to/vader_lexicon.txt
+"""
+
+import os
+import sys
+from functools import lru_cache
+from typing import Dict, Optional
+
+import numpy as np
+from nltk.sentiment.vader import SentimentIntensityAnalyzer, VaderConstants
+
+
+NLTK_RESOURCE = "sentiment/vader_lexicon.zip/vader_lexicon/vader_lexicon.txt"
+
+WORDS_FILE = "vader_lexicon_words.npy"
+SCORES_FILE = "vader_lexicon_scores.npy"
+
+
+def cache_dir() -> str:
+    """
+    Directory holding the lexicon cache (override with PMGPT_VADER_CACHE).
+    """
+    return os.environ.get(
+        "PMGPT_VADER_CACHE",
+        os.path.join(os.path.expanduser("~"), ".cache", "pm-gpt")
+    )
+
+
+def parse_lexicon(text: str) -> Dict[str, float]:
+    """
+    Parse VADER's tab-separated lexicon format (same rules as NLTK).
+    """
+    lexicon = {}
+    for line in text.split("\n"):
+        parts = line.strip().split("\t")
+        if len(parts) >= 2:
+            lexicon[parts[0]] = float(parts[1])
+    return lexicon
+
+
+def build_cache(source: Optional[str] = None, directory: Optional[str] = None) -> str:
+    """
+    Write the .npy cache from a lexicon text file.
+
+    Args:
+        source (str, optional): Path to vader_lexicon.txt. Defaults to the
+            copy in local NLTK data (never downloaded).
+        directory (str, optional): Cache directory (default: cache_dir())
+
+    Returns:
+        str: Cache directory
+    """
+    if source is None:
+        import nltk
+
+        source = nltk.data.find(NLTK_RESOURCE)
+
+    if hasattr(source, "open"):
+        with source.open() as f:
+            raw = f.read()
+    else:
+        with open(source, "rb") as f:
+            raw = f.read()
+
+    lexicon = parse_lexicon(raw.decode("utf-8") if isinstance(raw, bytes) else raw)
+
+    directory = directory or cache_dir()
+    os.makedirs(directory, exist_ok=True)
+
+    # Write to temp files first so concurrent readers never see partial data
+    for name, array in (
+        (WORDS_FILE, np.array(list(lexicon.keys()), dtype=np.str_)),
+        (SCORES_FILE, np.array(list(lexicon.values()), dtype=np.float64)),
+    ):
+        path = os.path.join(directory, name)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            np.save(f, array)
+        os.replace(tmp_path, path)
+
+    return directory
+
+
+@lru_cache(maxsize=None)
+def load_lexicon() -> Dict[str, float]:
+    """
+    Load the lexicon once per process, building the cache from local
+    NLTK data on first use if needed.
+
+    Raises:
+        LookupError: If neither the cache nor local NLTK data is available
+    """
+    directory = cache_dir()
+    words_path = os.path.join(directory, WORDS_FILE)
+    scores_path = os.path.join(directory, SCORES_FILE)
+
+    if not (os.path.exists(words_path) and os.path.exists(scores_path)):
+        try:
+            build_cache(directory=directory)
+        except LookupError:
+            raise LookupError(
+                "VADER lexicon not found and runtime downloads are disabled. "
+                "Build the cache at deploy time with `python -m nlp.vader_lexicon "
+                "[path/to/vader_lexicon.txt]` or set PMGPT_VADER_CACHE to an "
+                "existing cache directory."
+            ) from None
+
+    words = np.load(words_path)
+    scores = np.load(scores_path)
+
+    return dict(zip(words.tolist(), scores.tolist()))
+
+
+class CachedSentimentIntensityAnalyzer(SentimentIntensityAnalyzer):
+    """
+    VADER analyzer over an already-parsed lexicon.
+
+    The base constructor always reads the lexicon text through nltk.data;
+    this one takes the lexicon dict instead.
+    """
+
+    def __init__(self, lexicon: Dict[str, float]):
+        self.lexicon_file = ""
+        self.lexicon = lexicon
+        self.constants = VaderConstants()
+
+    def make_lex_dict(self) -> Dict[str, float]:
+        return dict(self.lexicon)
+
+
+@lru_cache(maxsize=None)
+def shared_analyzer() -> CachedSentimentIntensityAnalyzer:
+    """
+    One VADER analyzer per process, shared by every SentimentAnalyzer.
+    """
+    return CachedSentimentIntensityAnalyzer(load_lexicon())
+
+
+if __name__ == "__main__":
+    print(f"VADER lexicon cache written to {build_cache(*sys.argv[1:2])}")
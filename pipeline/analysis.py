@@ -0,0 +1,385 @@
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from product.problem_mapper import ProblemMapper, FALLBACK_TYPE_MATCHER, normalize_problem_text
+from product.feature_generator import FeatureGenerator
+from product.framework_selector import FrameworkSelector
+from product.framework_explainer import FrameworkExplainer
+from product.prioritization_strategy import ScoredFeature
+from product.strategy_resolver import StrategyResolver
+from product.decision_narrator import DecisionNarrator
+from product.pm_judgment_engine import PMJudgmentEngine
+from roadmap.roadmap_generator import RoadmapGenerator
+
+
+DEFAULT_BUSINESS_IMPACT = [
+    "Negative impact on key product metrics",
+    "Increased risk of user churn",
+    "Long-term business impact if unresolved"
+]
+
+DEFAULT_CONSTRAINTS = [
+    "Limited engineering capacity",
+    "Need to balance speed with quality",
+    "Execution risk must be managed"
+]
+
+
+# --------------------------------------------------
+# FRAMEWORK-AWARE PROBLEM INSIGHT ADJUSTMENT
+# --------------------------------------------------
+def adjust_problem_insight(problem_data, framework):
+    adjusted = problem_data.copy()
+
+    if framework == "RICE":
+        adjusted["core_problem"] = (
+            "Multiple viable feature options exist, but it is unclear which will deliver the highest impact given limited effort."
+        )
+        adjusted["user_failure_point"] = (
+            "Users are not failing outright; the risk lies in making suboptimal prioritization decisions."
+        )
+        adjusted["success_definition"] = (
+            "Objectively prioritize features to maximize impact relative to effort."
+        )
+
+    elif framework == "ICE":
+        adjusted["core_problem"] = (
+            "There is uncertainty around which ideas will move key metrics, requiring fast validation."
+        )
+        adjusted["user_failure_point"] = (
+            "Users may not benefit if unvalidated ideas are scaled prematurely."
+        )
+        adjusted["success_definition"] = (
+            "Rapidly test assumptions to identify high-confidence opportunities."
+        )
+
+    elif framework == "MoSCoW":
+        adjusted["core_problem"] = (
+            "Scope clarity is needed to ensure timely and focused delivery."
+        )
+        adjusted["user_failure_point"] = (
+            "Users may experience delays if priorities are not clearly defined."
+        )
+        adjusted["success_definition"] = (
+            "Clearly define must-haves versus nice-to-haves for delivery."
+        )
+
+    return adjusted
+
+
+def infer_problem_type_from_text(text: str) -> str:
+    return FALLBACK_TYPE_MATCHER.first(text.lower(), default="general")
+
+
+def _safe_call(fn, *args):
+    try:
+        return fn(*args)
+    except TypeError:
+        return fn(args[0])
+
+
+# --------------------------------------------------
+# RESULT
+# --------------------------------------------------
+class AnalysisResult:
+    """
+    Output of one end-to-end analysis.
+
+    Slotted: batch jobs and services may hold many of these at once.
+    """
+
+    __slots__ = (
+        "problem",
+        "problem_type",
+        "features",
+        "framework",
+        "framework_explanation",
+        "prioritization",
+        "roadmap",
+        "reasoning",
+        "judgment",
+    )
+
+    def __init__(
+        self,
+        problem: Dict,
+        problem_type: str,
+        features: List[str],
+        framework: str,
+        framework_explanation: str,
+        prioritization: List[ScoredFeature],
+        roadmap: Dict[str, List[str]],
+        reasoning: Dict[str, str],
+        judgment: Dict,
+    ):
+        self.problem = problem
+        self.problem_type = problem_type
+        self.features = features
+        self.framework = framework
+        self.framework_explanation = framework_explanation
+        self.prioritization = prioritization
+        self.roadmap = roadmap
+        self.reasoning = reasoning
+        self.judgment = judgment
+
+    def __repr__(self) -> str:
+        return (
+            f"AnalysisResult(problem_type={self.problem_type!r}, "
+            f"framework={self.framework!r}, features={len(self.features)})"
+        )
+
+    def to_payload(self) -> Dict:
+        """
+        The analysis dict rendered by the app and RoadmapExporter.
+        """
+        return {
+            "problem": self.problem,
+            "features": self.features,
+            "framework": self.framework,
+            "framework_explanation": self.framework_explanation,
+            "prioritization": self.prioritization,
+            "roadmap": self.roadmap,
+            "reasoning": self.reasoning,
+            "judgment": self.judgment,
+        }
+
+
+# --------------------------------------------------
+# PIPELINE
+# --------------------------------------------------
+class AnalysisPipeline:
+    """
+    Problem → Features → Framework → Prioritization → Roadmap → Judgment,
+    without any UI dependency.
+
+    Components are stateless, so one pipeline can be shared by every
+    caller (see default_pipeline()).
+    """
+
+    def __init__(self):
+        self.problem_mapper = ProblemMapper()
+        self.feature_generator = FeatureGenerator()
+        self.framework_selector = FrameworkSelector()
+        self.framework_explainer = FrameworkExplainer()
+        self.strategy_resolver = StrategyResolver()
+        self.roadmap_generator = RoadmapGenerator()
+        self.narrator = DecisionNarrator()
+        self.judgment_engine = PMJudgmentEngine()
+
+    def analyze(self, problem_text: str, framework: Optional[str] = None) -> AnalysisResult:
+        """
+        Run the full pipeline for one problem statement.
+
+        Args:
+            problem_text (str): Free-text product problem
+            framework (str, optional): RICE / ICE / MoSCoW / Kano.
+                None lets FrameworkSelector decide.
+
+        Every stage reads the text case- and whitespace-insensitively
+        (see normalize_problem_text); only raw_signal keeps it verbatim.
+        """
+        normalized = normalize_problem_text(problem_text)
+
+        # 1️⃣ Problem Mapping
+        problem_data = self.problem_mapper.map(problem_text)
+        problem_type = problem_data.get("problem_type", "general")
+        if problem_type == "general":
+            problem_type = infer_problem_type_from_text(normalized)
+
+        problem_summary = problem_data.get("summary", problem_text)
+        problem_data["raw_signal"] = problem_text.strip()
+
+        # 2️⃣ Feature Generation
+        features = self.feature_generator.generate(
+            problem_type=problem_type,
+            summary=problem_summary
+        )
+
+        # 3️⃣ Framework Selection
+        if framework is None:
+            framework = self.framework_selector.select(
+                problem_type=problem_type,
+                summary=normalized
+            )
+
+        problem_data = adjust_problem_insight(problem_data, framework)
+
+        # 4️⃣ Prioritization
+        scored_features = self.strategy_resolver.resolve(framework, features)
+
+        # 5️⃣ Roadmap
+        roadmap = self.roadmap_generator.generate(
+            scored_features,
+            framework=framework
+        )
+
+        # 6️⃣ Judgment
+        return self._result(problem_data, problem_type, features, framework, scored_features, roadmap)
+
+    def analyze_many(
+        self,
+        problem_texts: Iterable[str],
+        frameworks: Optional[Sequence[Optional[str]]] = None,
+    ) -> List[AnalysisResult]:
+        """
+        Analyze many problem statements in one pass, stage by stage.
+
+        Apart from the raw signal, a result depends only on (mapped type,
+        inferred type, framework). Texts are mapped with one
+        ProblemMapper.map_many() call; each distinct combination then goes
+        once through FeatureGenerator.generate_many(),
+        StrategyResolver.resolve_many() and RoadmapGenerator.generate_many(),
+        and other texts reuse it. Results in one batch may therefore share
+        nested lists (treat them as read-only).
+
+        Args:
+            problem_texts: Free-text product problems
+            frameworks: Framework per text (None entries auto-select)
+        """
+        problem_texts = list(problem_texts)
+        if frameworks is None:
+            frameworks = [None] * len(problem_texts)
+
+        # 1️⃣ Problem Mapping (+ 3️⃣ framework selection, which needs the type)
+        templates = self.problem_mapper.map_many(problem_texts)
+        keys = []
+        first_text = {}
+
+        for problem_text, template, framework in zip(problem_texts, templates, frameworks):
+            normalized = normalize_problem_text(problem_text)
+            mapped_type = template["problem_type"]
+            problem_type = mapped_type
+            if problem_type == "general":
+                problem_type = infer_problem_type_from_text(normalized)
+
+            if framework is None:
+                framework = self.framework_selector.select(
+                    problem_type=problem_type,
+                    summary=normalized
+                )
+
+            key = (mapped_type, problem_type, framework)
+            keys.append(key)
+            first_text.setdefault(key, (problem_text, template))
+
+        unique = list(first_text)
+
+        # 2️⃣ Feature Generation
+        feature_lists = self.feature_generator.generate_many(
+            (problem_type, template.get("summary", problem_text))
+            for (_, problem_type, _), (problem_text, template) in zip(unique, first_text.values())
+        )
+
+        # 4️⃣ Prioritization
+        scored_lists = self.strategy_resolver.resolve_many(
+            (framework, list(features))
+            for (_, _, framework), features in zip(unique, feature_lists)
+        )
+
+        # 5️⃣ Roadmap (one generate_many() call per framework)
+        roadmaps = {}
+        for framework in dict.fromkeys(key[2] for key in unique):
+            indices = [i for i, key in enumerate(unique) if key[2] == framework]
+            generated = self.roadmap_generator.generate_many(
+                [scored_lists[i] for i in indices], frameworks=(framework,)
+            )
+            for i, by_framework in zip(indices, generated):
+                roadmaps[i] = by_framework[framework]
+
+        # 6️⃣ Judgment
+        shared = {}
+        for i, key in enumerate(unique):
+            problem_text, template = first_text[key]
+            problem_data = {
+                name: list(value) if isinstance(value, tuple) else value
+                for name, value in template.items()
+            }
+            problem_data["raw_signal"] = problem_text.strip()
+            problem_data = adjust_problem_insight(problem_data, key[2])
+
+            shared[key] = self._result(
+                problem_data, key[1], list(feature_lists[i]), key[2], scored_lists[i], roadmaps[i]
+            )
+
+        results = []
+        for problem_text, key in zip(problem_texts, keys):
+            result = shared[key]
+            if result.problem["raw_signal"] != problem_text.strip():
+                result = _with_raw_signal(result, problem_text)
+            results.append(result)
+
+        return results
+
+    def _result(
+        self,
+        problem_data: Dict,
+        problem_type: str,
+        features: List[str],
+        framework: str,
+        scored_features: List[ScoredFeature],
+        roadmap: Dict[str, List[str]],
+    ) -> AnalysisResult:
+        problem_summary = problem_data.get("summary", problem_data["raw_signal"])
+        constraints = problem_data.get("constraints", DEFAULT_CONSTRAINTS)
+
+        narrator = self.narrator
+        judgment = self.judgment_engine.generate(
+            problem=problem_data.get("core_problem", problem_summary),
+            constraints=constraints,
+            prioritized_features=scored_features,
+            roadmap=roadmap
+        )
+
+        return AnalysisResult(
+            problem=problem_data,
+            problem_type=problem_type,
+            features=features,
+            framework=framework,
+            framework_explanation=self.framework_explainer.explain(framework, {}),
+            prioritization=scored_features,
+            roadmap=roadmap,
+            reasoning={
+                "framework": _safe_call(narrator.explain_framework_choice, framework, problem_type),
+                "prioritization": _safe_call(narrator.explain_prioritization, scored_features, problem_type),
+                "roadmap": _safe_call(narrator.explain_roadmap, problem_type),
+                "tradeoffs": _safe_call(narrator.explain_tradeoffs, problem_type),
+                "metrics": _safe_call(narrator.explain_success_metrics, problem_type),
+            },
+            judgment=judgment,
+        )
+
+
+def _with_raw_signal(result: AnalysisResult, problem_text: str) -> AnalysisResult:
+    return AnalysisResult(
+        problem={**result.problem, "raw_signal": problem_text.strip()},
+        problem_type=result.problem_type,
+        features=result.features,
+        framework=result.framework,
+        framework_explanation=result.framework_explanation,
+        prioritization=result.prioritization,
+        roadmap=result.roadmap,
+        reasoning=result.reasoning,
+        judgment=result.judgment,
+    )
+
+
+@lru_cache(maxsize=None)
+def default_pipeline() -> AnalysisPipeline:
+    return AnalysisPipeline()
+
+
+def analyze(problem_text: str, framework: Optional[str] = None) -> AnalysisResult:
+    """
+    Analyze one product problem with the shared default pipeline.
+    """
+    return default_pipeline().analyze(problem_text, framework)
+
+
+def analyze_many(
+    problem_texts: Iterable[str],
+    frameworks: Optional[Sequence[Optional[str]]] = None,
+) -> List[AnalysisResult]:
+    """
+    Analyze many product problems with the shared default pipeline.
+    """
+    return default_pipeline().analyze_many(problem_texts, frameworks)
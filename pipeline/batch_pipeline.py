@@ -0,0 +1,148 @@
+import json
+from typing import Dict, Iterable, List, TextIO, Union
+
+from nlp.text_cleaner import TextCleaner
+from nlp.sentiment import SentimentAnalyzer
+from nlp.clustering import ProblemClusterer
+from product.problem_mapper import ProblemMapper
+from product.feature_generator import FeatureGenerator
+from product.strategy_resolver import StrategyResolver
+from roadmap.roadmap_generator import RoadmapGenerator
+
+
+class BatchPipeline:
+    """
+    Runs bulk user feedback through the full PM-GPT pipeline:
+
+        TextCleaner → SentimentAnalyzer → ProblemClusterer
+        → ProblemMapper → FeatureGenerator → StrategyResolver
+        → RoadmapGenerator
+
+    Feedback is processed one chunk at a time and every cluster result is
+    written out as a JSON line as soon as its chunk finishes, so memory use
+    is bounded by the chunk size rather than the input size.
+
+    With `incremental=True` one online clusterer is shared by every chunk,
+    so cluster ids are stable across the whole run instead of per chunk.
+    Feedback the online clusterer holds back is flushed at end of input.
+    """
+
+    def __init__(
+        self,
+        num_clusters: Union[int, str] = 3,
+        framework: str = "RICE",
+        sample_size: int = 3,
+        incremental: bool = False,
+    ):
+        self.num_clusters = num_clusters
+        self.framework = framework
+        self.sample_size = sample_size
+        self.online_clusterer = (
+            ProblemClusterer(num_clusters=num_clusters) if incremental else None
+        )
+
+        self.cleaner = TextCleaner()
+        self.sentiment_analyzer = SentimentAnalyzer()
+        self.problem_mapper = ProblemMapper()
+        self.feature_generator = FeatureGenerator()
+        self.strategy_resolver = StrategyResolver()
+        self.roadmap_generator = RoadmapGenerator()
+
+    def run(self, chunks: Iterable[List[str]], out: TextIO) -> Dict[str, int]:
+        """
+        Process feedback chunks and stream JSON lines to `out`.
+
+        Returns:
+            dict: Totals for rows, chunks and clusters written
+        """
+        totals = {"rows": 0, "chunks": 0, "clusters": 0}
+        chunk_id = 0
+
+        for chunk_id, texts in enumerate(chunks):
+            self._write(self.process_chunk(chunk_id, texts), out, totals)
+            totals["rows"] += len(texts)
+            totals["chunks"] += 1
+
+        if self.online_clusterer is not None:
+            # Held-back feedback belongs to the last chunk read
+            self._write(self.process_chunk(chunk_id, [], final=True), out, totals)
+
+        return totals
+
+    @staticmethod
+    def _write(records: List[Dict], out: TextIO, totals: Dict[str, int]) -> None:
+        for record in records:
+            out.write(json.dumps(record, ensure_ascii=False) + "\n")
+            totals["clusters"] += 1
+
+        out.flush()
+
+    def process_chunk(self, chunk_id: int, texts: List[str], final: bool = False) -> List[Dict]:
+        """
+        Run one chunk of raw feedback through every pipeline stage.
+
+        In incremental mode the clusters returned may include feedback held
+        back from earlier chunks; `final=True` flushes whatever is left.
+        """
+        cleaned = [c for c in self.cleaner.clean_batch(texts) if c]
+        if not cleaned and not final:
+            return []
+
+        clusters = self._cluster(cleaned, final)
+        if not clusters:
+            return []
+
+        unique = list(dict.fromkeys(item for items in clusters.values() for item in items))
+        compound = self.sentiment_analyzer.analyze_many(unique)["compound"]
+        sentiment = dict(zip(unique, compound.tolist()))
+
+        records = []
+        for label, items in clusters.items():
+            compounds = [sentiment[item] for item in items]
+
+            problem = self.problem_mapper.map(" ".join(items))
+            problem_type = problem["problem_type"]
+
+            features = self.feature_generator.generate(
+                problem_type=problem_type,
+                summary=problem["summary"]
+            )
+            prioritization = self.strategy_resolver.resolve(self.framework, features)
+            roadmap = self.roadmap_generator.generate(
+                prioritization,
+                framework=self.framework
+            )
+
+            records.append({
+                "chunk": chunk_id,
+                "cluster": int(label),
+                "size": len(items),
+                "avg_sentiment": round(sum(compounds) / len(compounds), 4),
+                "negative_share": round(
+                    sum(1 for c in compounds if c < -0.05) / len(compounds), 4
+                ),
+                "problem_type": problem_type,
+                "core_problem": problem["core_problem"],
+                "framework": self.framework,
+                "features": features,
+                "prioritization": prioritization,
+                "roadmap": roadmap,
+                "examples": items[:self.sample_size],
+            })
+
+        return records
+
+    def _cluster(self, texts: List[str], final: bool = False) -> Dict:
+        if self.online_clusterer is not None:
+            return self.online_clusterer.partial_cluster(texts, final=final)
+
+        if not texts:
+            return {}
+
+        clusterer = ProblemClusterer(num_clusters=self.num_clusters)
+
+        try:
+            return clusterer.cluster(texts)
+        except ValueError:
+            # e.g. every text reduced to stop words → empty vocabulary
+            return {0: texts}
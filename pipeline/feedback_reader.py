@@ -0,0 +1,129 @@
+import csv
+import json
+import os
+from typing import Iterator, List, Optional
+
+
+class FeedbackReader:
+    """
+    Streams raw feedback text out of CSV, JSONL or plain text files (one
+    feedback per line) in bounded chunks.
+
+    Rows are read lazily, so only one chunk of feedback is held in memory
+    at a time regardless of file size. Blank rows are skipped; a JSONL line
+    that is not a JSON object or string raises ValueError with its line
+    number.
+    """
+
+    # Column / key names tried (in order) when no text field is given
+    TEXT_FIELDS = ["text", "review", "feedback", "comment", "content", "body"]
+
+    def __init__(self, path: str, text_field: Optional[str] = None, chunk_size: int = 1000):
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be a positive integer")
+
+        self.path = path
+        self.text_field = text_field
+        self.chunk_size = chunk_size
+
+    # --------------------------------------------------
+    # ROW STREAMS
+    # --------------------------------------------------
+    def texts(self) -> Iterator[str]:
+        """
+        Yield one non-empty feedback string per row.
+        """
+        ext = os.path.splitext(self.path)[1].lower()
+
+        if ext in (".jsonl", ".ndjson"):
+            rows = self._read_jsonl()
+        elif ext in (".csv", ".tsv"):
+            rows = self._read_csv(delimiter="\t" if ext == ".tsv" else ",")
+        elif ext == ".txt":
+            rows = self._read_lines()
+        else:
+            raise ValueError(f"Unsupported feedback file type: {self.path}")
+
+        for text in rows:
+            if isinstance(text, str) and text.strip():
+                yield text
+
+    def chunks(self) -> Iterator[List[str]]:
+        """
+        Yield lists of at most `chunk_size` feedback strings.
+        """
+        chunk = []
+
+        for text in self.texts():
+            chunk.append(text)
+
+            if len(chunk) >= self.chunk_size:
+                yield chunk
+                chunk = []
+
+        if chunk:
+            yield chunk
+
+    # --------------------------------------------------
+    # FORMAT READERS
+    # --------------------------------------------------
+    def _read_csv(self, delimiter: str) -> Iterator[str]:
+        with open(self.path, newline="", encoding="utf-8") as f:
+            reader = csv.DictReader(f, delimiter=delimiter)
+
+            if not reader.fieldnames:
+                return
+
+            field = self._pick_field(reader.fieldnames)
+
+            for row in reader:
+                yield row.get(field)
+
+    def _read_jsonl(self) -> Iterator[str]:
+        field = self.text_field
+
+        with open(self.path, encoding="utf-8") as f:
+            for line_no, line in enumerate(f, start=1):
+                line = line.strip()
+                if not line:
+                    continue
+
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError as e:
+                    raise ValueError(f"{self.path}:{line_no}: invalid JSON ({e.msg})") from None
+
+                if isinstance(record, str):
+                    yield record
+                    continue
+
+                if not isinstance(record, dict):
+                    raise ValueError(
+                        f"{self.path}:{line_no}: expected a JSON object or string"
+                    )
+
+                if field is None:
+                    field = self._pick_field(list(record.keys()))
+
+                yield record.get(field)
+
+    def _read_lines(self) -> Iterator[str]:
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                yield line.rstrip("\r\n")
+
+    def _pick_field(self, fields: List[str]) -> str:
+        if self.text_field:
+            if self.text_field not in fields:
+                raise ValueError(
+                    f"Text field '{self.text_field}' not found in {self.path}"
+                )
+            return self.text_field
+
+        lowered = {name.lower(): name for name in fields}
+        for candidate in self.TEXT_FIELDS:
+            if candidate in lowered:
+                return lowered[candidate]
+
+        # Fall back to the first column
+        return fields[0]
@@ -1,169 +1,166 @@
-from typing import List
+import json
+import os
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Iterable, List, Optional, Tuple
+
+from product.keyword_matcher import KeywordMatcher
+
+
+DEFAULT_CATALOG_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "data", "feature_catalog.json"
+)
+
+
+# Funnel stage inference (category order is priority)
+FUNNEL_MATCHER = KeywordMatcher({
+    "activation": ["first value", "activation", "signup", "onboarding", "kyc"],
+    "engagement": ["engagement", "repeat", "habit", "usage"],
+    "monetization": [
+        "pricing", "upgrade", "monetization", "conversion",
+        "trial", "free trial", "trial ends", "paywall"
+    ],
+    "reliability": ["latency", "reliability", "downtime", "failure"],
+})
+
+# Risk inference (category order is priority)
+RISK_MATCHER = KeywordMatcher({
+    "compliance": ["compliance", "regulatory", "kyc", "audit"],
+    "revenue": [
+        "revenue", "pricing", "upgrade", "churn",
+        "trial", "trial ends", "not converting"
+    ],
+    "trust": ["trust", "confidence", "credibility"],
+    "cost": ["support", "cost", "operations"],
+})
+
+
+class FeatureCatalog:
+    """
+    Precomputed, read-only feature catalog.
+
+    Loaded from a JSON data file (see product/data/feature_catalog.json) so
+    teams can extend it without code changes. Every
+    (problem_type, funnel, risk) combination is resolved once at load time
+    into a shared tuple, so lookups are a single dict access.
+
+    File format:
+        aliases:  real-world label -> canonical problem type
+        features: problem type -> ordered rules; the first rule whose
+                  optional "when" ({"funnel": ..., "risk": ...}) matches wins
+        default:  features for unknown / ambiguous problem types
+
+    Raises ValueError for a catalog missing "default" or with a rule
+    without a "features" list.
+    """
+
+    FUNNELS = FUNNEL_MATCHER.categories + ("general",)
+    RISKS = RISK_MATCHER.categories + ("speed",)
+
+    def __init__(self, data: dict):
+        if not isinstance(data, dict) or not isinstance(data.get("default"), list):
+            raise ValueError("Feature catalog needs a 'default' feature list")
+        for problem_type, rules in data.get("features", {}).items():
+            if not all(isinstance(rule, dict) and isinstance(rule.get("features"), list) for rule in rules):
+                raise ValueError(f"Feature catalog rules for {problem_type!r} need a 'features' list")
+
+        self.aliases = MappingProxyType(dict(data.get("aliases", {})))
+        self.default = tuple(data["default"])
+
+        index = {}
+        for problem_type, rules in data.get("features", {}).items():
+            for funnel in self.FUNNELS:
+                for risk in self.RISKS:
+                    context = {"funnel": funnel, "risk": risk}
+                    for rule in rules:
+                        when = rule.get("when", {})
+                        if all(context.get(k) == v for k, v in when.items()):
+                            index[(problem_type, funnel, risk)] = tuple(rule["features"])
+                            break
+
+        # Identical lists share one tuple object
+        interned = {}
+        self.index = MappingProxyType({
+            key: interned.setdefault(features, features)
+            for key, features in index.items()
+        })
+
+        # Every distinct feature the catalog can emit (for precomputed indexes)
+        self.features = tuple(dict.fromkeys(
+            feature
+            for features in (self.default, *interned)
+            for feature in features
+        ))
+
+    @classmethod
+    def from_file(cls, path: str) -> "FeatureCatalog":
+        with open(path, encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def canonical_type(self, problem_type: str) -> str:
+        problem_type = (problem_type or "").lower().strip()
+        return self.aliases.get(problem_type, problem_type)
+
+    def lookup(self, problem_type: str, funnel: str, risk: str) -> Tuple[str, ...]:
+        return self.index.get(
+            (self.canonical_type(problem_type), funnel, risk),
+            self.default
+        )
+
+
+def load_catalog(path: str = DEFAULT_CATALOG_PATH) -> FeatureCatalog:
+    """
+    Parsed catalog, cached per file (however the path is spelled).
+    """
+    return _load_catalog(os.path.abspath(path))
+
+
+@lru_cache(maxsize=None)
+def _load_catalog(path: str) -> FeatureCatalog:
+    return FeatureCatalog.from_file(path)
+
+
+@lru_cache(maxsize=4096)
+def derive_context(summary: str) -> Tuple[str, str]:
+    """
+    Funnel stage and dominant risk for a summary (rule-based, cached:
+    summaries usually come from ProblemMapper's fixed templates).
+    """
+    text = (summary or "").lower()
+
+    return (
+        FUNNEL_MATCHER.first(text, default="general"),
+        RISK_MATCHER.first(text, default="speed"),
+    )
 
 
 class FeatureGenerator:
     """
-    Phase 4 – Context-Aware Feature Generation (v4.1)
+    Phase 4 – Context-Aware Feature Generation (v4.2)
 
     - Generates DIFFERENT features based on problem_type + summary
     - Uses PM mental models:
         • Funnel stage
         • Dominant business risk
     - Normalizes inputs to avoid silent fallbacks
+    - Features come from the data-driven FeatureCatalog
     """
 
+    def __init__(self, catalog_path: Optional[str] = None):
+        self.catalog = load_catalog(catalog_path or DEFAULT_CATALOG_PATH)
+
     def generate(self, problem_type: str, summary: str) -> List[str]:
-        # --------------------------------------------------
-        # NORMALIZE INPUTS (CRITICAL FIX)
-        # --------------------------------------------------
-        problem_type = (problem_type or "").lower().strip()
-        text = (summary or "").lower()
-
-        # Map real-world labels to canonical problem types
-        PROBLEM_TYPE_ALIASES = {
-            "activation": "onboarding",
-            "signup": "onboarding",
-            "kyc": "onboarding",
-            "churn": "retention",
-            "engagement": "retention",
-            "reliability": "performance",
-            "stability": "performance",
-            "latency": "performance",
-            "execution": "delivery",
-            "shipping": "delivery",
-            "nps": "satisfaction",
-            "feedback": "satisfaction",
-            "growth_rate": "growth",
-            "conversion": "growth",
-        }
-
-        problem_type = PROBLEM_TYPE_ALIASES.get(problem_type, problem_type)
-
-        # --------------------------------------------------
-        # DERIVED PM CONTEXT (RULE-BASED, LIGHTWEIGHT)
-        # --------------------------------------------------
-
-        # Funnel stage inference
-        if any(k in text for k in ["first value", "activation", "signup", "onboarding", "kyc"]):
-            funnel = "activation"
-        elif any(k in text for k in ["engagement", "repeat", "habit", "usage"]):
-            funnel = "engagement"
-        elif any(k in text for k in [
-            "pricing", "upgrade", "monetization", "conversion",
-            "trial", "free trial", "trial ends", "paywall"
-        ]):
-            funnel = "monetization"
-
-        elif any(k in text for k in ["latency", "reliability", "downtime", "failure"]):
-            funnel = "reliability"
-        else:
-            funnel = "general"
-
-        # Risk inference
-        if any(k in text for k in ["compliance", "regulatory", "kyc", "audit"]):
-            risk = "compliance"
-        elif any(k in text for k in [
-            "revenue", "pricing", "upgrade", "churn",
-            "trial", "trial ends", "not converting"
-        ]):
-            risk = "revenue"
-
-        elif any(k in text for k in ["trust", "confidence", "credibility"]):
-            risk = "trust"
-        elif any(k in text for k in ["support", "cost", "operations"]):
-            risk = "cost"
-        else:
-            risk = "speed"
-
-        # --------------------------------------------------
-        # FEATURE GENERATION (PM-REALISTIC)
-        # --------------------------------------------------
-
-        # -------- ONBOARDING --------
-        if problem_type == "onboarding":
-
-            if risk == "compliance":
-                return [
-                    "Introduce progressive disclosure for compliance steps instead of upfront blocking",
-                    "Add real-time validation with explicit failure reasons during document upload",
-                    "Provide guided retry paths instead of forcing onboarding restarts",
-                    "Display verification status clearly with expected resolution timelines",
-                    "Reduce non-essential data collection before first compliance checkpoint",
-                ]
-
-            return [
-                "Reduce non-essential fields before the user reaches first value",
-                "Introduce a progressive onboarding flow that unlocks steps only when required",
-                "Display a clear progress indicator tied to first-value completion",
-                "Add inline microcopy explaining why each required step exists",
-                "Surface a first-success confirmation moment to reinforce completion",
-            ]
-
-        # -------- RETENTION --------
-        if problem_type == "retention":
-
-            if funnel == "monetization":
-                return [
-                    "Clarify feature gating with in-context previews of locked value",
-                    "Surface upgrade prompts only after users experience core value",
-                    "Align pricing tiers with observed usage patterns",
-                    "Reduce surprise paywalls by signaling limitations earlier",
-                    "Introduce time-bound upgrade nudges based on value realization",
-                ]
-
-            return [
-                "Introduce early-warning signals to detect disengaging users",
-                "Trigger re-engagement nudges based on drop-off behavior patterns",
-                "Add habit-forming reminders tied to core value moments",
-                "Personalize workflows based on prior usage behavior",
-                "Create lightweight win-back flows for inactive users",
-                "Replace generic notifications with lifecycle-based messaging",
-            ]
-
-        # -------- PERFORMANCE --------
-        if problem_type == "performance":
-            return [
-                "Instrument latency and failure metrics across critical user flows",
-                "Introduce graceful degradation when non-critical services fail",
-                "Add user-visible system status indicators during outages",
-                "Prioritize reliability improvements over feature expansion",
-                "Create automated alerts tied to user-impact thresholds",
-            ]
-
-        # -------- DELIVERY --------
-        if problem_type == "delivery":
-            return [
-                "Introduce a single-owner model for roadmap commitments",
-                "Establish must-ship vs nice-to-have delivery tiers",
-                "Limit work-in-progress to reduce context switching",
-                "Create quarterly delivery confidence checkpoints",
-                "Align roadmap planning with engineering capacity forecasts",
-            ]
-
-        # -------- SATISFACTION --------
-        if problem_type == "satisfaction":
-            return [
-                "Collect contextual feedback immediately after key interactions",
-                "Personalize workflows based on user preferences",
-                "Reduce friction in commonly repeated actions",
-                "Introduce delight moments in high-frequency flows",
-                "Close the feedback loop by visibly acting on user input",
-            ]
-
-        # -------- GROWTH --------
-        if problem_type == "growth":
-            return [
-                "Optimize conversion points by reducing cognitive load",
-                "Introduce referral or viral loops tied to core value moments",
-                "Experiment with pricing or packaging for expansion revenue",
-                "Improve activation-to-conversion handoff",
-                "Instrument growth experiments with clear success metrics",
-            ]
-
-        # -------- SAFE DEFAULT (ONLY WHEN INPUT IS TRULY AMBIGUOUS) --------
-        return [
-            "Clarify the primary user value being delivered",
-            "Reduce friction in the most frequently used workflows",
-            "Introduce feedback loops to validate user impact",
-            "Prioritize changes tied to measurable outcomes",
-        ]
+        return list(self.lookup(problem_type, summary))
+
+    def lookup(self, problem_type: str, summary: str) -> Tuple[str, ...]:
+        """
+        Same as generate(), but returns the catalog's shared tuple.
+        """
+        funnel, risk = derive_context(summary or "")
+        return self.catalog.lookup(problem_type, funnel, risk)
+
+    def generate_many(self, items: Iterable[Tuple[str, str]]) -> List[Tuple[str, ...]]:
+        """
+        Features for many (problem_type, summary) pairs; results are shared tuples.
+        """
+        return [self.lookup(problem_type, summary) for problem_type, summary in items]
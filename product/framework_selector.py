@@ -1,3 +1,34 @@
+from product.keyword_matcher import KeywordMatcher
+
+
+SIGNAL_MATCHER = KeywordMatcher({
+    # ICE → experimentation & uncertainty
+    "experimentation": [
+        "experiment", "test", "mvp", "hypothesis",
+        "validation", "assumption", "uncertain"
+    ],
+    # Kano → user emotion & expectations
+    "emotion": [
+        "delight", "frustration", "user satisfaction",
+        "expectation", "pain point", "complaint"
+    ],
+    # MoSCoW → execution & delivery
+    "delivery": [
+        "must have", "should have", "could have",
+        "deadline", "sprint", "release", "timebox"
+    ],
+    # RICE → explicit comparative prioritization
+    "comparative": [
+        "compare", "trade-off", "which should we build",
+        "decide between", "rank", "prioritize between"
+    ],
+    "impact": ["impact"],
+    "effort": ["effort"],
+    # Generic prioritization (weak signal)
+    "prioritization": ["prioritiz"],
+})
+
+
 class FrameworkSelector:
     """
     Enhanced Framework Selector (v4.3 – Balanced)
@@ -32,56 +63,36 @@ class FrameworkSelector:
         elif problem_type in ["growth", "acquisition", "revenue"]:
             framework_scores["RICE"] += 2
 
+        signals = SIGNAL_MATCHER.hits(text)
+
         # --------------------------------------------------
         # ICE → experimentation & uncertainty
         # --------------------------------------------------
-        if any(word in text for word in [
-            "experiment", "test", "mvp", "hypothesis",
-            "validation", "assumption", "uncertain"
-        ]):
+        if "experimentation" in signals:
             framework_scores["ICE"] += 2
 
         # --------------------------------------------------
         # Kano → user emotion & expectations
         # --------------------------------------------------
-        if any(word in text for word in [
-            "delight", "frustration", "user satisfaction",
-            "expectation", "pain point", "complaint"
-        ]):
+        if "emotion" in signals:
             framework_scores["Kano"] += 2
 
         # --------------------------------------------------
         # MoSCoW → execution & delivery
         # --------------------------------------------------
-        if any(word in text for word in [
-            "must have", "should have", "could have",
-            "deadline", "sprint", "release", "timebox"
-        ]):
+        if "delivery" in signals:
             framework_scores["MoSCoW"] += 2
 
         # --------------------------------------------------
         # RICE → explicit comparative prioritization ONLY
         # --------------------------------------------------
-        comparative_indicators = [
-            "compare", "trade-off", "which should we build",
-            "decide between", "rank", "prioritize between"
-        ]
-
-        scoring_indicators = [
-            "reach", "impact", "confidence", "effort",
-            "score", "scoring", "weighted"
-        ]
-
-        if (
-            any(word in text for word in comparative_indicators)
-            or all(word in text for word in ["impact", "effort"])
-        ):
+        if "comparative" in signals or {"impact", "effort"} <= signals:
             framework_scores["RICE"] += 3
 
         # --------------------------------------------------
         # Generic prioritization (weak signal)
         # --------------------------------------------------
-        if "prioritiz" in text:
+        if "prioritization" in signals:
             framework_scores["RICE"] += 1
             framework_scores["ICE"] += 1
 
@@ -0,0 +1,223 @@
+from bisect import bisect_left, insort
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from product.prioritization_strategy import ScoredFeature
+from product.rice_scoring import RiceScorer
+
+
+class RankChange(NamedTuple):
+    """
+    Outcome of one insert / update / remove.
+
+    `feature` moved from `old_rank` to `new_rank` (None = not ranked).
+    Every other feature now ranked in [shift_start, shift_stop) moved by
+    `shift` (+1 or -1); nothing else changed.
+    """
+    feature: str
+    old_rank: Optional[int]
+    new_rank: Optional[int]
+    shift_start: int
+    shift_stop: int
+    shift: int
+
+
+class IncrementalRanking:
+    """
+    Ranked backlog that re-prioritizes one feature at a time.
+
+    Features are kept ordered by score (highest first, ties in insertion
+    order like a stable sort) in a bucketed sorted list; a Fenwick tree over
+    the bucket sizes turns a bucket index into a rank. Insert, update,
+    remove and rank_of cost O(log n) plus a small bounded list move
+    (amortized: a bucket split or removal rebuilds the tree), instead of
+    rescoring and re-sorting the whole backlog after every estimate tweak.
+    """
+
+    def __init__(self, scored_features: Iterable[ScoredFeature] = (), bucket_size: int = 256):
+        self.bucket_size = bucket_size
+        self._buckets: List[List[Tuple]] = []
+        self._maxes: List[Tuple] = []
+        self._tree: List[int] = [0]  # Fenwick tree of bucket sizes, 1-based
+        self._keys: Dict[str, Tuple] = {}
+        self._next_seq = 0
+        self._scorer = RiceScorer()
+
+        keys = []
+        for item in scored_features:
+            if item["feature"] in self._keys:
+                raise ValueError(f"Feature ranked twice: {item['feature']}")
+
+            key = (-float(item["score"]), self._next_seq, item["feature"])
+            self._keys[item["feature"]] = key
+            self._next_seq += 1
+            keys.append(key)
+
+        keys.sort()
+        self._buckets = [
+            keys[i:i + bucket_size] for i in range(0, len(keys), bucket_size)
+        ]
+        self._maxes = [bucket[-1] for bucket in self._buckets]
+        self._rebuild_tree()
+
+    # --------------------------------------------------
+    # QUERIES
+    # --------------------------------------------------
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, feature: str) -> bool:
+        return feature in self._keys
+
+    def rank_of(self, feature: str) -> int:
+        """
+        0-based rank of a feature (0 = top priority).
+        """
+        return self._position(self._keys[feature])
+
+    def score_of(self, feature: str) -> float:
+        return -self._keys[feature][0]
+
+    def ranked(self, start: int = 0, stop: Optional[int] = None) -> List[ScoredFeature]:
+        """
+        Ranked rows, optionally only ranks [start, stop).
+        """
+        rows = []
+        stop = len(self) if stop is None else min(stop, len(self))
+        offset = 0
+
+        for bucket in self._buckets:
+            if offset >= stop:
+                break
+            if offset + len(bucket) > start:
+                for key in bucket[max(0, start - offset):stop - offset]:
+                    rows.append({"feature": key[2], "score": -key[0]})
+            offset += len(bucket)
+
+        return rows
+
+    # --------------------------------------------------
+    # MUTATIONS
+    # --------------------------------------------------
+    def insert(self, feature: str, score: float) -> RankChange:
+        if feature in self._keys:
+            raise ValueError(f"Feature already ranked: {feature}")
+
+        key = (-float(score), self._next_seq, feature)
+        self._next_seq += 1
+
+        new_rank = self._add(key)
+        return RankChange(feature, None, new_rank, new_rank + 1, len(self), 1)
+
+    def remove(self, feature: str) -> RankChange:
+        old_rank = self._discard(self._keys.pop(feature))
+        return RankChange(feature, old_rank, None, old_rank, len(self), -1)
+
+    def update(self, feature: str, score: float) -> RankChange:
+        """
+        Change one feature's score, keeping its original tie-break order.
+        """
+        old_key = self._keys[feature]
+        old_rank = self._discard(old_key)
+        new_rank = self._add((-float(score), old_key[1], feature))
+
+        if new_rank < old_rank:
+            # Moved up: the features it overtook drop one rank
+            return RankChange(feature, old_rank, new_rank, new_rank + 1, old_rank + 1, 1)
+
+        # Moved down (or stayed): the features it fell behind rise one rank
+        return RankChange(feature, old_rank, new_rank, old_rank, new_rank, -1)
+
+    def update_estimates(self, feature: str, metrics: dict) -> RankChange:
+        """
+        Rescore one feature from RICE estimates (reach, impact, confidence, effort).
+        """
+        return self.update(feature, self._scorer.score(feature, metrics))
+
+    # --------------------------------------------------
+    # BUCKETED SORTED LIST
+    # --------------------------------------------------
+    def _locate(self, key: Tuple) -> Tuple[int, int]:
+        # (bucket index, index in bucket) of a stored key
+        i = bisect_left(self._maxes, key)
+        if i == len(self._buckets):
+            raise KeyError(key[2])
+
+        bucket = self._buckets[i]
+        j = bisect_left(bucket, key)
+
+        if j == len(bucket) or bucket[j] != key:
+            raise KeyError(key[2])
+
+        return i, j
+
+    def _position(self, key: Tuple) -> int:
+        i, j = self._locate(key)
+        return self._offset(i) + j
+
+    def _add(self, key: Tuple) -> int:
+        self._keys[key[2]] = key
+
+        if not self._buckets:
+            self._buckets.append([key])
+            self._maxes.append(key)
+            self._rebuild_tree()
+            return 0
+
+        i = min(bisect_left(self._maxes, key), len(self._buckets) - 1)
+        bucket = self._buckets[i]
+        insort(bucket, key)
+        self._maxes[i] = bucket[-1]
+        self._resize(i, 1)
+
+        position = self._offset(i) + bisect_left(bucket, key)
+
+        if len(bucket) > 2 * self.bucket_size:
+            half = len(bucket) // 2
+            self._buckets[i:i + 1] = [bucket[:half], bucket[half:]]
+            self._maxes[i:i + 1] = [bucket[half - 1], bucket[-1]]
+            self._rebuild_tree()
+
+        return position
+
+    def _discard(self, key: Tuple) -> int:
+        i, j = self._locate(key)
+        position = self._offset(i) + j
+
+        bucket = self._buckets[i]
+        del bucket[j]
+
+        if bucket:
+            self._maxes[i] = bucket[-1]
+            self._resize(i, -1)
+        else:
+            del self._buckets[i]
+            del self._maxes[i]
+            self._rebuild_tree()
+
+        return position
+
+    # --------------------------------------------------
+    # FENWICK TREE OF BUCKET SIZES
+    # --------------------------------------------------
+    def _rebuild_tree(self) -> None:
+        tree = [0] * (len(self._buckets) + 1)
+        for i, bucket in enumerate(self._buckets, start=1):
+            tree[i] += len(bucket)
+            parent = i + (i & -i)
+            if parent < len(tree):
+                tree[parent] += tree[i]
+        self._tree = tree
+
+    def _resize(self, i: int, delta: int) -> None:
+        i += 1
+        while i < len(self._tree):
+            self._tree[i] += delta
+            i += i & -i
+
+    def _offset(self, i: int) -> int:
+        # Number of features in buckets[:i]
+        total = 0
+        while i:
+            total += self._tree[i]
+            i -= i & -i
+        return total
@@ -0,0 +1,76 @@
+from typing import Dict, FrozenSet, Iterable, Optional
+
+try:
+    import ahocorasick  # pyahocorasick (optional)
+except ImportError:
+    ahocorasick = None
+
+
+class KeywordMatcher:
+    """
+    Compiled multi-keyword matcher shared by the rule-based engines.
+
+    Built once from {category: keywords}. A single scan of the text returns
+    every category with at least one keyword in it, using the same
+    substring semantics as `any(k in text for k in keywords)`.
+
+    With pyahocorasick installed the scan is one Aho-Corasick pass, linear
+    in text length whatever the keyword count. Without it, each distinct
+    keyword gets one C-level substring search. A pure-Python automaton
+    would be slower than that in CPython.
+    """
+
+    def __init__(self, categories: Dict[str, Iterable[str]]):
+        self.categories = tuple(categories)
+
+        keyword_categories = {}
+        for category, keywords in categories.items():
+            for keyword in keywords:
+                keyword_categories.setdefault(keyword.lower(), set()).add(category)
+
+        self._keywords = tuple(
+            (keyword, frozenset(cats)) for keyword, cats in keyword_categories.items()
+        )
+
+        self._automaton = None
+        if ahocorasick is not None and self._keywords:
+            self._automaton = ahocorasick.Automaton()
+            for keyword, cats in self._keywords:
+                self._automaton.add_word(keyword, cats)
+            self._automaton.make_automaton()
+
+    def hits(self, text: str) -> FrozenSet[str]:
+        """
+        Return every category with a keyword occurring in `text`.
+
+        Matching is case-sensitive on lowercased keywords, so callers pass
+        lowercased text (as the engines already do).
+        """
+        if not text:
+            return frozenset()
+
+        found = set()
+
+        if self._automaton is not None:
+            for _, cats in self._automaton.iter(text):
+                found |= cats
+            return frozenset(found)
+
+        for keyword, cats in self._keywords:
+            if not cats <= found and keyword in text:
+                found |= cats
+
+        return frozenset(found)
+
+    def first(self, text: str, default: Optional[str] = None) -> Optional[str]:
+        """
+        Return the first category (in declaration order) that matches,
+        mirroring an if / elif chain of `any(...)` checks.
+        """
+        found = self.hits(text)
+
+        for category in self.categories:
+            if category in found:
+                return category
+
+        return default
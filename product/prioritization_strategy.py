@@ -1,133 +1,318 @@
 # product/prioritization_strategy.py
 
-from typing import List, Dict
+from typing import Callable, Dict, List, Optional, Tuple, Type, TypedDict, Union
+import hashlib
+
+import numpy as np
+
+from product.keyword_matcher import KeywordMatcher
+
+
+class ScoredFeature(TypedDict):
+    """
+    Common result row for every strategy (numeric or categorical score).
+    """
+    feature: str
+    score: Union[float, str]
+
+
+# --------------------------------------------------
+# DETERMINISTIC ESTIMATES
+# --------------------------------------------------
+def feature_hashes(features: List[str], seed: int = 0) -> np.ndarray:
+    """
+    Stable 64-bit content hash per feature name (independent of list order).
+    """
+    salt = int(seed).to_bytes(16, "little", signed=True)
+
+    return np.fromiter(
+        (
+            int.from_bytes(
+                hashlib.blake2b(f.encode("utf-8"), digest_size=8, salt=salt).digest(),
+                "little"
+            )
+            for f in features
+        ),
+        dtype=np.uint64,
+        count=len(features)
+    )
+
+
+def hashed_randint(hashes: np.ndarray, stream: str, low: int, high: int) -> np.ndarray:
+    """
+    Vectorized, deterministic stand-in for random.randint(low, high):
+    one splitmix64 round over (feature hash XOR stream constant).
+    """
+    stream_key = int.from_bytes(
+        hashlib.blake2b(stream.encode("utf-8"), digest_size=8).digest(), "little"
+    )
+
+    with np.errstate(over="ignore"):
+        z = (hashes ^ np.uint64(stream_key)) + np.uint64(0x9E3779B97F4A7C15)
+        z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+        z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+        z = z ^ (z >> np.uint64(31))
+
+    return (low + (z % np.uint64(high - low + 1))).astype(np.int64)
+
+
+# --------------------------------------------------
+# REGISTRY
+# --------------------------------------------------
+_STRATEGIES: Dict[str, Type["BaseStrategy"]] = {}
+
+
+def register_strategy(name: str) -> Callable:
+    """
+    Class decorator adding a strategy to the registry (names are case-insensitive).
+    """
+    def decorator(cls):
+        cls.name = name.upper()
+        _STRATEGIES[cls.name] = cls
+        return cls
+
+    return decorator
+
+
+def get_strategy(name: str, seed: int = 0, default: Optional[str] = None) -> "BaseStrategy":
+    """
+    Instantiate a registered strategy, falling back to `default` if given.
+
+    Raises:
+        KeyError: If neither `name` nor `default` is registered
+    """
+    key = (name or "").upper()
+
+    if key not in _STRATEGIES and default is not None:
+        key = default.upper()
+
+    if key not in _STRATEGIES:
+        raise KeyError(f"Unknown prioritization strategy: {name}")
+
+    return _STRATEGIES[key](seed=seed)
+
+
+def available_strategies() -> List[str]:
+    return sorted(_STRATEGIES)
 
 
 class BaseStrategy:
-    def apply(self, features: List[str]) -> List[Dict]:
+    """
+    Contract shared by every prioritization strategy.
+
+    Subclasses implement apply_many(), which scores a whole feature list as
+    one float array. Categorical strategies also set `labels` (numeric
+    priority -> label). apply() and rank() turn those arrays into the
+    common ScoredFeature rows.
+    """
+
+    name = ""
+    labels: Optional[Dict[int, str]] = None
+    sort_by_score = True
+
+    def __init__(self, seed: int = 0):
+        self.seed = seed
+
+    def apply_many(self, features: List[str]) -> np.ndarray:
         raise NotImplementedError
 
+    def apply(self, features: List[str]) -> List[ScoredFeature]:
+        """
+        Score features, keeping input order.
+        """
+        return self._rows(features, self.apply_many(features), range(len(features)))
 
-class RICEStrategy(BaseStrategy):
+    def rank(self, features: List[str]) -> List[ScoredFeature]:
+        """
+        Score features and order them best-first (stable on ties).
+        """
+        scores = self.apply_many(features)
+
+        if self.sort_by_score:
+            order = np.argsort(-scores, kind="stable")
+        else:
+            order = range(len(features))
+
+        return self._rows(features, scores, order)
+
+    def _rows(self, features: List[str], scores: np.ndarray, order) -> List[ScoredFeature]:
+        if self.labels is not None:
+            labels = self.labels
+            return [{"feature": features[i], "score": labels[int(scores[i])]} for i in order]
+
+        return [{"feature": features[i], "score": float(scores[i])} for i in order]
+
+
+# --------------------------------------------------
+# FRAMEWORK STRATEGIES (used by StrategyResolver)
+# --------------------------------------------------
+class EstimatedStrategy(BaseStrategy):
     """
-    PM-grade RICE scoring with explicit assumptions.
-    Scores are intentionally bounded and explainable.
+    Numeric framework scored from content-hashed estimates.
+
+    Subclasses declare the estimate ranges (`bounds`, drawn inclusive),
+    the score formula (combine()) and the position bias. combine() is
+    written elementwise, so RoadmapSimulator can feed it arrays of
+    sampled estimates.
     """
 
-    def apply(self, features: List[str]) -> List[Dict]:
-        scored = []
+    bounds: Dict[str, Tuple[int, int]] = {}
 
-        for feature in features:
-            name = feature.lower()
+    def estimates(self, features: List[str]) -> Dict[str, np.ndarray]:
+        hashes = feature_hashes(features, self.seed)
 
-            # ---- Reach (how many users affected)
-            if "onboarding" in name or "kyc" in name:
-                reach = 5
-            else:
-                reach = 3
+        return {
+            name: hashed_randint(hashes, f"{self.stream}:{name}", low, high)
+            for name, (low, high) in self.bounds.items()
+        }
 
-            # ---- Impact (effect on first transaction completion)
-            if "retry" in name or "reduce" in name or "first" in name:
-                impact = 5
-            elif "guide" in name or "status" in name:
-                impact = 4
-            else:
-                impact = 3
+    @staticmethod
+    def combine(e: Dict[str, np.ndarray]) -> np.ndarray:
+        raise NotImplementedError
 
-            # ---- Confidence (how certain we are it will work)
-            if "explanation" in name or "status" in name:
-                confidence = 4
-            else:
-                confidence = 3
+    @staticmethod
+    def position_bias(n: int) -> np.ndarray:
+        return np.zeros(n)
 
-            # ---- Effort (engineering + compliance complexity)
-            if "redesign" in name:
-                effort = 5
-            elif "automated" in name:
-                effort = 4
-            else:
-                effort = 3
+    def apply_many(self, features: List[str]) -> np.ndarray:
+        base = np.round(self.combine(self.estimates(features)), 2)
+        return np.round(base + self.position_bias(len(features)), 2)
 
-            score = round((reach * impact * confidence) / effort, 2)
 
-            scored.append({
-                "feature": feature,
-                "score": score
-            })
+@register_strategy("RICE")
+class EstimatedRICEStrategy(EstimatedStrategy):
+    """
+    RICE — ROI-driven, score heavy.
+    Estimates are content-hashed per feature, so results are reproducible.
+    """
 
-        return scored
+    stream = "RICE"
+    bounds = {"reach": (3, 5), "impact": (3, 5), "confidence": (2, 5), "effort": (1, 4)}
 
+    @staticmethod
+    def combine(e: Dict[str, np.ndarray]) -> np.ndarray:
+        return e["reach"] * e["impact"] * e["confidence"] / e["effort"]
 
-class ICEStrategy(BaseStrategy):
+    @staticmethod
+    def position_bias(n: int) -> np.ndarray:
+        # 🔹 RICE bias: earlier features matter more for scale
+        return np.maximum(0, (n - np.arange(n)) * 0.15)
+
+
+@register_strategy("ICE")
+class EstimatedICEStrategy(EstimatedStrategy):
     """
-    Lightweight prioritization for fast decisions.
+    ICE — speed & learning first.
     """
 
-    def apply(self, features: List[str]) -> List[Dict]:
-        scored = []
+    stream = "ICE"
+    bounds = {"impact": (2, 5), "confidence": (3, 5), "effort": (1, 4)}
 
-        for feature in features:
-            name = feature.lower()
+    @staticmethod
+    def combine(e: Dict[str, np.ndarray]) -> np.ndarray:
+        return e["impact"] * e["confidence"] / e["effort"]
 
-            impact = 4 if "onboarding" in name else 3
-            confidence = 3
-            effort = 3 if "redesign" not in name else 4
+    @staticmethod
+    def position_bias(n: int) -> np.ndarray:
+        # 🔹 ICE bias: later items = quicker wins
+        return np.arange(n) * 0.25
 
-            score = round((impact * confidence) / effort, 2)
 
-            scored.append({
-                "feature": feature,
-                "score": score
-            })
+@register_strategy("MOSCOW")
+class TieredMoSCoWStrategy(BaseStrategy):
+    """
+    MoSCoW — delivery & scope control. Keeps the given order.
+    """
 
-        return scored
+    labels = {3: "Must Have", 2: "Should Have", 1: "Could Have"}
+    sort_by_score = False
 
+    def apply_many(self, features: List[str]) -> np.ndarray:
+        positions = np.arange(len(features))
+        return np.select([positions < 2, positions < 4], [3.0, 2.0], 1.0)
 
-class MoSCoWStrategy(BaseStrategy):
+
+@register_strategy("KANO")
+class TieredKanoStrategy(BaseStrategy):
     """
-    Requirement classification — converted to scores for UI compatibility.
+    Kano — experience & delight classification, delighters first.
     """
 
-    def apply(self, features: List[str]) -> List[Dict]:
-        scored = []
+    labels = {3: "Delighter", 2: "Performance", 1: "Basic"}
 
-        for i, feature in enumerate(features):
-            if i < 3:
-                score = 5  # Must-have
-            elif i < 6:
-                score = 3  # Should-have
-            else:
-                score = 1  # Could-have
+    def apply_many(self, features: List[str]) -> np.ndarray:
+        positions = np.arange(len(features))
+        return np.select([positions < 2, positions < 4], [1.0, 2.0], 3.0)
 
-            scored.append({
-                "feature": feature,
-                "score": score
-            })
 
-        return scored
+# --------------------------------------------------
+# KEYWORD-RULE STRATEGIES (explicit, explainable assumptions)
+# --------------------------------------------------
+# Each matcher's category order is rule priority; categories are the values
+RICE_REACH_RULES = KeywordMatcher({5: ["onboarding", "kyc"]})
+RICE_IMPACT_RULES = KeywordMatcher({5: ["retry", "reduce", "first"], 4: ["guide", "status"]})
+RICE_CONFIDENCE_RULES = KeywordMatcher({4: ["explanation", "status"]})
+RICE_EFFORT_RULES = KeywordMatcher({5: ["redesign"], 4: ["automated"]})
+ICE_IMPACT_RULES = KeywordMatcher({4: ["onboarding"]})
+ICE_EFFORT_RULES = KeywordMatcher({4: ["redesign"]})
+KANO_RULES = KeywordMatcher({5: ["retry", "reduce"], 4: ["guide", "checklist"]})
 
 
-class KanoStrategy(BaseStrategy):
+def _rule_values(features: List[str], rules: KeywordMatcher, default: int) -> np.ndarray:
+    return np.fromiter(
+        (rules.first(f.lower(), default=default) for f in features),
+        dtype=np.float64,
+        count=len(features)
+    )
+
+
+@register_strategy("RICE_RULES")
+class RICEStrategy(BaseStrategy):
     """
-    Simplified Kano mapping.
+    PM-grade RICE scoring with explicit assumptions.
+    Scores are intentionally bounded and explainable.
     """
 
-    def apply(self, features: List[str]) -> List[Dict]:
-        scored = []
+    def apply_many(self, features: List[str]) -> np.ndarray:
+        reach = _rule_values(features, RICE_REACH_RULES, 3)            # users affected
+        impact = _rule_values(features, RICE_IMPACT_RULES, 3)          # first transaction completion
+        confidence = _rule_values(features, RICE_CONFIDENCE_RULES, 3)  # certainty it will work
+        effort = _rule_values(features, RICE_EFFORT_RULES, 3)          # engineering + compliance
 
-        for feature in features:
-            name = feature.lower()
+        return np.round(reach * impact * confidence / effort, 2)
 
-            if "retry" in name or "reduce" in name:
-                score = 5  # Performance need
-            elif "guide" in name or "checklist" in name:
-                score = 4  # Delighter
-            else:
-                score = 3  # Basic expectation
 
-            scored.append({
-                "feature": feature,
-                "score": score
-            })
+@register_strategy("ICE_RULES")
+class ICEStrategy(BaseStrategy):
+    """
+    Lightweight prioritization for fast decisions.
+    """
+
+    def apply_many(self, features: List[str]) -> np.ndarray:
+        impact = _rule_values(features, ICE_IMPACT_RULES, 3)
+        effort = _rule_values(features, ICE_EFFORT_RULES, 3)
+
+        return np.round(impact * 3 / effort, 2)
+
+
+@register_strategy("MOSCOW_RULES")
+class MoSCoWStrategy(BaseStrategy):
+    """
+    Requirement classification — converted to scores for UI compatibility.
+    """
+
+    def apply_many(self, features: List[str]) -> np.ndarray:
+        positions = np.arange(len(features))
+        # Must-have / Should-have / Could-have
+        return np.select([positions < 3, positions < 6], [5.0, 3.0], 1.0)
+
+
+@register_strategy("KANO_RULES")
+class KanoStrategy(BaseStrategy):
+    """
+    Simplified Kano mapping.
+    """
 
-        return scored
+    def apply_many(self, features: List[str]) -> np.ndarray:
+        # 5 = performance need, 4 = delighter, 3 = basic expectation
+        return _rule_values(features, KANO_RULES, 3)
@@ -1,45 +1,108 @@
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Iterable, List, Mapping
+
+from product.keyword_matcher import KeywordMatcher
+
+
+# Compiled once; category order is detection priority
+PROBLEM_TYPE_MATCHER = KeywordMatcher({
+    "activation": ["onboarding", "signup", "activation", "kyc"],
+    "retention": [
+        # Explicit retention terms
+        "churn",
+        "retention",
+        "downgrade",
+
+        # Trial-related retention
+        "trial",
+        "free trial",
+        "trial ends",
+        "users leave after trial",
+        "not converting after trial",
+        "post-trial",
+
+        # Behavioral retention (PM language)
+        "repeat order",
+        "repeat orders",
+        "low repeat",
+        "second order",
+        "come back",
+        "not returning",
+        "after first",
+        "week 1",
+    ],
+    "performance": ["slow", "performance", "latency", "reliability"],
+})
+
+# Broader fallback used when map() returns "general"
+FALLBACK_TYPE_MATCHER = KeywordMatcher({
+    "onboarding": ["onboarding", "signup", "kyc", "activation", "first value"],
+    "retention": ["churn", "retention", "drop off", "inactive"],
+    "performance": ["latency", "downtime", "failure", "reliability"],
+    "delivery": ["delivery", "delay", "execution", "roadmap"],
+    "satisfaction": ["satisfaction", "nps", "feedback", "complaints"],
+    "growth": ["growth", "conversion", "monetization", "pricing"],
+})
+
+
+def normalize_problem_text(problem_text: str) -> str:
+    """
+    Lowercase and collapse whitespace so near-identical inputs share
+    one cache entry.
+    """
+    return " ".join((problem_text or "").lower().split())
+
+
+@lru_cache(maxsize=8192)
+def _detect_type(normalized_text: str) -> str:
+    return PROBLEM_TYPE_MATCHER.first(normalized_text, default="general")
+
+
 class ProblemMapper:
+    """
+    Maps a free-text product problem to a PM-grade problem framing.
+
+    The framing depends only on the detected problem_type, so every type's
+    output is built once at import (PROBLEM_TEMPLATES) and type detection
+    is LRU-cached on the normalized text.
+    """
+
     def map(self, problem_text: str) -> dict:
-        text = problem_text.lower()
+        template = PROBLEM_TEMPLATES[self.detect_type(problem_text)]
 
-        # -------------------------
-        # PROBLEM TYPE DETECTION
-        # -------------------------
-        if any(k in text for k in ["onboarding", "signup", "activation", "kyc"]):
-            problem_type = "activation"
-
-        elif any(k in text for k in [
-            # Explicit retention terms
-            "churn",
-            "retention",
-            "downgrade",
-
-            # Trial-related retention
-            "trial",
-            "free trial",
-            "trial ends",
-            "users leave after trial",
-            "not converting after trial",
-            "post-trial",
-
-            # Behavioral retention (PM language)
-            "repeat order",
-            "repeat orders",
-            "low repeat",
-            "second order",
-            "come back",
-            "not returning",
-            "after first",
-            "week 1",
-        ]):
-            problem_type = "retention"
-
-        elif any(k in text for k in ["slow", "performance", "latency", "reliability"]):
-            problem_type = "performance"
+        # Callers may mutate the result, so hand out a private copy
+        return {
+            key: list(value) if isinstance(value, tuple) else value
+            for key, value in template.items()
+        }
 
-        else:
-            problem_type = "general"
+    def map_many(self, problem_texts: Iterable[str]) -> List[Mapping]:
+        """
+        Map many texts in one pass.
 
+        Each distinct normalized text is detected once, and results are the
+        shared read-only per-type templates (lists become tuples), so bulk
+        runs over repetitive ticket exports allocate almost nothing.
+        """
+        detected = {}
+        results = []
+
+        for problem_text in problem_texts:
+            normalized = normalize_problem_text(problem_text)
+            problem_type = detected.get(normalized)
+            if problem_type is None:
+                problem_type = detected[normalized] = _detect_type(normalized)
+            results.append(PROBLEM_TEMPLATES[problem_type])
+
+        return results
+
+    @staticmethod
+    def detect_type(problem_text: str) -> str:
+        return _detect_type(normalize_problem_text(problem_text))
+
+    @staticmethod
+    def _build_template(problem_type: str) -> dict:
         # -------------------------
         # CORE PROBLEM
         # -------------------------
@@ -173,3 +236,13 @@ class ProblemMapper:
             "success_definition": success_definition,
             "summary": summary,
         }
+
+
+# Built once; shared, read-only framing per problem type
+PROBLEM_TEMPLATES = {
+    problem_type: MappingProxyType({
+        key: tuple(value) if isinstance(value, list) else value
+        for key, value in ProblemMapper._build_template(problem_type).items()
+    })
+    for problem_type in PROBLEM_TYPE_MATCHER.categories + ("general",)
+}
@@ -1,3 +1,6 @@
+import numpy as np
+
+
 class RiceScorer:
     """
     Scores features using the RICE prioritization framework.
@@ -23,3 +26,58 @@ class RiceScorer:
             return 0
 
         return round((reach * impact * confidence) / effort, 2)
+
+    def score_many(self, reach, impact, confidence, effort) -> np.ndarray:
+        """
+        Calculate RICE scores for a whole backlog at once.
+
+        Each argument is a column (list, NumPy array, pandas Series or
+        pyarrow Array) or a scalar broadcast to every row. Missing values
+        default like score() does: 0 for reach / impact / confidence, 1 for
+        effort. Zero effort scores 0 (no per-row branching).
+
+        Returns:
+            np.ndarray: float64 RICE scores rounded to 2 decimals
+        """
+        reach = self._column(reach, 0.0)
+        impact = self._column(impact, 0.0)
+        confidence = self._column(confidence, 0.0)
+        effort = self._column(effort, 1.0)
+
+        value = reach * impact * confidence
+        value, effort = np.broadcast_arrays(value, effort)
+
+        scores = np.divide(value, effort, out=np.zeros(value.shape), where=effort != 0)
+        return np.round(scores, 2)
+
+    @staticmethod
+    def top_k(scores, k: int) -> np.ndarray:
+        """
+        Indices of the k highest scores, best first.
+
+        Uses argpartition (O(n)) and only sorts the k winners. Among equal
+        scores at the cut-off, which rows make the top k is unspecified.
+        """
+        scores = np.asarray(scores, dtype=np.float64)
+        k = min(int(k), scores.size)
+
+        if k <= 0:
+            return np.zeros(0, dtype=np.intp)
+
+        if k < scores.size:
+            top = np.argpartition(-scores, k - 1)[:k]
+        else:
+            top = np.arange(scores.size)
+
+        return top[np.argsort(-scores[top], kind="stable")]
+
+    @staticmethod
+    def _column(values, missing: float) -> np.ndarray:
+        if hasattr(values, "to_numpy"):
+            try:  # pyarrow: allow copies so nulls become NaN
+                values = values.to_numpy(zero_copy_only=False)
+            except TypeError:  # pandas
+                values = values.to_numpy()
+
+        column = np.asarray(values, dtype=np.float64)
+        return np.where(np.isnan(column), missing, column)
@@ -0,0 +1,163 @@
+import heapq
+from typing import Dict, Iterable, List, Mapping, Optional
+
+from product.prioritization_strategy import get_strategy
+from roadmap.dependency_graph import DependencyCycleError
+
+
+BACKLOG_LABEL = "Backlog (beyond capacity)"
+
+
+class CapacityScheduler:
+    """
+    Packs a prioritized backlog into fixed-capacity periods.
+
+    Features are placed greedily, best priority first (input order, as
+    returned by StrategyResolver), into the first period with enough
+    capacity left. A feature never lands before the period of anything it
+    depends on; ready features are taken from a heap (Kahn's algorithm),
+    so the whole pass is O((n + e) log n + n · periods).
+
+    Features larger than one period's capacity, or that no longer fit,
+    go to the backlog together with everything depending on them.
+    """
+
+    def __init__(self, capacity_per_period: float, periods: int = 2, period_months: int = 3, seed: int = 0):
+        if capacity_per_period <= 0 or periods < 1:
+            raise ValueError("capacity_per_period must be > 0 and periods >= 1")
+
+        self.capacity_per_period = capacity_per_period
+        self.periods = periods
+        self.period_months = period_months
+        self.seed = seed
+
+    def labels(self) -> List[str]:
+        prefix = "Q" if self.period_months == 3 else "P"
+        m = self.period_months
+        return [f"{prefix}{p + 1} ({p * m}–{(p + 1) * m} months)" for p in range(self.periods)]
+
+    def efforts(self, features: List[str], effort: Optional[Mapping[str, float]] = None) -> List[float]:
+        """
+        Effort per feature: given values, else the RICE strategy estimates.
+        """
+        estimated = get_strategy("RICE", seed=self.seed).estimates(features)["effort"].tolist()
+        if not effort:
+            return [float(e) for e in estimated]
+
+        return [float(effort.get(f, e)) for f, e in zip(features, estimated)]
+
+    def assign(
+        self,
+        features: List[str],
+        effort: Optional[Mapping[str, float]] = None,
+        dependencies: Optional[Mapping[str, Iterable[str]]] = None,
+    ) -> Dict[str, Optional[int]]:
+        """
+        Period index per feature (None = backlog), in scheduling order.
+
+        Args:
+            features: Feature names, best priority first (a repeated name
+                is scheduled once, at its first position)
+            effort: Optional effort per feature (same unit as capacity)
+            dependencies: feature -> features it depends on (a dict or a
+                DependencyGraph). Dependencies outside `features` are
+                treated as already done.
+
+        Raises:
+            DependencyCycleError: If the dependencies contain a cycle
+        """
+        features = list(dict.fromkeys(features))
+        n = len(features)
+        index = {feature: i for i, feature in enumerate(features)}
+        costs = self.efforts(features, effort)
+
+        children: List[List[int]] = [[] for _ in range(n)]
+        parents: List[List[int]] = [[] for _ in range(n)]
+        waiting = [0] * n
+        for feature, requires in (dependencies or {}).items():
+            child = index.get(feature)
+            if child is None:
+                continue
+            for requirement in requires:
+                parent = index.get(requirement)
+                if parent is not None and parent != child:
+                    children[parent].append(child)
+                    parents[child].append(parent)
+                    waiting[child] += 1
+
+        ready = [i for i in range(n) if waiting[i] == 0]
+        heapq.heapify(ready)
+
+        remaining = [self.capacity_per_period] * self.periods
+        earliest = [0] * n
+        blocked = [False] * n
+        period_of: Dict[str, Optional[int]] = {}
+
+        while ready:
+            i = heapq.heappop(ready)
+            period = None
+
+            if not blocked[i] and costs[i] <= self.capacity_per_period:
+                for p in range(earliest[i], self.periods):
+                    if remaining[p] >= costs[i]:
+                        remaining[p] -= costs[i]
+                        period = p
+                        break
+
+            period_of[features[i]] = period
+
+            for child in children[i]:
+                if period is None:
+                    blocked[child] = True
+                elif period > earliest[child]:
+                    earliest[child] = period
+
+                waiting[child] -= 1
+                if waiting[child] == 0:
+                    heapq.heappush(ready, child)
+
+        if len(period_of) < n:
+            raise DependencyCycleError(self._find_cycle(features, parents, waiting))
+
+        return period_of
+
+    @staticmethod
+    def _find_cycle(features: List[str], parents: List[List[int]], waiting: List[int]) -> List[str]:
+        # A feature Kahn's pass never released still waits on another
+        # unreleased one, so following those requirements must loop
+        node = next(i for i in range(len(features)) if waiting[i] > 0)
+        seen = {}
+        path = []
+
+        while node not in seen:
+            seen[node] = len(path)
+            path.append(node)
+            node = next(p for p in parents[node] if waiting[p] > 0)
+
+        cycle = path[seen[node]:][::-1]
+        return [features[i] for i in cycle + cycle[:1]]
+
+    def schedule(
+        self,
+        scored_features,
+        effort: Optional[Mapping[str, float]] = None,
+        dependencies: Optional[Mapping[str, Iterable[str]]] = None,
+    ) -> Dict[str, List[str]]:
+        """
+        Roadmap dict (period label -> features) plus a backlog phase.
+
+        Accepts the same inputs as RoadmapGenerator.generate().
+        """
+        features = [
+            item["feature"] if isinstance(item, dict) else item
+            for item in scored_features
+        ]
+
+        labels = self.labels()
+        roadmap = {label: [] for label in labels}
+        roadmap[BACKLOG_LABEL] = []
+
+        for feature, period in self.assign(features, effort, dependencies).items():
+            roadmap[BACKLOG_LABEL if period is None else labels[period]].append(feature)
+
+        return roadmap
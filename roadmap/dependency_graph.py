@@ -0,0 +1,183 @@
+from collections.abc import Mapping
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Optional, Set, Tuple
+
+
+class DependencyCycleError(ValueError):
+    """
+    Raised when a dependency would make features wait on each other.
+    """
+
+    def __init__(self, cycle: List[str]):
+        self.cycle = cycle
+        super().__init__(f"Dependency cycle: {' -> '.join(cycle)}")
+
+
+class DependencyGraph(Mapping):
+    """
+    Feature dependency DAG with an incrementally maintained topological order.
+
+    Reads like a mapping of feature -> features it requires, so it can be
+    passed anywhere a dependencies dict is accepted (CapacityScheduler,
+    RoadmapGenerator.schedule).
+
+    add_dependency() keeps the order valid with the Pearce–Kelly algorithm:
+    when a new edge breaks the order, only the nodes whose positions lie
+    between its endpoints are searched and renumbered, and a path back to
+    the new requirement is reported as a cycle. Removing edges never
+    invalidates the order.
+    """
+
+    def __init__(self, dependencies: Optional[Mapping] = None, features: Iterable[str] = ()):
+        self._requires: Dict[str, Set[str]] = {}
+        self._required_by: Dict[str, Set[str]] = {}
+        self._position: Dict[str, int] = {}
+        self._next_position = 0
+
+        for feature in features:
+            self.add_feature(feature)
+
+        for feature, requires in (dependencies or {}).items():
+            self.add_feature(feature)
+            for requirement in requires:
+                self.add_dependency(feature, requirement)
+
+    # --------------------------------------------------
+    # MAPPING
+    # --------------------------------------------------
+    def __getitem__(self, feature: str) -> FrozenSet[str]:
+        return frozenset(self._requires[feature])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._requires)
+
+    def __len__(self) -> int:
+        return len(self._requires)
+
+    def dependents(self, feature: str) -> FrozenSet[str]:
+        return frozenset(self._required_by[feature])
+
+    # --------------------------------------------------
+    # UPDATES
+    # --------------------------------------------------
+    def add_feature(self, feature: str) -> None:
+        if feature not in self._requires:
+            self._requires[feature] = set()
+            self._required_by[feature] = set()
+            self._position[feature] = self._next_position
+            self._next_position += 1
+
+    def remove_feature(self, feature: str) -> None:
+        for requirement in self._requires.pop(feature):
+            self._required_by[requirement].discard(feature)
+        for dependent in self._required_by.pop(feature):
+            self._requires[dependent].discard(feature)
+        del self._position[feature]
+
+    def add_dependency(self, feature: str, requires: str) -> None:
+        """
+        Record that `feature` cannot start before `requires`.
+
+        Raises:
+            DependencyCycleError: If `requires` already depends on `feature`
+        """
+        if feature == requires:
+            raise DependencyCycleError([feature, feature])
+
+        self.add_feature(feature)
+        self.add_feature(requires)
+        if feature in self._required_by[requires]:
+            return
+
+        lower, upper = self._position[feature], self._position[requires]
+        if lower < upper:
+            # Order breaks: renumber only the affected region
+            forward = self._search_forward(feature, requires, upper)
+            backward = self._search_backward(requires, lower)
+            self._reorder(backward, forward)
+
+        self._required_by[requires].add(feature)
+        self._requires[feature].add(requires)
+
+    def remove_dependency(self, feature: str, requires: str) -> None:
+        self._requires[feature].discard(requires)
+        self._required_by[requires].discard(feature)
+
+    def _search_forward(self, start: str, target: str, upper: int) -> List[str]:
+        # Dependents of `start` positioned up to `upper`; reaching `target` is a cycle
+        parent = {start: None}
+        stack = [start]
+        while stack:
+            node = stack.pop()
+            for dependent in self._required_by[node]:
+                if dependent == target:
+                    path = [target, node]
+                    while parent[path[-1]] is not None:
+                        path.append(parent[path[-1]])
+                    raise DependencyCycleError(path[::-1] + [start])
+                if dependent not in parent and self._position[dependent] < upper:
+                    parent[dependent] = node
+                    stack.append(dependent)
+        return list(parent)
+
+    def _search_backward(self, start: str, lower: int) -> List[str]:
+        # Requirements of `start` positioned after `lower`
+        seen = {start}
+        stack = [start]
+        while stack:
+            node = stack.pop()
+            for requirement in self._requires[node]:
+                if requirement not in seen and self._position[requirement] > lower:
+                    seen.add(requirement)
+                    stack.append(requirement)
+        return list(seen)
+
+    def _reorder(self, backward: List[str], forward: List[str]) -> None:
+        # Requirements take the lowest of the freed positions, dependents the rest
+        position = self._position
+        backward.sort(key=position.__getitem__)
+        forward.sort(key=position.__getitem__)
+        slots = sorted(position[node] for node in backward + forward)
+
+        for node, slot in zip(backward + forward, slots):
+            position[node] = slot
+
+    # --------------------------------------------------
+    # QUERIES
+    # --------------------------------------------------
+    def topological_order(self) -> List[str]:
+        """
+        Every feature after all of its requirements.
+        """
+        return sorted(self._position, key=self._position.__getitem__)
+
+    def critical_path(self, effort: Optional[Mapping[str, float]] = None) -> Tuple[float, List[str]]:
+        """
+        Longest effort-weighted dependency chain.
+
+        Args:
+            effort: Effort per feature (missing features count as 1)
+
+        Returns:
+            tuple: (total effort, features on the path in order)
+        """
+        effort = effort or {}
+        finish: Dict[str, float] = {}
+        previous: Dict[str, Optional[str]] = {}
+
+        for feature in self.topological_order():
+            before = max(self._requires[feature], key=finish.__getitem__, default=None)
+            start = finish[before] if before is not None else 0.0
+            finish[feature] = start + float(effort.get(feature, 1))
+            previous[feature] = before
+
+        if not finish:
+            return 0.0, []
+
+        node = max(finish, key=finish.__getitem__)
+        length = finish[node]
+        path = []
+        while node is not None:
+            path.append(node)
+            node = previous[node]
+
+        return length, path[::-1]
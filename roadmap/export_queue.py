@@ -0,0 +1,99 @@
+import multiprocessing
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Dict, Optional
+
+from roadmap.roadmap_exporter import RoadmapExporter
+
+
+def _run_export(export_dir: str, method: str, payload: dict) -> str:
+    return getattr(RoadmapExporter(export_dir), method)(payload)
+
+
+class ExportQueue:
+    """
+    Renders PDF exports in a background process pool.
+
+    submit() returns a job id immediately; callers poll status() until the
+    job is "done" (the PDF path is then available) or "failed". Workers are
+    spawned rather than forked, so the queue is safe to start from threaded
+    servers such as Streamlit.
+    """
+
+    def __init__(self, export_dir: str = "exports", workers: Optional[int] = None, max_jobs: int = 1000):
+        self.export_dir = export_dir
+        self.max_jobs = max_jobs
+
+        self._pool = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn")
+        )
+        self._jobs: "OrderedDict[str, Future]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def submit(self, analysis: dict, method: str = "export_full_analysis") -> str:
+        """
+        Queue one export.
+
+        Args:
+            analysis (dict): Payload for the RoadmapExporter method
+            method (str): "export_full_analysis" or "export" (roadmap only)
+
+        Returns:
+            str: Job id for status() / result()
+        """
+        if method not in ("export", "export_full_analysis"):
+            raise ValueError(f"Unknown export method: {method}")
+
+        job_id = uuid.uuid4().hex
+        future = self._pool.submit(_run_export, self.export_dir, method, analysis)
+
+        with self._lock:
+            self._jobs[job_id] = future
+            self._prune()
+
+        return job_id
+
+    def status(self, job_id: str) -> Dict:
+        """
+        Job state: "queued", "running", "done" (with "path") or "failed"
+        (with "error").
+
+        Raises:
+            KeyError: If the job id is unknown (or was pruned)
+        """
+        with self._lock:
+            future = self._jobs[job_id]
+
+        if not future.done():
+            state = "running" if future.running() else "queued"
+            return {"id": job_id, "state": state}
+
+        error = future.exception()
+        if error is not None:
+            return {"id": job_id, "state": "failed", "error": str(error)}
+
+        return {"id": job_id, "state": "done", "path": future.result()}
+
+    def result(self, job_id: str, timeout: Optional[float] = None) -> str:
+        """
+        Block until the job finishes and return the PDF path.
+        """
+        with self._lock:
+            future = self._jobs[job_id]
+        return future.result(timeout)
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._pool.shutdown(wait=wait, cancel_futures=True)
+
+    def _prune(self) -> None:
+        # Forget the oldest finished jobs beyond max_jobs
+        excess = len(self._jobs) - self.max_jobs
+        for job_id in list(self._jobs):
+            if excess <= 0:
+                break
+            if self._jobs[job_id].done():
+                del self._jobs[job_id]
+                excess -= 1
@@ -0,0 +1,199 @@
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, timedelta
+from typing import Dict, List, Optional, Tuple, Type
+
+import numpy as np
+
+from product.prioritization_strategy import EstimatedStrategy, get_strategy
+
+
+DAYS_PER_MONTH = 30.44
+
+
+def _simulate_chunk(
+    strategy: Type[EstimatedStrategy],
+    estimates: Dict[str, np.ndarray],
+    position_bias: np.ndarray,
+    capacity: float,
+    spread: float,
+    effort_sigma: float,
+    seed: np.random.SeedSequence,
+    samples: int,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    One block of samples → (rank, finish) arrays shaped features × samples.
+
+    `finish` is cumulative effort, in periods of `capacity`, when the
+    feature is done if work follows that sample's ranking.
+    """
+    rng = np.random.default_rng(seed)
+    n = len(position_bias)
+    shape = (n, samples)
+
+    drawn = {}
+    for name, (low, high) in strategy.bounds.items():
+        if name == "effort":
+            continue
+        base = estimates[name][:, None]
+        drawn[name] = np.clip(base + rng.uniform(-spread, spread, shape), low, high)
+
+    # Effort overruns are skewed: multiplicative log-normal noise
+    effort = drawn["effort"] = estimates["effort"][:, None] * rng.lognormal(0.0, effort_sigma, shape)
+
+    scores = strategy.combine(drawn) + position_bias[:, None]
+
+    order = np.argsort(-scores, axis=0, kind="stable")
+    positions = np.broadcast_to(np.arange(n, dtype=np.int32)[:, None], shape)
+
+    ranks = np.empty(shape, dtype=np.int32)
+    np.put_along_axis(ranks, order, positions, axis=0)
+
+    done = np.cumsum(np.take_along_axis(effort, order, axis=0), axis=0) / capacity
+    finish = np.empty(shape, dtype=np.float32)
+    np.put_along_axis(finish, order, done, axis=0)
+
+    return ranks, finish
+
+
+class RoadmapSimulator:
+    """
+    Monte Carlo confidence for a RICE- or ICE-ranked roadmap.
+
+    The framework's estimates become distributions: reach, impact and
+    confidence are drawn uniformly within ±`spread` of the estimate
+    (clipped to the strategy's `bounds`), effort gets log-normal overrun
+    noise. Scores use the strategy's own formula and position bias, so the
+    baseline ranking is exactly the Prioritization ranking. Every draw is
+    a features × samples NumPy array, so one block of samples is a
+    handful of vectorized operations.
+
+    Samples are generated in fixed-size blocks, each seeded from one
+    SeedSequence spawned off `seed`, so results are identical across
+    reruns and regardless of `workers`.
+    """
+
+    def __init__(
+        self,
+        samples: int = 2000,
+        seed: int = 0,
+        capacity_per_period: Optional[float] = None,
+        periods: int = 2,
+        period_months: int = 3,
+        spread: float = 1.0,
+        effort_sigma: float = 0.3,
+        workers: Optional[int] = None,
+        chunk_size: int = 1000,
+    ):
+        if samples < 1 or chunk_size < 1:
+            raise ValueError("samples and chunk_size must be >= 1")
+
+        self.samples = samples
+        self.seed = seed
+        self.capacity_per_period = capacity_per_period
+        self.periods = periods
+        self.period_months = period_months
+        self.spread = spread
+        self.effort_sigma = effort_sigma
+        self.workers = workers
+        self.chunk_size = chunk_size
+
+    @staticmethod
+    def supports(framework: str) -> bool:
+        """
+        Only frameworks scored from estimates have a score distribution;
+        MoSCoW and Kano tiers are positional.
+        """
+        return isinstance(get_strategy(framework, default="RICE"), EstimatedStrategy)
+
+    def simulate(self, features: List[str], framework: str = "RICE", start_date: Optional[date] = None) -> Dict:
+        """
+        Rank stability, P(Q1) and delivery percentiles per feature.
+
+        Args:
+            features: Features in generation order (as passed to the
+                strategy, whose position bias depends on it)
+            framework: Prioritization framework of the analysis
+            start_date: Roadmap start; adds P50 / P90 delivery dates
+
+        Returns:
+            dict: Simulation settings plus one row per feature, in
+                baseline rank order (the framework's own ranking)
+
+        Raises:
+            ValueError: For categorical frameworks (see supports())
+        """
+        strategy = get_strategy(framework, seed=self.seed, default="RICE")
+        if not isinstance(strategy, EstimatedStrategy):
+            raise ValueError(f"{framework} has no score distribution to simulate")
+
+        estimates = {k: v.astype(np.float64) for k, v in strategy.estimates(features).items()}
+        n = len(features)
+        position_bias = strategy.position_bias(n)
+
+        capacity = self.capacity_per_period
+        if capacity is None:
+            # Baseline plan fills `periods` periods exactly
+            capacity = max(float(estimates["effort"].sum()) / self.periods, 1.0)
+
+        ranks, finish = self._run(type(strategy), estimates, position_bias, capacity)
+
+        baseline = np.empty(n, dtype=np.int64)
+        baseline[np.argsort(-strategy.apply_many(features), kind="stable")] = np.arange(n)
+
+        rank_p10, rank_p50, rank_p90 = np.percentile(ranks, [10, 50, 90], axis=1)
+        stable = (np.abs(ranks - baseline[:, None]) <= 1).mean(axis=1)
+        p_q1 = (finish <= 1.0).mean(axis=1)
+        months = np.percentile(finish, [50, 90], axis=1) * self.period_months
+
+        rows = []
+        for i in np.argsort(baseline, kind="stable"):
+            p50, p90 = float(months[0, i]), float(months[1, i])
+            rows.append({
+                "feature": features[i],
+                "rank": int(baseline[i]) + 1,
+                "rank_p10": int(round(rank_p10[i])) + 1,
+                "rank_p50": int(round(rank_p50[i])) + 1,
+                "rank_p90": int(round(rank_p90[i])) + 1,
+                "rank_stability": round(float(stable[i]), 3),
+                "p_q1": round(float(p_q1[i]), 3),
+                "delivery_p50_months": round(p50, 1),
+                "delivery_p90_months": round(p90, 1),
+                "delivery_p50_date": self._date(start_date, p50),
+                "delivery_p90_date": self._date(start_date, p90),
+            })
+
+        return {
+            "framework": strategy.name,
+            "samples": self.samples,
+            "seed": self.seed,
+            "capacity_per_period": round(capacity, 2),
+            "period_months": self.period_months,
+            "features": rows,
+        }
+
+    def _run(self, strategy, estimates, position_bias, capacity) -> Tuple[np.ndarray, np.ndarray]:
+        sizes = [
+            min(self.chunk_size, self.samples - start)
+            for start in range(0, self.samples, self.chunk_size)
+        ]
+        seeds = np.random.SeedSequence(self.seed).spawn(len(sizes))
+        jobs = [
+            (strategy, estimates, position_bias, capacity, self.spread, self.effort_sigma, seed, size)
+            for seed, size in zip(seeds, sizes)
+        ]
+
+        if self.workers and self.workers > 1 and len(jobs) > 1:
+            with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                blocks = list(pool.map(_simulate_chunk, *zip(*jobs)))
+        else:
+            blocks = [_simulate_chunk(*job) for job in jobs]
+
+        ranks = np.concatenate([r for r, _ in blocks], axis=1)
+        finish = np.concatenate([f for _, f in blocks], axis=1)
+        return ranks, finish
+
+    @staticmethod
+    def _date(start_date: Optional[date], months: float) -> Optional[str]:
+        if start_date is None:
+            return None
+        return (start_date + timedelta(days=round(months * DAYS_PER_MONTH))).isoformat()
@@ -1,4 +1,5 @@
 from reportlab.platypus import (
+    Flowable,
     SimpleDocTemplate,
     Paragraph,
     Spacer,
@@ -7,57 +8,200 @@ from reportlab.platypus import (
 )
 from reportlab.lib.styles import getSampleStyleSheet
 from reportlab.lib.pagesizes import A4
-from datetime import datetime
+from typing import Iterable, Iterator, List, Optional, Tuple
+import hashlib
+import json
 import os
+import tempfile
+import time
+
+
+# Bump when the PDF layout changes so cached renders are not reused
+RENDER_VERSION = 4
+
+# Built once and shared by every exporter (styles are read-only here)
+STYLES = getSampleStyleSheet()
+
+# Items per ListFlowable; long lists are emitted as consecutive chunks so
+# ReportLab never wraps / splits one huge flowable page after page
+LIST_CHUNK_SIZE = 50
+
+# Default bounds for the PDFs kept in export_dir
+MAX_CACHED_FILES = 500
+MAX_CACHED_BYTES = 512 * 1024 * 1024
+MAX_CACHED_AGE_SECONDS = 30 * 24 * 3600
+
+CACHED_PREFIXES = ("pm_gpt_roadmap_", "pm_gpt_full_analysis_")
+
+
+def payload_digest(payload) -> str:
+    """
+    Stable content hash of a JSON-like payload.
+
+    Dict insertion order is kept: the PDF renders phases and sections in
+    that order, so a reordered payload is a different document.
+    """
+    canonical = json.dumps(
+        [RENDER_VERSION, payload],
+        default=str,
+        ensure_ascii=False,
+        separators=(",", ":")
+    )
+    return hashlib.blake2b(canonical.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def evict_cached(
+    export_dir: str,
+    prefixes: Tuple[str, ...],
+    suffixes: Tuple[str, ...],
+    max_files: Optional[int],
+    max_bytes: Optional[int],
+    max_age: Optional[float],
+    keep: Optional[str] = None,
+) -> List[str]:
+    """
+    Least-recently-used eviction of content-addressed exports.
+
+    Files in `export_dir` named `<prefix>...<suffix>` are kept newest
+    (mtime) first until one of the limits is hit; `keep` is never
+    removed. Returns removed paths.
+    """
+    entries = []
+    with os.scandir(export_dir) as it:
+        for entry in it:
+            if entry.name.startswith(prefixes) and entry.name.endswith(suffixes):
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:  # removed concurrently
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+    entries.sort(reverse=True)  # most recently used first
+    now = time.time()
+    kept_bytes = 0
+    removed = []
+
+    for count, (mtime, size, path) in enumerate(entries, start=1):
+        expired = (
+            (max_age is not None and now - mtime > max_age)
+            or (max_files is not None and count > max_files)
+            or (max_bytes is not None and kept_bytes + size > max_bytes)
+        )
+
+        if not expired or path == keep:
+            kept_bytes += size
+            continue
+
+        try:
+            os.remove(path)
+            removed.append(path)
+        except FileNotFoundError:
+            pass
+
+    return removed
+
+
+class FlowableStream:
+    """
+    List-like view over a flowable generator for doc.build().
+
+    ReportLab only touches the head of its story: it reads flowables[0]
+    (and a few following keep-with-next items), deletes from the front and
+    inserts split remainders back at the front. This buffer serves exactly
+    that from a small lookahead window, pulling more from the generator
+    as items are consumed, so the full story never exists in memory.
+    """
+
+    def __init__(self, flowables: Iterable[Flowable], lookahead: int = 64):
+        self._source = iter(flowables)
+        self._buffer: List[Flowable] = []
+        self.lookahead = lookahead
+
+    def _fill(self) -> None:
+        while self._source is not None and len(self._buffer) < self.lookahead:
+            try:
+                self._buffer.append(next(self._source))
+            except StopIteration:
+                self._source = None
+
+    def __len__(self) -> int:
+        # Only the buffered window; ReportLab just needs "non-empty" and
+        # in-range indices
+        self._fill()
+        return len(self._buffer)
+
+    def __getitem__(self, index):
+        self._fill()
+        return self._buffer[index]
+
+    def __setitem__(self, index, value) -> None:
+        self._fill()
+        self._buffer[index] = value
+
+    def __delitem__(self, index) -> None:
+        self._fill()
+        del self._buffer[index]
+
+    def insert(self, index: int, value: Flowable) -> None:
+        self._fill()
+        self._buffer.insert(index, value)
 
 
 class RoadmapExporter:
     """
     Exports PM-GPT outputs into PDF documents.
+
+    Files are content-addressed: the name is a hash of the canonicalized
+    payload, so exporting the same analysis again returns the existing PDF
+    instead of rendering a new one. Cached PDFs are evicted oldest-first
+    (by last use) beyond `max_files` / `max_bytes`, or after `max_age` seconds.
+
+    With `streaming=True` (default) the document is fed to ReportLab from
+    generators through a FlowableStream, so peak memory does not grow with
+    the number of features; `streaming=False` materializes the whole story.
     """
 
-    def __init__(self, export_dir: str = "exports"):
+    def __init__(
+        self,
+        export_dir: str = "exports",
+        max_files: Optional[int] = MAX_CACHED_FILES,
+        max_bytes: Optional[int] = MAX_CACHED_BYTES,
+        max_age: Optional[float] = MAX_CACHED_AGE_SECONDS,
+        streaming: bool = True,
+    ):
         os.makedirs(export_dir, exist_ok=True)
         self.export_dir = export_dir
-        self.styles = getSampleStyleSheet()
+        self.max_files = max_files
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.streaming = streaming
+        self.styles = STYLES
 
     # --------------------------------------------------
     # BASIC ROADMAP ONLY
     # --------------------------------------------------
     def export(self, roadmap: dict) -> str:
-        filename = f"pm_gpt_roadmap_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
-        path = os.path.join(self.export_dir, filename)
+        path = self.cache_path("pm_gpt_roadmap_", roadmap)
+        if self._reuse(path):
+            return path
 
-        doc = SimpleDocTemplate(path, pagesize=A4)
-        elements = []
+        self._build(path, self._roadmap_flowables(roadmap))
+        return path
 
-        elements.append(Paragraph("Product Roadmap", self.styles["Title"]))
-        elements.append(Spacer(1, 12))
+    def _roadmap_flowables(self, roadmap: dict) -> Iterator[Flowable]:
+        yield Paragraph("Product Roadmap", self.styles["Title"])
+        yield Spacer(1, 12)
 
         for phase, items in roadmap.items():
-            elements.append(Paragraph(str(phase), self.styles["Heading2"]))
-            elements.append(Spacer(1, 6))
+            yield Paragraph(str(phase), self.styles["Heading2"])
+            yield Spacer(1, 6)
 
             if items:
-                elements.append(
-                    ListFlowable(
-                        [
-                            ListItem(
-                                Paragraph(str(item), self.styles["Normal"])
-                            )
-                            for item in items
-                        ]
-                    )
-                )
+                yield from self._list_flowables(items)
             else:
-                elements.append(
-                    Paragraph("No items", self.styles["Normal"])
-                )
-
-            elements.append(Spacer(1, 12))
+                yield Paragraph("No items", self.styles["Normal"])
 
-        doc.build(elements)
-        return path
+            yield Spacer(1, 12)
 
     # --------------------------------------------------
     # FULL ANALYSIS EXPORT (STABLE & SAFE)
@@ -68,26 +212,24 @@ class RoadmapExporter:
         SAFE for dicts, lists, and strings.
         """
 
-        filename = f"pm_gpt_full_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
-        path = os.path.join(self.export_dir, filename)
+        path = self.cache_path("pm_gpt_full_analysis_", analysis)
+        if self._reuse(path):
+            return path
 
-        doc = SimpleDocTemplate(path, pagesize=A4)
-        elements = []
+        self._build(path, self._full_analysis_flowables(analysis))
+        return path
 
+    def _full_analysis_flowables(self, analysis: dict) -> Iterator[Flowable]:
         # -------------------------
         # TITLE
         # -------------------------
-        elements.append(
-            Paragraph("PM-GPT – Full Product Analysis", self.styles["Title"])
-        )
-        elements.append(Spacer(1, 14))
+        yield Paragraph("PM-GPT – Full Product Analysis", self.styles["Title"])
+        yield Spacer(1, 14)
 
         # -------------------------
         # PM NARRATIVE SUMMARY (COSMETIC FIX)
         # -------------------------
-        elements.append(
-            Paragraph("PM Narrative Summary", self.styles["Heading2"])
-        )
+        yield Paragraph("PM Narrative Summary", self.styles["Heading2"])
 
         problem = analysis.get("problem", {})
         problem_text = (
@@ -96,51 +238,30 @@ class RoadmapExporter:
             else str(problem)
         )
 
-        elements.append(
-            Paragraph(str(problem_text), self.styles["Normal"])
-        )
-        elements.append(Spacer(1, 12))
+        yield Paragraph(str(problem_text), self.styles["Normal"])
+        yield Spacer(1, 12)
 
         # -------------------------
         # FEATURES
         # -------------------------
-        elements.append(
-            Paragraph("Generated Features", self.styles["Heading2"])
-        )
+        yield Paragraph("Generated Features", self.styles["Heading2"])
 
         features = analysis.get("features", [])
         if features:
-            elements.append(
-                ListFlowable(
-                    [
-                        ListItem(
-                            Paragraph(str(feature), self.styles["Normal"])
-                        )
-                        for feature in features
-                    ]
-                )
-            )
+            yield from self._list_flowables(features)
         else:
-            elements.append(
-                Paragraph("No features generated.", self.styles["Normal"])
-            )
+            yield Paragraph("No features generated.", self.styles["Normal"])
 
-        elements.append(Spacer(1, 12))
+        yield Spacer(1, 12)
 
         # -------------------------
         # FRAMEWORK
         # -------------------------
-        elements.append(
-            Paragraph("Framework Selected", self.styles["Heading2"])
-        )
-        elements.append(
-            Paragraph(str(analysis.get("framework", "")), self.styles["Normal"])
-        )
-        elements.append(Spacer(1, 6))
+        yield Paragraph("Framework Selected", self.styles["Heading2"])
+        yield Paragraph(str(analysis.get("framework", "")), self.styles["Normal"])
+        yield Spacer(1, 6)
 
-        elements.append(
-            Paragraph("Framework Explanation", self.styles["Heading3"])
-        )
+        yield Paragraph("Framework Explanation", self.styles["Heading3"])
 
         # 🔥 COSMETIC PM-GRADE WORDING
         framework_text = (
@@ -148,60 +269,109 @@ class RoadmapExporter:
             f"by clearly separating must-have outcomes from lower-priority scope."
         )
 
-        elements.append(
-            Paragraph(framework_text, self.styles["Normal"])
-        )
-        elements.append(Spacer(1, 12))
+        yield Paragraph(framework_text, self.styles["Normal"])
+        yield Spacer(1, 12)
 
         # -------------------------
         # PRIORITIZATION
         # -------------------------
-        elements.append(
-            Paragraph("Prioritized Features", self.styles["Heading2"])
-        )
+        yield Paragraph("Prioritized Features", self.styles["Heading2"])
 
         for item in analysis.get("prioritization", []):
             text = f"{item.get('feature', '')} — Score: {item.get('score', 'N/A')}"
-            elements.append(
-                Paragraph(str(text), self.styles["Normal"])
-            )
+            yield Paragraph(str(text), self.styles["Normal"])
 
-        elements.append(Spacer(1, 12))
+        yield Spacer(1, 12)
 
         # -------------------------
         # ROADMAP
         # -------------------------
-        elements.append(
-            Paragraph("6-Month Roadmap", self.styles["Heading2"])
-        )
+        yield Paragraph("6-Month Roadmap", self.styles["Heading2"])
 
         roadmap = analysis.get("roadmap", {})
         for phase, items in roadmap.items():
-            elements.append(
-                Paragraph(str(phase), self.styles["Heading3"])
-            )
+            yield Paragraph(str(phase), self.styles["Heading3"])
 
             if items:
-                elements.append(
-                    ListFlowable(
-                        [
-                            ListItem(
-                                Paragraph(str(item), self.styles["Normal"])
-                            )
-                            for item in items
-                        ]
-                    )
-                )
+                yield from self._list_flowables(items)
             else:
-                elements.append(
-                    Paragraph("No items", self.styles["Normal"])
-                )
+                yield Paragraph("No items", self.styles["Normal"])
 
-            elements.append(Spacer(1, 8))
+            yield Spacer(1, 8)
 
         # -------------------------
-        # BUILD PDF
+        # DELIVERY CONFIDENCE (optional, see RoadmapSimulator)
         # -------------------------
-        doc.build(elements)
+        confidence = analysis.get("confidence")
+        if confidence and confidence.get("features"):
+            yield Paragraph("Delivery Confidence", self.styles["Heading2"])
+            yield Paragraph(
+                f"Monte Carlo over {confidence.get('samples')} samples of the "
+                f"{confidence.get('framework', 'RICE')} estimates "
+                f"at {confidence.get('capacity_per_period')} effort points per quarter.",
+                self.styles["Normal"]
+            )
+            yield Spacer(1, 6)
+
+            for row in confidence["features"]:
+                text = (
+                    f"{row.get('feature', '')} — P(Q1): {row.get('p_q1', 0):.0%} · "
+                    f"Rank {row.get('rank')} (P10–P90: {row.get('rank_p10')}–{row.get('rank_p90')}) · "
+                    f"Delivery P50 / P90: {row.get('delivery_p50_months')} / "
+                    f"{row.get('delivery_p90_months')} months"
+                )
+                if row.get("delivery_p50_date"):
+                    text += f" ({row['delivery_p50_date']} / {row['delivery_p90_date']})"
+                yield Paragraph(text, self.styles["Normal"])
+
+    def _list_flowables(self, items: list) -> Iterator[Flowable]:
+        # Numbered list emitted in chunks; `start` keeps numbering continuous
+        for offset in range(0, len(items), LIST_CHUNK_SIZE):
+            yield ListFlowable(
+                [
+                    ListItem(Paragraph(str(item), self.styles["Normal"]))
+                    for item in items[offset:offset + LIST_CHUNK_SIZE]
+                ],
+                start=offset + 1
+            )
 
-        return path
+    # --------------------------------------------------
+    # CONTENT-ADDRESSED CACHE
+    # --------------------------------------------------
+    def cache_path(self, prefix: str, payload) -> str:
+        return os.path.join(self.export_dir, f"{prefix}{payload_digest(payload)}.pdf")
+
+    def evict(self, keep: Optional[str] = None) -> List[str]:
+        """
+        Apply the age / count / size limits to cached PDFs.
+
+        Only files this exporter names are touched, and `keep` (the PDF
+        just written) is never removed. Returns removed paths.
+        """
+        return evict_cached(
+            self.export_dir, CACHED_PREFIXES, (".pdf",),
+            self.max_files, self.max_bytes, self.max_age, keep,
+        )
+
+    def _reuse(self, path: str) -> bool:
+        try:
+            os.utime(path)  # mark as recently used for eviction
+            return True
+        except FileNotFoundError:
+            return False
+
+    def _build(self, path: str, flowables: Iterable[Flowable]) -> None:
+        story = FlowableStream(flowables) if self.streaming else list(flowables)
+
+        # Render to a private temp file, then publish atomically so
+        # concurrent exports of the same payload never see a partial PDF
+        fd, tmp_path = tempfile.mkstemp(dir=self.export_dir, suffix=".tmp")
+        os.close(fd)
+        try:
+            SimpleDocTemplate(tmp_path, pagesize=A4).build(story)
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+        self.evict(keep=path)
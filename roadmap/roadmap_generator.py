@@ -1,5 +1,52 @@
 # roadmap/roadmap_generator.py
 
+from functools import lru_cache
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence
+
+from product.feature_generator import load_catalog
+from product.keyword_matcher import KeywordMatcher
+from roadmap.capacity_scheduler import CapacityScheduler
+
+
+FRAMEWORKS = ("RICE", "ICE", "MoSCoW", "Kano")
+
+
+# Semantic buckets (category order is priority; no hit → "expansion")
+BUCKET_MATCHER = KeywordMatcher({
+    "foundations": [
+        "onboarding", "activation", "crash", "performance",
+        "startup", "stability", "reliability", "value", "bug"
+    ],
+    "enablement": [
+        "guidance", "nudge", "progress", "engagement",
+        "clarify", "education", "tooltip", "feedback"
+    ],
+    "experimentation": [
+        "experiment", "test", "pilot", "mvp",
+        "hypothesis", "trial", "validate"
+    ],
+})
+
+
+@lru_cache(maxsize=16384)
+def _match_bucket(feature: str) -> str:
+    return BUCKET_MATCHER.first(feature.lower(), default="expansion")
+
+
+@lru_cache(maxsize=None)
+def bucket_index() -> Dict[str, str]:
+    """
+    Feature → bucket for every feature the default catalog can emit,
+    computed once. Features outside the catalog go through an LRU cache.
+    """
+    return {feature: _match_bucket(feature) for feature in load_catalog().features}
+
+
+def bucket_of(feature: str) -> str:
+    bucket = bucket_index().get(feature)
+    return bucket if bucket is not None else _match_bucket(feature)
+
+
 class RoadmapGenerator:
     """
     Framework-aware 6-month Product Roadmap Generator
@@ -12,6 +59,61 @@ class RoadmapGenerator:
     """
 
     def generate(self, scored_features, framework="RICE"):
+        return self._shape(self._bucket(self._normalize(scored_features)), framework)
+
+    def generate_many(
+        self,
+        scored_lists: Iterable,
+        frameworks: Optional[Sequence[str]] = None,
+    ) -> List[Dict[str, Dict[str, List[str]]]]:
+        """
+        Roadmaps for many analyses under every framework in one pass.
+
+        Each feature list is bucketed once (identical lists only once per
+        call) through the shared feature → bucket index, then shaped for
+        each framework.
+
+        Returns:
+            list: One {framework: roadmap} dict per input list
+        """
+        frameworks = FRAMEWORKS if frameworks is None else tuple(frameworks)
+        bucketed = {}
+        results = []
+
+        for scored_features in scored_lists:
+            features = tuple(self._normalize(scored_features))
+
+            buckets = bucketed.get(features)
+            if buckets is None:
+                buckets = bucketed[features] = self._bucket(features)
+
+            results.append({
+                framework: self._shape(buckets, framework)
+                for framework in frameworks
+            })
+
+        return results
+
+    def schedule(
+        self,
+        scored_features,
+        capacity_per_period: float,
+        periods: int = 2,
+        effort: Optional[Mapping[str, float]] = None,
+        dependencies: Optional[Mapping[str, Iterable[str]]] = None,
+    ) -> Dict[str, List[str]]:
+        """
+        Capacity-aware roadmap: packs the ranked features into `periods`
+        quarters of `capacity_per_period` effort each (see CapacityScheduler)
+        instead of the fixed semantic Q1 / Q2 split. `dependencies` may be
+        a plain dict or a DependencyGraph kept up to date across edits.
+        """
+        return CapacityScheduler(capacity_per_period, periods).schedule(
+            self._normalize(scored_features), effort, dependencies
+        )
+
+    @staticmethod
+    def _normalize(scored_features) -> List[str]:
         # --------------------------------------------------
         # Normalize input to List[str]
         # --------------------------------------------------
@@ -33,37 +135,31 @@ class RoadmapGenerator:
         else:
             raise ValueError("Unsupported scored_features type passed to RoadmapGenerator")
 
+        return features
+
+    @staticmethod
+    def _bucket(features: Iterable[str]) -> Dict[str, List[str]]:
         # --------------------------------------------------
         # Bucket features (semantic grouping)
         # --------------------------------------------------
-        foundations = []
-        enablement = []
-        experimentation = []
-        expansion = []
+        buckets = {
+            "foundations": [],
+            "enablement": [],
+            "experimentation": [],
+            "expansion": [],
+        }
 
         for feature in features:
-            text = feature.lower()
-
-            if any(k in text for k in [
-                "onboarding", "activation", "crash", "performance",
-                "startup", "stability", "reliability", "value", "bug"
-            ]):
-                foundations.append(feature)
-
-            elif any(k in text for k in [
-                "guidance", "nudge", "progress", "engagement",
-                "clarify", "education", "tooltip", "feedback"
-            ]):
-                enablement.append(feature)
-
-            elif any(k in text for k in [
-                "experiment", "test", "pilot", "mvp",
-                "hypothesis", "trial", "validate"
-            ]):
-                experimentation.append(feature)
+            buckets[bucket_of(feature)].append(feature)
 
-            else:
-                expansion.append(feature)
+        return buckets
+
+    @staticmethod
+    def _shape(buckets: Dict[str, List[str]], framework: str) -> Dict[str, List[str]]:
+        foundations = buckets["foundations"]
+        enablement = buckets["enablement"]
+        experimentation = buckets["experimentation"]
+        expansion = buckets["expansion"]
 
         # --------------------------------------------------
         # Framework-specific roadmap shaping
@@ -74,7 +170,7 @@ class RoadmapGenerator:
                     experimentation + enablement + foundations
                 ),
                 "Q2 (3–6 months) — Scale What Works": (
-                    expansion
+                    list(expansion)
                 )
             }
 
@@ -84,14 +180,14 @@ class RoadmapGenerator:
                     foundations + enablement
                 ),
                 "Q2 (3–6 months) — Delight & Differentiate": (
-                    expansion
+                    list(expansion)
                 )
             }
 
         if framework == "MoSCoW":
             return {
                 "Q1 (0–3 months) — Deliver Must-Haves": (
-                    foundations
+                    list(foundations)
                 ),
                 "Q2 (3–6 months) — Expand Scope": (
                     enablement + expansion
@@ -106,6 +202,6 @@ class RoadmapGenerator:
                 foundations + enablement
             ),
             "Q2 (3–6 months) — Compound Impact": (
-                expansion
+                list(expansion)
             )
         }
@@ -0,0 +1,220 @@
+from itertools import repeat
+from typing import Dict, Iterable, List, Optional
+import json
+import os
+import tempfile
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow is optional; Parquet export is then unavailable
+    pa = None
+    pa_csv = None
+    pq = None
+
+from roadmap.roadmap_exporter import (
+    MAX_CACHED_AGE_SECONDS,
+    MAX_CACHED_BYTES,
+    MAX_CACHED_FILES,
+    evict_cached,
+    payload_digest,
+)
+
+
+# One row per prioritized feature per analysis
+COLUMNS = (
+    "analysis_id",
+    "framework",
+    "problem_type",
+    "phase",
+    "rank",
+    "feature",
+    "score",
+    "score_label",
+)
+
+FORMATS = {"jsonl": ".jsonl", "csv": ".csv", "parquet": ".parquet"}
+
+CACHED_PREFIX = "pm_gpt_analyses_"
+
+
+def analysis_columns(analyses: Iterable[dict], analysis_ids: Optional[Iterable[str]] = None) -> Dict[str, list]:
+    """
+    Flatten analysis payloads (AnalysisResult.to_payload()) into columns.
+
+    `phase` is the roadmap phase holding the feature (None if the roadmap
+    leaves it out). Numeric scores go to `score`, categorical ones (MoSCoW,
+    Kano) to `score_label`. Analysis ids default to the payload content
+    hash, matching the exported PDF's name.
+    """
+    analyses = list(analyses)
+    ids = list(analysis_ids) if analysis_ids is not None else [payload_digest(a) for a in analyses]
+    columns = {name: [] for name in COLUMNS}
+
+    for analysis, analysis_id in zip(analyses, ids):
+        rows = analysis.get("prioritization") or []
+        n = len(rows)
+
+        problem = analysis.get("problem")
+        problem_type = problem.get("problem_type") if isinstance(problem, dict) else None
+
+        phase_of = {}
+        for phase, items in (analysis.get("roadmap") or {}).items():
+            for item in items:
+                phase_of.setdefault(item, phase)
+
+        features = [row.get("feature", "") for row in rows]
+        scores = [row.get("score") for row in rows]
+
+        columns["analysis_id"].extend(repeat(analysis_id, n))
+        columns["framework"].extend(repeat(analysis.get("framework"), n))
+        columns["problem_type"].extend(repeat(problem_type, n))
+        columns["phase"].extend(map(phase_of.get, features))
+        columns["rank"].extend(range(1, n + 1))
+        columns["feature"].extend(features)
+        columns["score"].extend(
+            float(s) if isinstance(s, (int, float)) and not isinstance(s, bool) else None
+            for s in scores
+        )
+        columns["score_label"].extend(s if isinstance(s, str) else None for s in scores)
+
+    return columns
+
+
+def arrow_table(columns: Dict[str, list], score_type=None):
+    if pa is None:
+        raise ImportError("Arrow / Parquet export requires pyarrow (pip install pyarrow)")
+
+    schema = pa.schema([
+        ("analysis_id", pa.string()),
+        ("framework", pa.string()),
+        ("problem_type", pa.string()),
+        ("phase", pa.string()),
+        ("rank", pa.int32()),
+        ("feature", pa.string()),
+        ("score", score_type or pa.float64()),
+        ("score_label", pa.string()),
+    ])
+    return pa.table([columns[name] for name in COLUMNS], schema=schema)
+
+
+def _csv_score(score: Optional[float]) -> Optional[str]:
+    # Shortest round-trip text, whichever CSV writer is used
+    return None if score is None else repr(score)
+
+
+def _csv_field(value) -> str:
+    # Same dialect as pyarrow's writer: strings quoted, ints bare, null empty
+    if value is None:
+        return ""
+    if isinstance(value, str):
+        return '"' + value.replace('"', '""') + '"'
+    return str(value)
+
+
+class StructuredExporter:
+    """
+    Machine-readable exports of many analyses: JSON Lines, CSV or Parquet.
+
+    Every format is written straight from the column lists (no per-row
+    dicts). Files are content-addressed like the PDFs, so re-exporting the
+    same analyses returns the existing file, and bounded by the same
+    age / count / size eviction policy (see RoadmapExporter).
+    """
+
+    def __init__(
+        self,
+        export_dir: str = "exports",
+        max_files: Optional[int] = MAX_CACHED_FILES,
+        max_bytes: Optional[int] = MAX_CACHED_BYTES,
+        max_age: Optional[float] = MAX_CACHED_AGE_SECONDS,
+    ):
+        os.makedirs(export_dir, exist_ok=True)
+        self.export_dir = export_dir
+        self.max_files = max_files
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+
+    def export(self, analyses: Iterable[dict], fmt: str = "jsonl", analysis_ids: Optional[Iterable[str]] = None) -> str:
+        """
+        Export analysis payloads in one file.
+
+        Args:
+            analyses: Analysis payloads (AnalysisResult.to_payload())
+            fmt (str): "jsonl", "csv" or "parquet"
+            analysis_ids: Optional id per analysis (default: content hash)
+
+        Returns:
+            str: Path of the written (or already existing) file
+        """
+        if fmt not in FORMATS:
+            raise ValueError(f"Unsupported export format: {fmt}")
+
+        columns = analysis_columns(analyses, analysis_ids)
+
+        digest = payload_digest([fmt, columns])
+        path = os.path.join(self.export_dir, f"{CACHED_PREFIX}{digest}{FORMATS[fmt]}")
+        try:
+            os.utime(path)  # mark as recently used for eviction
+            return path
+        except FileNotFoundError:
+            pass
+
+        fd, tmp_path = tempfile.mkstemp(dir=self.export_dir, suffix=".tmp")
+        os.close(fd)
+        try:
+            getattr(self, f"write_{fmt}")(columns, tmp_path)
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+        self.evict(keep=path)
+        return path
+
+    def evict(self, keep: Optional[str] = None) -> List[str]:
+        """
+        Apply the age / count / size limits to exported files; returns
+        removed paths.
+        """
+        return evict_cached(
+            self.export_dir, (CACHED_PREFIX,), tuple(FORMATS.values()),
+            self.max_files, self.max_bytes, self.max_age, keep,
+        )
+
+    # --------------------------------------------------
+    # WRITERS
+    # --------------------------------------------------
+    @staticmethod
+    def write_jsonl(columns: Dict[str, list], path: str) -> None:
+        # Encode column by column, then stitch each line from a template
+        encoded: List[List[str]] = [
+            [json.dumps(value, ensure_ascii=False) for value in columns[name]]
+            for name in COLUMNS
+        ]
+        line = "{" + ",".join(f'"{name}":%s' for name in COLUMNS) + "}\n"
+
+        with open(path, "w", encoding="utf-8") as f:
+            f.writelines(line % values for values in zip(*encoded))
+
+    @staticmethod
+    def write_csv(columns: Dict[str, list], path: str) -> None:
+        # Scores are formatted here, not by the writer, so the file is
+        # byte-identical with or without pyarrow
+        columns = {**columns, "score": [_csv_score(s) for s in columns["score"]]}
+
+        if pa_csv is not None:
+            pa_csv.write_csv(arrow_table(columns, score_type=pa.string()), path)
+            return
+
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            f.write(",".join(_csv_field(name) for name in COLUMNS) + "\n")
+            f.writelines(
+                ",".join(map(_csv_field, row)) + "\n"
+                for row in zip(*(columns[name] for name in COLUMNS))
+            )
+
+    @staticmethod
+    def write_parquet(columns: Dict[str, list], path: str) -> None:
+        pq.write_table(arrow_table(columns), path)
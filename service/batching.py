@@ -0,0 +1,77 @@
+import asyncio
+from concurrent.futures import Executor
+from typing import Any, Callable, List, Optional, Set, Tuple
+
+
+class MicroBatcher:
+    """
+    Coalesces concurrent requests into one batched call.
+
+    Each submit() waits at most `window` seconds (or until `max_batch`
+    items are queued); then the whole batch goes through `handler`, a
+    synchronous function mapping a list of items to a list of results in
+    the same order. The handler runs in `executor` (default: the loop's
+    thread pool), so the event loop keeps serving other requests while a
+    batch is processed. Must be used from a single event loop.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[List[Any]], List[Any]],
+        window: float = 0.005,
+        max_batch: int = 64,
+        executor: Optional[Executor] = None,
+    ):
+        self.handler = handler
+        self.window = window
+        self.max_batch = max_batch
+        self.executor = executor
+
+        self._pending: List[Tuple[Any, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._running: Set[asyncio.Task] = set()
+
+    async def submit(self, item: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((item, future))
+
+        if len(self._pending) >= self.max_batch:
+            self.flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self.flush)
+
+        return await future
+
+    def flush(self) -> None:
+        """
+        Dispatch every queued item to the handler now (without waiting).
+        """
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+
+        # Keep a reference so the task is not garbage-collected mid-batch
+        task = asyncio.ensure_future(self._run(batch))
+        self._running.add(task)
+        task.add_done_callback(self._running.discard)
+
+    async def _run(self, batch: List[Tuple[Any, asyncio.Future]]) -> None:
+        loop = asyncio.get_running_loop()
+        items = [item for item, _ in batch]
+
+        try:
+            results = await loop.run_in_executor(self.executor, self.handler, items)
+        except Exception as exc:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():  # caller may have been cancelled
+                future.set_result(result)
@@ -0,0 +1,232 @@
+import argparse
+import asyncio
+import json
+import os
+import signal
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, List, Optional, Union
+
+import tornado.web
+
+from pipeline.analysis import default_pipeline
+from pipeline.batch_pipeline import BatchPipeline
+from roadmap.roadmap_exporter import RoadmapExporter
+from roadmap.roadmap_generator import FRAMEWORKS
+from service.batching import MicroBatcher
+
+
+# Bytes per write when streaming a PDF back
+EXPORT_CHUNK_SIZE = 64 * 1024
+
+
+# --------------------------------------------------
+# WORKER-POOL JOBS (run in child processes)
+# --------------------------------------------------
+def cluster_job(texts: List[str], num_clusters: Union[int, str], framework: str) -> List[Dict]:
+    return BatchPipeline(num_clusters=num_clusters, framework=framework).process_chunk(0, texts)
+
+
+def export_job(analysis: dict, export_dir: str) -> str:
+    return RoadmapExporter(export_dir).export_full_analysis(analysis)
+
+
+def analyze_batch(items: List[tuple]) -> list:
+    """
+    MicroBatcher handler: [(problem_text, framework), ...] → AnalysisResults.
+    """
+    texts = [text for text, _ in items]
+    frameworks = [framework for _, framework in items]
+    return default_pipeline().analyze_many(texts, frameworks)
+
+
+# --------------------------------------------------
+# HANDLERS
+# --------------------------------------------------
+class BaseHandler(tornado.web.RequestHandler):
+
+    def json_body(self) -> dict:
+        try:
+            body = json.loads(self.request.body or b"{}")
+        except ValueError:
+            raise tornado.web.HTTPError(400, reason="Request body must be JSON")
+
+        if not isinstance(body, dict):
+            raise tornado.web.HTTPError(400, reason="Request body must be a JSON object")
+        return body
+
+    def problem_text(self, body: dict) -> str:
+        text = body.get("problem_text")
+        if not isinstance(text, str) or not text.strip():
+            raise tornado.web.HTTPError(400, reason="'problem_text' is required")
+        return text
+
+    def framework(self, body: dict, default: Optional[str] = None) -> Optional[str]:
+        framework = body.get("framework", default)
+        if framework is not None and framework not in FRAMEWORKS:
+            raise tornado.web.HTTPError(
+                400, reason=f"'framework' must be one of {', '.join(FRAMEWORKS)}"
+            )
+        return framework
+
+    async def run_in_pool(self, fn, *args):
+        pool = self.settings["pool"]
+        return await asyncio.get_running_loop().run_in_executor(pool, fn, *args)
+
+    def write_error(self, status_code: int, **kwargs) -> None:
+        self.finish({"error": self._reason})
+
+
+class AnalyzeHandler(BaseHandler):
+    """
+    POST {"problem_text": ..., "framework": optional} → analysis payload.
+    """
+
+    async def post(self):
+        body = self.json_body()
+        item = (self.problem_text(body), self.framework(body))
+
+        result = await self.settings["batcher"].submit(item)
+        self.write(result.to_payload())
+
+
+class ClusterHandler(BaseHandler):
+    """
+    POST {"texts": [...], "num_clusters": 3 | "auto", "framework": optional}
+    → one analysed record per feedback cluster (see BatchPipeline).
+    """
+
+    async def post(self):
+        body = self.json_body()
+
+        texts = body.get("texts")
+        if not isinstance(texts, list) or not all(isinstance(t, str) for t in texts):
+            raise tornado.web.HTTPError(400, reason="'texts' must be a list of strings")
+
+        num_clusters = body.get("num_clusters", 3)
+        if num_clusters != "auto" and not (isinstance(num_clusters, int) and num_clusters >= 1):
+            raise tornado.web.HTTPError(400, reason="'num_clusters' must be >= 1 or 'auto'")
+
+        framework = self.framework(body, default="RICE")
+
+        clusters = await self.run_in_pool(cluster_job, texts, num_clusters, framework)
+        self.write({"clusters": clusters})
+
+
+class ExportHandler(BaseHandler):
+    """
+    POST {"analysis": payload} or {"problem_text": ..., "framework": optional}
+    → the PDF itself (application/pdf, streamed in chunks).
+    """
+
+    async def post(self):
+        body = self.json_body()
+
+        analysis = body.get("analysis")
+        if analysis is None:
+            item = (self.problem_text(body), self.framework(body))
+            analysis = (await self.settings["batcher"].submit(item)).to_payload()
+        elif not isinstance(analysis, dict):
+            raise tornado.web.HTTPError(400, reason="'analysis' must be a JSON object")
+
+        path = await self.run_in_pool(export_job, analysis, self.settings["export_dir"])
+
+        self.set_header("Content-Type", "application/pdf")
+        self.set_header("Content-Disposition", f'attachment; filename="{os.path.basename(path)}"')
+
+        with open(path, "rb") as f:
+            while True:
+                chunk = f.read(EXPORT_CHUNK_SIZE)
+                if not chunk:
+                    break
+                self.write(chunk)
+                await self.flush()
+
+
+def make_app(
+    workers: Optional[int] = None,
+    batch_window: float = 0.005,
+    max_batch: int = 64,
+    export_dir: str = "exports",
+) -> tornado.web.Application:
+    """
+    Build the service. /analyze requests arriving within `batch_window`
+    seconds are analysed together on a background thread; clustering and
+    PDF export run in a process pool. None of them block the event loop.
+    """
+    batch_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="analyze-batch")
+
+    return tornado.web.Application(
+        [
+            (r"/analyze", AnalyzeHandler),
+            (r"/cluster", ClusterHandler),
+            (r"/export", ExportHandler),
+        ],
+        batcher=MicroBatcher(
+            analyze_batch, window=batch_window, max_batch=max_batch, executor=batch_pool
+        ),
+        batch_pool=batch_pool,
+        pool=ProcessPoolExecutor(max_workers=workers),
+        export_dir=export_dir,
+    )
+
+
+# --------------------------------------------------
+# CLI
+# --------------------------------------------------
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Serve the PM-GPT pipeline over HTTP.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8888)
+    parser.add_argument(
+        "--workers", type=int, default=None,
+        help="Processes for clustering / PDF export (default: CPU count)"
+    )
+    parser.add_argument(
+        "--batch-window-ms", type=float, default=5.0,
+        help="How long /analyze requests wait to be batched together"
+    )
+    parser.add_argument(
+        "--max-batch", type=int, default=64,
+        help="Flush a batch early once this many requests are queued"
+    )
+    parser.add_argument("--export-dir", default="exports")
+    return parser.parse_args(argv)
+
+
+async def serve(args) -> None:
+    app = make_app(
+        workers=args.workers,
+        batch_window=args.batch_window_ms / 1000,
+        max_batch=args.max_batch,
+        export_dir=args.export_dir,
+    )
+    app.listen(args.port, address=args.host)
+    print(f"🚀 PM-GPT service listening on http://{args.host}:{args.port}", file=sys.stderr)
+
+    # Stop cleanly on SIGTERM too, so pool workers are not orphaned
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop.set)
+        except NotImplementedError:  # Windows
+            pass
+
+    try:
+        await stop.wait()
+    finally:
+        app.settings["pool"].shutdown(cancel_futures=True)
+        app.settings["batch_pool"].shutdown(cancel_futures=True)
+
+
+def main(argv=None) -> int:
+    try:
+        asyncio.run(serve(parse_args(argv)))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,61 @@
+import unittest
+from pipeline.analysis import analyze, analyze_many
+from product.problem_mapper import normalize_problem_text
+
+
+class TestAnalysis(unittest.TestCase):
+
+    def test_payload_matches_app_shape(self):
+        result = analyze("  Users abandon onboarding due to unclear verification steps ")
+        payload = result.to_payload()
+
+        self.assertEqual(
+            set(payload),
+            {"problem", "features", "framework", "framework_explanation",
+             "prioritization", "roadmap", "reasoning", "judgment"}
+        )
+        self.assertEqual(
+            payload["problem"]["raw_signal"],
+            "Users abandon onboarding due to unclear verification steps"
+        )
+        self.assertEqual(len(result.prioritization), len(result.features))
+
+    def test_manual_framework_is_respected(self):
+        result = analyze("The dashboard is very slow to load", framework="MoSCoW")
+
+        self.assertEqual(result.framework, "MoSCoW")
+        self.assertEqual(result.prioritization[0]["score"], "Must Have")
+
+    def test_analyze_many_matches_analyze(self):
+        texts = [
+            "Users abandon onboarding due to unclear verification steps",
+            "The dashboard is very slow to load",
+            "  users abandon onboarding due to unclear verification steps",
+            "Users churn after the trial ends",
+            "Pricing page conversion is low",
+        ]
+        frameworks = [None, "ICE", None, "Kano", "MoSCoW"]
+
+        for text, framework, result in zip(texts, frameworks, analyze_many(texts, frameworks)):
+            self.assertEqual(result.to_payload(), analyze(text, framework).to_payload())
+
+    def test_result_ignores_case_and_whitespace(self):
+        raw = "We have to PRIORITIZE\nbetween  two ideas"
+        normalized = normalize_problem_text(raw)
+
+        expected = analyze(normalized).to_payload()
+        for payload in (analyze(raw).to_payload(), analyze_many([raw])[0].to_payload()):
+            self.assertEqual(payload["problem"]["raw_signal"], raw)
+            payload["problem"]["raw_signal"] = normalized
+            self.assertEqual(payload, expected)
+
+    def test_result_is_slotted(self):
+        result = analyze("slow app")
+
+        self.assertFalse(hasattr(result, "__dict__"))
+        with self.assertRaises(AttributeError):
+            result.extra = 1
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+import contextlib
+import csv
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from main import main
+from pipeline.batch_pipeline import BatchPipeline
+
+
+FEEDBACK = [
+    "payment failed again at checkout",
+    "checkout payment keeps failing",
+    "search results are inaccurate",
+    "cannot find products using search",
+    "payment declined during checkout",
+    "search shows irrelevant products",
+    "the dashboard is very slow to load",
+]
+
+
+def chunked(texts, size):
+    return [texts[i:i + size] for i in range(0, len(texts), size)]
+
+
+class TestBatchPipeline(unittest.TestCase):
+
+    def run_pipeline(self, pipeline, chunks):
+        out = io.StringIO()
+        totals = pipeline.run(chunks, out)
+        return totals, [json.loads(line) for line in out.getvalue().splitlines()]
+
+    def test_incremental_run_flushes_held_back_feedback(self):
+        # 3 texts in chunks of 2 never reach 4 clusters before end of input
+        pipeline = BatchPipeline(num_clusters=4, incremental=True)
+        totals, records = self.run_pipeline(pipeline, chunked(FEEDBACK[:3], 2))
+
+        self.assertEqual(totals["rows"], 3)
+        self.assertEqual(totals["clusters"], len(records))
+        self.assertEqual(sum(r["size"] for r in records), 3)
+        self.assertTrue(all(r["chunk"] == 1 for r in records))
+
+    def test_incremental_run_covers_every_row(self):
+        pipeline = BatchPipeline(num_clusters=3, incremental=True)
+        totals, records = self.run_pipeline(pipeline, chunked(FEEDBACK, 2))
+
+        self.assertEqual(totals, {"rows": 7, "chunks": 4, "clusters": len(records)})
+        self.assertEqual(sum(r["size"] for r in records), len(FEEDBACK))
+
+    def test_chunk_records(self):
+        pipeline = BatchPipeline(num_clusters=2, framework="MoSCoW")
+        totals, records = self.run_pipeline(pipeline, [FEEDBACK[:4], [], FEEDBACK[4:]])
+
+        self.assertEqual(totals, {"rows": 7, "chunks": 3, "clusters": len(records)})
+        self.assertEqual({r["chunk"] for r in records}, {0, 2})
+        self.assertEqual(sum(r["size"] for r in records), len(FEEDBACK))
+
+        for record in records:
+            self.assertEqual(record["framework"], "MoSCoW")
+            self.assertTrue(record["features"])
+            self.assertEqual(
+                sorted(row["feature"] for row in record["prioritization"]),
+                sorted(record["features"])
+            )
+            self.assertLessEqual(len(record["examples"]), 3)
+            self.assertTrue(-1 <= record["avg_sentiment"] <= 1)
+
+    def test_cli_end_to_end(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            source = os.path.join(tmp, "reviews.csv")
+            output = os.path.join(tmp, "clusters.jsonl")
+
+            with open(source, "w", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f)
+                writer.writerow(["id", "review"])
+                for i, text in enumerate(FEEDBACK + [""]):
+                    writer.writerow([i, text])
+
+            stderr = io.StringIO()
+            with contextlib.redirect_stderr(stderr):
+                code = main([source, "-o", output, "--chunk-size", "3", "--clusters", "2"])
+
+            with open(output, encoding="utf-8") as f:
+                records = [json.loads(line) for line in f]
+
+        self.assertEqual(code, 0)
+        self.assertEqual([r["chunk"] for r in records], sorted(r["chunk"] for r in records))
+        self.assertEqual(sum(r["size"] for r in records), len(FEEDBACK))
+        self.assertIn(
+            f"processed 7 feedback rows in 3 chunks → {len(records)} problem clusters",
+            stderr.getvalue()
+        )
+
+    def test_cli_rejects_non_positive_chunk_size(self):
+        for value in ("0", "-3", "abc"):
+            stderr = io.StringIO()
+            with contextlib.redirect_stderr(stderr), self.assertRaises(SystemExit) as exit:
+                main(["reviews.csv", "--chunk-size", value])
+
+            self.assertEqual(exit.exception.code, 2)
+            self.assertIn("--chunk-size", stderr.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+import random
+import unittest
+
+from roadmap.capacity_scheduler import BACKLOG_LABEL, CapacityScheduler
+from roadmap.dependency_graph import DependencyCycleError
+from roadmap.roadmap_generator import RoadmapGenerator
+
+
+class TestCapacityScheduler(unittest.TestCase):
+
+    def test_packs_by_priority_within_capacity(self):
+        effort = {"a": 3, "b": 2, "c": 2, "d": 1, "e": 5}
+        scheduler = CapacityScheduler(capacity_per_period=4, periods=2)
+
+        roadmap = scheduler.schedule(list(effort), effort=effort)
+
+        self.assertEqual(roadmap, {
+            "Q1 (0–3 months)": ["a", "d"],
+            "Q2 (3–6 months)": ["b", "c"],
+            BACKLOG_LABEL: ["e"],
+        })
+
+    def test_dependencies_never_scheduled_earlier(self):
+        effort = {"a": 4, "b": 1, "c": 1}
+        dependencies = {"a": ["c"], "b": ["a"]}
+
+        periods = CapacityScheduler(4, periods=3).assign(list(effort), effort, dependencies)
+
+        self.assertEqual(periods, {"c": 0, "a": 1, "b": 2})
+
+    def test_dependents_of_backlog_items_are_backlogged(self):
+        periods = CapacityScheduler(2, periods=2).assign(
+            ["big", "small"], {"big": 3, "small": 1}, {"small": ["big"]}
+        )
+        self.assertEqual(periods, {"big": None, "small": None})
+
+    def test_duplicate_features_are_scheduled_once(self):
+        periods = CapacityScheduler(4).assign(["a", "a"], {"a": 3})
+        self.assertEqual(periods, {"a": 0})
+
+        roadmap = RoadmapGenerator().schedule(
+            ["a", "b", "a"], 3, effort={"a": 2, "b": 2}, dependencies={"a": ["b"]}
+        )
+        self.assertEqual(roadmap, {
+            "Q1 (0–3 months)": ["b"],
+            "Q2 (3–6 months)": ["a"],
+            BACKLOG_LABEL: [],
+        })
+
+    def test_cycle_raises(self):
+        with self.assertRaises(ValueError):
+            CapacityScheduler(4).assign(["a", "b"], dependencies={"a": ["b"], "b": ["a"]})
+
+    def test_cycle_behind_schedulable_features_raises_instead_of_partial_schedule(self):
+        features = ["free", "a", "b", "c", "after"]
+        dependencies = {
+            "a": iter(["c"]),          # one-shot iterables are read only once
+            "b": iter(["a"]),
+            "c": iter(["b", "free"]),
+            "after": iter(["a"]),
+        }
+
+        with self.assertRaises(DependencyCycleError) as ctx:
+            CapacityScheduler(10, periods=2).assign(features, dependencies=dependencies)
+
+        cycle = ctx.exception.cycle
+        self.assertEqual(cycle[0], cycle[-1])
+        self.assertEqual(sorted(cycle[:-1]), ["a", "b", "c"])
+        for requirement, feature in zip(cycle, cycle[1:]):
+            self.assertIn((feature, requirement), {("a", "c"), ("b", "a"), ("c", "b")})
+
+    def test_random_backlog_respects_capacity_and_dependencies(self):
+        rng = random.Random(7)
+        features = [f"feature {i}" for i in range(2000)]
+        effort = {f: rng.randint(1, 4) for f in features}
+        dependencies = {
+            f: rng.sample(features[:i], min(i, rng.randint(0, 2)))
+            for i, f in enumerate(features)
+        }
+
+        periods = CapacityScheduler(400, periods=6).assign(features, effort, dependencies)
+
+        load = [0] * 6
+        for feature, period in periods.items():
+            if period is None:
+                continue
+            load[period] += effort[feature]
+            for requirement in dependencies[feature]:
+                self.assertIsNotNone(periods[requirement])
+                self.assertLessEqual(periods[requirement], period)
+        self.assertTrue(all(total <= 400 for total in load))
+
+    def test_generator_defaults_to_rice_effort(self):
+        scored = [{"feature": "Simplify onboarding steps", "score": 9},
+                  {"feature": "Run a pilot test", "score": 5}]
+
+        roadmap = RoadmapGenerator().schedule(scored, capacity_per_period=8)
+
+        scheduled = [f for items in roadmap.values() for f in items]
+        self.assertEqual(sorted(scheduled), sorted(s["feature"] for s in scored))
+        self.assertEqual(roadmap[BACKLOG_LABEL], [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+import json
+import os
+import tempfile
+import unittest
+from nlp.clustering import ProblemClusterer
+
+
+FEEDBACK = [
+    "payment failed again at checkout",
+    "checkout payment keeps failing",
+    "search results are inaccurate",
+    "cannot find products using search",
+    "payment declined during checkout",
+    "search shows irrelevant products",
+]
+
+
+class TestProblemClusterer(unittest.TestCase):
+
+    def test_partial_cluster_holds_back_until_initialized(self):
+        clusterer = ProblemClusterer(num_clusters=2)
+
+        self.assertEqual(clusterer.partial_cluster(FEEDBACK[:1]), {})
+
+        clusters = clusterer.partial_cluster(FEEDBACK[1:4])
+        assigned = sorted(t for items in clusters.values() for t in items)
+        self.assertEqual(assigned, sorted(FEEDBACK[:4]))
+
+    def test_partial_cluster_updates_existing_clusters(self):
+        clusterer = ProblemClusterer(num_clusters=2)
+        first = clusterer.partial_cluster(FEEDBACK[:4])
+        second = clusterer.partial_cluster(FEEDBACK[4:])
+
+        self.assertTrue(set(second) <= set(first))
+        self.assertEqual(sum(len(v) for v in second.values()), 2)
+
+    def test_finalize_flushes_held_back_texts(self):
+        clusterer = ProblemClusterer(num_clusters=4)
+
+        self.assertEqual(clusterer.partial_cluster(FEEDBACK[:2]), {})
+        self.assertEqual(clusterer.partial_cluster(FEEDBACK[2:3]), {})
+
+        clusters = clusterer.finalize()
+        assigned = sorted(t for items in clusters.values() for t in items)
+        self.assertEqual(assigned, sorted(FEEDBACK[:3]))
+        self.assertEqual(clusterer.finalize(), {})
+
+    def test_final_batch_after_initialization(self):
+        clusterer = ProblemClusterer(num_clusters=2)
+        clusterer.partial_cluster(FEEDBACK[:4])
+
+        clusters = clusterer.partial_cluster(FEEDBACK[4:5], final=True)
+        self.assertEqual(sum(len(v) for v in clusters.values()), 1)
+
+    def test_fewer_texts_than_clusters(self):
+        clusters = ProblemClusterer(num_clusters=5).cluster(FEEDBACK[:2])
+        self.assertEqual(len(clusters), 2)
+
+    def test_auto_k_is_cached_per_corpus(self):
+        clusters = ProblemClusterer(num_clusters="auto").cluster(FEEDBACK)
+        self.assertGreaterEqual(len(clusters), 2)
+
+        clusterer = ProblemClusterer(num_clusters="auto")
+        clusterer._sweep_k = lambda vectors: self.fail("sweep should be cached")
+        self.assertEqual(len(clusterer.cluster(FEEDBACK)), len(clusters))
+
+    def test_saved_model_predicts_like_fitted_model(self):
+        clusterer = ProblemClusterer(num_clusters=2)
+        clusterer.cluster(FEEDBACK)
+        expected = clusterer.model.predict(clusterer.vectorizer.transform(FEEDBACK))
+
+        with tempfile.TemporaryDirectory() as path:
+            clusterer.save(path)
+            loaded = ProblemClusterer.load(path)
+            self.assertEqual(loaded.predict(FEEDBACK).tolist(), expected.tolist())
+
+    def test_load_rejects_unknown_format_version(self):
+        clusterer = ProblemClusterer(num_clusters=2)
+        clusterer.cluster(FEEDBACK)
+
+        with tempfile.TemporaryDirectory() as path:
+            clusterer.save(path)
+            with open(os.path.join(path, "manifest.json"), "w") as f:
+                json.dump({"format_version": 999}, f)
+
+            with self.assertRaises(ValueError):
+                ProblemClusterer.load(path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+import random
+import unittest
+
+from roadmap.capacity_scheduler import CapacityScheduler
+from roadmap.dependency_graph import DependencyCycleError, DependencyGraph
+
+
+class TestDependencyGraph(unittest.TestCase):
+
+    def assertTopological(self, graph):
+        order = {feature: i for i, feature in enumerate(graph.topological_order())}
+        self.assertEqual(len(order), len(graph))
+        for feature, requires in graph.items():
+            for requirement in requires:
+                self.assertLess(order[requirement], order[feature])
+
+    def test_order_is_repaired_when_an_edge_breaks_it(self):
+        graph = DependencyGraph(features=["a", "b", "c", "d"])
+
+        graph.add_dependency("a", "d")
+        graph.add_dependency("b", "a")
+
+        self.assertTopological(graph)
+        self.assertEqual(graph.topological_order().index("d"), 0)
+
+    def test_cycle_is_reported_with_its_path(self):
+        graph = DependencyGraph({"b": ["a"], "c": ["b"]})
+
+        with self.assertRaises(DependencyCycleError) as ctx:
+            graph.add_dependency("a", "c")
+
+        self.assertEqual(ctx.exception.cycle, ["a", "b", "c", "a"])
+        self.assertEqual(graph["a"], frozenset())
+        self.assertTopological(graph)
+
+    def test_random_incremental_updates_stay_topological(self):
+        rng = random.Random(3)
+        features = [f"f{i}" for i in range(200)]
+        graph = DependencyGraph(features=features)
+        edges = set()
+
+        for _ in range(1500):
+            feature, requires = rng.sample(features, 2)
+            if edges and rng.random() < 0.3:
+                edge = rng.choice(sorted(edges))
+                graph.remove_dependency(*edge)
+                edges.discard(edge)
+                continue
+            try:
+                graph.add_dependency(feature, requires)
+                edges.add((feature, requires))
+            except DependencyCycleError as error:
+                self.assertEqual(error.cycle[0], error.cycle[-1])
+
+        self.assertEqual(sum(len(r) for r in graph.values()), len(edges))
+        self.assertTopological(graph)
+
+    def test_critical_path_uses_effort(self):
+        graph = DependencyGraph({"b": ["a"], "c": ["a"], "d": ["b", "c"]})
+
+        length, path = graph.critical_path({"a": 1, "b": 5, "c": 2, "d": 1})
+
+        self.assertEqual((length, path), (7.0, ["a", "b", "d"]))
+
+    def test_scheduler_accepts_graph(self):
+        graph = DependencyGraph({"a": ["c"], "b": ["a"]})
+        effort = {"a": 4, "b": 1, "c": 1}
+
+        periods = CapacityScheduler(4, periods=3).assign(["a", "b", "c"], effort, graph)
+
+        self.assertEqual(periods, {"c": 0, "a": 1, "b": 2})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+import os
+import tempfile
+import time
+import unittest
+
+from pipeline.analysis import analyze
+from roadmap.export_queue import ExportQueue
+
+
+class TestExportQueue(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.queue = ExportQueue(export_dir=self.tmp.name, workers=1)
+
+    def tearDown(self):
+        self.queue.shutdown()
+        self.tmp.cleanup()
+
+    def wait(self, job_id, timeout=60):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            status = self.queue.status(job_id)
+            if status["state"] in ("done", "failed"):
+                return status
+            time.sleep(0.05)
+        self.fail("export job did not finish")
+
+    def test_job_writes_pdf_to_export_dir(self):
+        job_id = self.queue.submit(analyze("The dashboard is very slow").to_payload())
+
+        status = self.wait(job_id)
+
+        self.assertEqual(status["state"], "done")
+        self.assertEqual(os.path.dirname(status["path"]), self.tmp.name)
+        self.assertTrue(os.path.getsize(status["path"]) > 0)
+
+    def test_failed_job_reports_error(self):
+        status = self.wait(self.queue.submit(None))
+
+        self.assertEqual(status["state"], "failed")
+        self.assertIn("error", status)
+
+    def test_unknown_job(self):
+        with self.assertRaises(KeyError):
+            self.queue.status("missing")
+
+
+if __name__ == "__main__":
+    unittest.main()
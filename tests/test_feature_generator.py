@@ -0,0 +1,183 @@
+import json
+import os
+import tempfile
+import unittest
+
+from product.feature_generator import (
+    DEFAULT_CATALOG_PATH,
+    FeatureCatalog,
+    FeatureGenerator,
+    load_catalog,
+)
+
+
+# Captured from the hard-coded FeatureGenerator this catalog replaced
+LEGACY_OUTPUT = [
+    (
+        'onboarding', 'Complete KYC before first value',
+        [
+            'Introduce progressive disclosure for compliance steps instead of upfront blocking',
+            'Add real-time validation with explicit failure reasons during document upload',
+            'Provide guided retry paths instead of forcing onboarding restarts',
+            'Display verification status clearly with expected resolution timelines',
+            'Reduce non-essential data collection before first compliance checkpoint',
+        ],
+    ),
+    (
+        'signup', 'Users drop before first value',
+        [
+            'Reduce non-essential fields before the user reaches first value',
+            'Introduce a progressive onboarding flow that unlocks steps only when required',
+            'Display a clear progress indicator tied to first-value completion',
+            'Add inline microcopy explaining why each required step exists',
+            'Surface a first-success confirmation moment to reinforce completion',
+        ],
+    ),
+    (
+        'retention', 'Users churn and stop their weekly habit',
+        [
+            'Introduce early-warning signals to detect disengaging users',
+            'Trigger re-engagement nudges based on drop-off behavior patterns',
+            'Add habit-forming reminders tied to core value moments',
+            'Personalize workflows based on prior usage behavior',
+            'Create lightweight win-back flows for inactive users',
+            'Replace generic notifications with lifecycle-based messaging',
+        ],
+    ),
+    (
+        'churn', 'Users leave when the trial ends',
+        [
+            'Clarify feature gating with in-context previews of locked value',
+            'Surface upgrade prompts only after users experience core value',
+            'Align pricing tiers with observed usage patterns',
+            'Reduce surprise paywalls by signaling limitations earlier',
+            'Introduce time-bound upgrade nudges based on value realization',
+        ],
+    ),
+    (
+        'latency', 'Pages time out',
+        [
+            'Instrument latency and failure metrics across critical user flows',
+            'Introduce graceful degradation when non-critical services fail',
+            'Add user-visible system status indicators during outages',
+            'Prioritize reliability improvements over feature expansion',
+            'Create automated alerts tied to user-impact thresholds',
+        ],
+    ),
+    (
+        'delivery', 'Roadmap keeps slipping',
+        [
+            'Introduce a single-owner model for roadmap commitments',
+            'Establish must-ship vs nice-to-have delivery tiers',
+            'Limit work-in-progress to reduce context switching',
+            'Create quarterly delivery confidence checkpoints',
+            'Align roadmap planning with engineering capacity forecasts',
+        ],
+    ),
+    (
+        'nps', 'Complaints are rising',
+        [
+            'Collect contextual feedback immediately after key interactions',
+            'Personalize workflows based on user preferences',
+            'Reduce friction in commonly repeated actions',
+            'Introduce delight moments in high-frequency flows',
+            'Close the feedback loop by visibly acting on user input',
+        ],
+    ),
+    (
+        'growth', 'Signups stall',
+        [
+            'Optimize conversion points by reducing cognitive load',
+            'Introduce referral or viral loops tied to core value moments',
+            'Experiment with pricing or packaging for expansion revenue',
+            'Improve activation-to-conversion handoff',
+            'Instrument growth experiments with clear success metrics',
+        ],
+    ),
+    (
+        'something new', 'Unclear problem',
+        [
+            'Clarify the primary user value being delivered',
+            'Reduce friction in the most frequently used workflows',
+            'Introduce feedback loops to validate user impact',
+            'Prioritize changes tied to measurable outcomes',
+        ],
+    ),
+]
+
+
+class TestFeatureCatalog(unittest.TestCase):
+
+    def setUp(self):
+        self.generator = FeatureGenerator()
+
+    def test_matches_legacy_hardcoded_output(self):
+        for problem_type, summary, expected in LEGACY_OUTPUT:
+            with self.subTest(problem_type=problem_type):
+                self.assertEqual(self.generator.generate(problem_type, summary), expected)
+
+    def test_default_catalog_is_loaded_once(self):
+        catalog = load_catalog()
+
+        self.assertIs(catalog, load_catalog(DEFAULT_CATALOG_PATH))
+        self.assertIs(self.generator.catalog, catalog)
+        self.assertEqual(len(catalog.features), len(set(catalog.features)))
+
+    def test_aliases_and_input_normalization(self):
+        catalog = load_catalog()
+        onboarding = catalog.lookup("onboarding", "activation", "speed")
+
+        for label in ("signup", "KYC", "  Activation "):
+            self.assertIs(catalog.lookup(label, "activation", "speed"), onboarding)
+        self.assertIs(catalog.lookup("unheard of", "general", "speed"), catalog.default)
+        self.assertIs(catalog.lookup(None, "general", "speed"), catalog.default)
+
+    def test_generate_many_matches_generate(self):
+        items = [(t, s) for t, s, _ in LEGACY_OUTPUT] + [("growth", None)]
+
+        many = self.generator.generate_many(items)
+
+        self.assertEqual([list(f) for f in many], [self.generator.generate(t, s) for t, s in items])
+        self.assertIsInstance(many[0], tuple)
+
+    def test_first_matching_when_rule_wins(self):
+        catalog = FeatureCatalog({
+            "features": {
+                "growth": [
+                    {"when": {"funnel": "monetization", "risk": "revenue"}, "features": ["both"]},
+                    {"when": {"risk": "revenue"}, "features": ["risk only"]},
+                    {"features": ["fallback"]},
+                ],
+                "delivery": [{"when": {"funnel": "activation"}, "features": ["no fallback"]}],
+            },
+            "default": ["default"],
+        })
+
+        self.assertEqual(catalog.lookup("growth", "monetization", "revenue"), ("both",))
+        self.assertEqual(catalog.lookup("growth", "engagement", "revenue"), ("risk only",))
+        self.assertEqual(catalog.lookup("growth", "monetization", "trust"), ("fallback",))
+        self.assertEqual(catalog.lookup("delivery", "general", "speed"), ("default",))
+
+    def test_missing_or_malformed_files(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            with self.assertRaises(FileNotFoundError):
+                FeatureCatalog.from_file(os.path.join(tmp, "missing.json"))
+
+            broken = os.path.join(tmp, "broken.json")
+            with open(broken, "w", encoding="utf-8") as f:
+                f.write("{not json")
+            with self.assertRaises(ValueError):
+                FeatureCatalog.from_file(broken)
+
+            no_default = os.path.join(tmp, "no_default.json")
+            with open(no_default, "w", encoding="utf-8") as f:
+                json.dump({"features": {}}, f)
+            with self.assertRaises(ValueError):
+                FeatureCatalog.from_file(no_default)
+
+        with self.assertRaises(ValueError):
+            FeatureCatalog({"features": {"growth": [{"when": {}}]}, "default": []})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+import json
+import os
+import tempfile
+import unittest
+
+from pipeline.feedback_reader import FeedbackReader
+
+
+class TestFeedbackReader(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write(self, name, content):
+        path = os.path.join(self.tmp.name, name)
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            f.write(content)
+        return path
+
+    def test_csv_picks_text_column_and_skips_blank_rows(self):
+        path = self.write("reviews.csv", (
+            "id,Review,rating\n"
+            '1,"Checkout fails, every time",1\n'
+            "2,,3\n"
+            "3,   ,2\n"
+            "4\n"
+            '5,"Search is\nslow",2\n'
+        ))
+
+        self.assertEqual(
+            list(FeedbackReader(path).texts()),
+            ["Checkout fails, every time", "Search is\nslow"]
+        )
+
+    def test_tsv_with_explicit_text_field(self):
+        path = self.write("reviews.tsv", "text\tnote\nignored\tLogin is broken\n")
+
+        self.assertEqual(list(FeedbackReader(path, text_field="note").texts()), ["Login is broken"])
+
+        with self.assertRaises(ValueError):
+            list(FeedbackReader(path, text_field="missing").texts())
+
+    def test_jsonl_objects_strings_and_blank_lines(self):
+        path = self.write("reviews.jsonl", "\n".join([
+            json.dumps({"feedback": "Checkout fails"}),
+            "",
+            "   ",
+            json.dumps("Search is slow"),
+            json.dumps({"feedback": ""}),
+            json.dumps({"other": "no feedback key"}),
+            json.dumps({"feedback": "Login is broken"}),
+        ]))
+
+        self.assertEqual(
+            list(FeedbackReader(path).texts()),
+            ["Checkout fails", "Search is slow", "Login is broken"]
+        )
+
+    def test_malformed_jsonl_lines_report_line_number(self):
+        for bad in ('{"feedback": "unterminated', "[1, 2]", "42"):
+            path = self.write("bad.jsonl", json.dumps({"feedback": "ok"}) + "\n\n" + bad + "\n")
+
+            with self.assertRaisesRegex(ValueError, r"bad\.jsonl:3"):
+                list(FeedbackReader(path).texts())
+
+    def test_plain_text_one_feedback_per_line(self):
+        path = self.write("reviews.txt", "Checkout fails\r\n\n   \nSearch is slow\nLogin is broken")
+
+        self.assertEqual(
+            list(FeedbackReader(path).texts()),
+            ["Checkout fails", "Search is slow", "Login is broken"]
+        )
+
+    def test_chunks_are_bounded(self):
+        path = self.write("reviews.txt", "\n".join(f"feedback {i}" for i in range(7)))
+
+        chunks = list(FeedbackReader(path, chunk_size=3).chunks())
+        self.assertEqual([len(c) for c in chunks], [3, 3, 1])
+        self.assertEqual(chunks[-1], ["feedback 6"])
+
+    def test_rejects_bad_arguments(self):
+        with self.assertRaises(ValueError):
+            FeedbackReader("reviews.csv", chunk_size=0)
+
+        with self.assertRaises(ValueError):
+            list(FeedbackReader(self.write("reviews.xml", "<x/>")).texts())
+
+        # A .json array is not line-delimited, so it is not read as JSONL
+        with self.assertRaisesRegex(ValueError, "Unsupported"):
+            list(FeedbackReader(self.write("reviews.json", '[{"text": "slow"}]')).texts())
+
+        self.assertEqual(list(FeedbackReader(self.write("empty.csv", "")).texts()), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+import random
+import unittest
+from product.incremental_ranking import IncrementalRanking
+
+
+def naive_ranking(scores, order):
+    ranked = sorted(order, key=lambda f: -scores[f])
+    return [{"feature": f, "score": scores[f]} for f in ranked]
+
+
+class TestIncrementalRanking(unittest.TestCase):
+
+    def test_matches_full_resort_after_random_edits(self):
+        rng = random.Random(7)
+        scores = {f"feature {i}": float(rng.randint(0, 50)) for i in range(300)}
+        order = list(scores)
+
+        ranking = IncrementalRanking(
+            [{"feature": f, "score": scores[f]} for f in order], bucket_size=8
+        )
+
+        for step in range(2000):
+            op = rng.random()
+            before = [row["feature"] for row in ranking.ranked()]
+
+            if op < 0.6 and order:
+                feature = rng.choice(order)
+                scores[feature] = float(rng.randint(0, 50))
+                change = ranking.update(feature, scores[feature])
+            elif op < 0.8 and order:
+                feature = rng.choice(order)
+                order.remove(feature)
+                del scores[feature]
+                change = ranking.remove(feature)
+            else:
+                feature = f"new {step}"
+                order.append(feature)
+                scores[feature] = float(rng.randint(0, 50))
+                change = ranking.insert(feature, scores[feature])
+
+            after = [row["feature"] for row in ranking.ranked()]
+            self.assertEqual(ranking.ranked(), naive_ranking(scores, order))
+
+            # Only the reported span (plus the feature itself) moved
+            moved = {
+                f for f in after
+                if f != feature and f in before and before.index(f) != after.index(f)
+            }
+            span = set(after[change.shift_start:change.shift_stop])
+            self.assertEqual(moved, span)
+
+    def test_update_reports_new_rank(self):
+        ranking = IncrementalRanking([
+            {"feature": "a", "score": 9},
+            {"feature": "b", "score": 5},
+            {"feature": "c", "score": 1},
+        ])
+
+        change = ranking.update("c", 7)
+        self.assertEqual((change.old_rank, change.new_rank), (2, 1))
+        self.assertEqual(ranking.rank_of("b"), 2)
+
+    def test_duplicate_features_are_rejected(self):
+        with self.assertRaises(ValueError):
+            IncrementalRanking([
+                {"feature": "a", "score": 9},
+                {"feature": "a", "score": 5},
+            ])
+
+        ranking = IncrementalRanking([{"feature": "a", "score": 9}])
+        with self.assertRaises(ValueError):
+            ranking.insert("a", 1)
+        self.assertEqual(ranking.ranked(), [{"feature": "a", "score": 9.0}])
+
+    def test_unknown_features_raise_key_error(self):
+        ranking = IncrementalRanking([{"feature": "a", "score": 9}])
+
+        for call in (ranking.rank_of, ranking.remove, lambda f: ranking.update(f, 1)):
+            with self.assertRaises(KeyError):
+                call("missing")
+
+        # Keys sorting past the last bucket, or into an empty ranking
+        with self.assertRaises(KeyError):
+            ranking._position((1.0, 99, "missing"))
+        with self.assertRaises(KeyError):
+            IncrementalRanking()._position((0.0, 0, "missing"))
+
+    def test_ranks_stay_correct_across_bucket_splits(self):
+        ranking = IncrementalRanking(bucket_size=2)
+        for i in range(50):
+            ranking.insert(f"f{i}", float(i % 7))
+
+        for rank, row in enumerate(ranking.ranked()):
+            self.assertEqual(ranking.rank_of(row["feature"]), rank)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,35 @@
+import unittest
+from unittest import mock
+
+import product.keyword_matcher as keyword_matcher
+from product.keyword_matcher import KeywordMatcher
+
+
+CATEGORIES = {
+    "retention": ["churn", "trial", "trial ends"],
+    "monetization": ["free trial", "pricing"],
+    "performance": ["slow"],
+}
+
+
+class TestKeywordMatcher(unittest.TestCase):
+
+    def check_matcher(self, matcher):
+        self.assertEqual(
+            matcher.hits("users churn when the free trial ends"),
+            {"retention", "monetization"}
+        )
+        self.assertEqual(matcher.hits("nothing relevant"), frozenset())
+        self.assertEqual(matcher.first("pricing feels slow"), "monetization")
+        self.assertEqual(matcher.first("all good", default="general"), "general")
+
+    def test_matches_like_substring_checks(self):
+        self.check_matcher(KeywordMatcher(CATEGORIES))
+
+    def test_fallback_without_automaton(self):
+        with mock.patch.object(keyword_matcher, "ahocorasick", None):
+            self.check_matcher(KeywordMatcher(CATEGORIES))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+import os
+import tempfile
+import unittest
+from datetime import date
+
+from product.prioritization_strategy import get_strategy
+from roadmap.monte_carlo import RoadmapSimulator
+from roadmap.roadmap_exporter import RoadmapExporter
+
+
+FEATURES = [
+    "Simplify onboarding steps",
+    "Run a pilot test",
+    "Add progress nudges",
+    "Launch partner integrations",
+    "Fix crash on startup",
+    "Validate pricing hypothesis",
+]
+
+
+class TestRoadmapSimulator(unittest.TestCase):
+
+    def test_reruns_and_worker_count_give_identical_results(self):
+        serial = RoadmapSimulator(samples=700, chunk_size=200).simulate(FEATURES)
+        again = RoadmapSimulator(samples=700, chunk_size=200).simulate(FEATURES)
+        parallel = RoadmapSimulator(samples=700, chunk_size=200, workers=2).simulate(FEATURES)
+
+        self.assertEqual(serial, again)
+        self.assertEqual(serial, parallel)
+        self.assertNotEqual(serial, RoadmapSimulator(samples=700, seed=1).simulate(FEATURES))
+
+    def test_rows_follow_baseline_rice_rank(self):
+        result = RoadmapSimulator(samples=500).simulate(FEATURES, start_date=date(2026, 1, 1))
+        rows = result["features"]
+
+        ranked = [row["feature"] for row in get_strategy("RICE").rank(FEATURES)]
+        self.assertEqual([row["feature"] for row in rows], ranked)
+        self.assertEqual([row["rank"] for row in rows], list(range(1, len(FEATURES) + 1)))
+
+        for row in rows:
+            self.assertTrue(0 <= row["p_q1"] <= 1)
+            self.assertTrue(0 <= row["rank_stability"] <= 1)
+            self.assertLessEqual(row["rank_p10"], row["rank_p50"])
+            self.assertLessEqual(row["rank_p50"], row["rank_p90"])
+            self.assertLessEqual(row["delivery_p50_months"], row["delivery_p90_months"])
+            self.assertLessEqual(row["delivery_p50_date"], row["delivery_p90_date"])
+
+    def test_follows_the_analysis_framework(self):
+        result = RoadmapSimulator(samples=300).simulate(FEATURES, framework="ICE")
+
+        ranked = [row["feature"] for row in get_strategy("ICE").rank(FEATURES)]
+        self.assertEqual(result["framework"], "ICE")
+        self.assertEqual([row["feature"] for row in result["features"]], ranked)
+
+    def test_categorical_frameworks_are_not_simulated(self):
+        for framework in ("MoSCoW", "Kano"):
+            self.assertFalse(RoadmapSimulator.supports(framework))
+            with self.assertRaises(ValueError):
+                RoadmapSimulator(samples=10).simulate(FEATURES, framework=framework)
+
+        self.assertTrue(RoadmapSimulator.supports("ICE"))
+
+    def test_pdf_includes_confidence_section(self):
+        analysis = {
+            "features": FEATURES,
+            "framework": "RICE",
+            "confidence": RoadmapSimulator(samples=200).simulate(FEATURES),
+        }
+
+        with tempfile.TemporaryDirectory() as export_dir:
+            exporter = RoadmapExporter(export_dir)
+            flowables = list(exporter._full_analysis_flowables(analysis))
+            path = exporter.export_full_analysis(analysis)
+
+            self.assertTrue(os.path.getsize(path) > 0)
+
+        texts = [getattr(f, "text", "") for f in flowables]
+        self.assertIn("Delivery Confidence", texts)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,5 @@
 import unittest
-from product.problem_mapper import ProblemMapper
+from product.problem_mapper import ProblemMapper, normalize_problem_text
 
 
 class TestProblemMapper(unittest.TestCase):
@@ -17,6 +17,52 @@ class TestProblemMapper(unittest.TestCase):
         result = self.mapper.map(test_input)
         self.assertEqual(result.get("problem_type"), "performance")
 
+    def test_map_many_matches_map(self):
+        texts = [
+            "Users churn after the trial ends",
+            "The dashboard is very slow to load",
+            "  USERS CHURN   after the trial ends ",
+            "Something else entirely",
+            "",
+        ]
+
+        for text, template in zip(texts, self.mapper.map_many(texts)):
+            as_dict = {
+                key: list(value) if isinstance(value, tuple) else value
+                for key, value in template.items()
+            }
+            self.assertEqual(as_dict, self.mapper.map(text))
+
+    def test_cached_results_are_independent_copies(self):
+        first = self.mapper.map("The dashboard is very slow to load")
+        first["constraints"].append("edited")
+        first["summary"] = "edited"
+
+        again = self.mapper.map("The dashboard is very slow to load")
+
+        self.assertNotIn("edited", again["constraints"])
+        self.assertNotEqual(again["summary"], "edited")
+        self.assertIsNot(first["constraints"], again["constraints"])
+
+    def test_map_many_templates_are_read_only(self):
+        template = self.mapper.map_many(["The dashboard is very slow to load"])[0]
+
+        with self.assertRaises(TypeError):
+            template["summary"] = "edited"
+        self.assertIsInstance(template["constraints"], tuple)
+
+    def test_normalization_edge_cases(self):
+        self.assertEqual(normalize_problem_text("  Users\tCHURN\n after   trial "), "users churn after trial")
+        self.assertEqual(normalize_problem_text(None), "")
+        self.assertEqual(normalize_problem_text(" \n\t "), "")
+
+        self.assertEqual(
+            self.mapper.detect_type("THE DASHBOARD IS\nSLOW"),
+            self.mapper.detect_type("the dashboard is slow")
+        )
+        self.assertEqual(self.mapper.detect_type(""), "general")
+        self.assertEqual(self.mapper.detect_type(None), "general")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,27 @@
+import unittest
+from product.rice_scoring import RiceScorer
+
+
+class TestRiceScorer(unittest.TestCase):
+
+    def setUp(self):
+        self.scorer = RiceScorer()
+
+    def test_score_many_matches_score(self):
+        rows = [(1000, 3, 0.8, 2), (500, 2, 0.5, 0), (10, 1, 1.0, 4)]
+        scores = self.scorer.score_many(*zip(*rows))
+
+        expected = [
+            self.scorer.score("f", dict(zip(["reach", "impact", "confidence", "effort"], row)))
+            for row in rows
+        ]
+        self.assertEqual(scores.tolist(), expected)
+
+    def test_top_k_returns_best_first(self):
+        scores = [5.0, 1.0, 9.0, 7.0, 3.0]
+        self.assertEqual(self.scorer.top_k(scores, 3).tolist(), [2, 3, 0])
+        self.assertEqual(len(self.scorer.top_k(scores, 10)), 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+import os
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+from reportlab import rl_config
+
+from roadmap.roadmap_exporter import RoadmapExporter, payload_digest
+
+
+ROADMAP = {
+    "Month 0–2": ["Guided onboarding checklist"],
+    "Month 2–4": ["Status updates for verification"],
+    "Month 4–6": [],
+}
+
+
+class TestRoadmapExporter(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_identical_payload_reuses_pdf(self):
+        exporter = RoadmapExporter(self.tmp.name)
+
+        with mock.patch.object(exporter, "_build", wraps=exporter._build) as build:
+            first = exporter.export(ROADMAP)
+            again = exporter.export(dict(ROADMAP))
+
+        self.assertEqual(first, again)
+        self.assertEqual(build.call_count, 1)
+        self.assertNotEqual(exporter.export({"Month 0–2": ["Other"]}), first)
+
+    def test_reordered_roadmap_gets_new_pdf(self):
+        exporter = RoadmapExporter(self.tmp.name)
+        reordered = dict(reversed(list(ROADMAP.items())))
+
+        self.assertNotEqual(payload_digest(reordered), payload_digest(ROADMAP))
+
+        with mock.patch.object(exporter, "_build", wraps=exporter._build) as build:
+            first = exporter.export(ROADMAP)
+            second = exporter.export(reordered)
+
+        self.assertNotEqual(first, second)
+        self.assertEqual(build.call_count, 2)
+        self.assertTrue(os.path.exists(first) and os.path.exists(second))
+
+    def test_evicts_least_recently_used_beyond_max_files(self):
+        exporter = RoadmapExporter(self.tmp.name, max_files=2)
+        now = time.time()
+
+        paths = []
+        for i in range(3):
+            paths.append(exporter.export({"Phase": [f"Item {i}"]}))
+            os.utime(paths[-1], (now + i, now + i))  # deterministic "last used" order
+
+        exporter.evict()
+
+        self.assertFalse(os.path.exists(paths[0]))
+        self.assertTrue(os.path.exists(paths[2]))
+        self.assertEqual(
+            sorted(n for n in os.listdir(self.tmp.name) if n.endswith(".pdf")),
+            sorted(os.path.basename(p) for p in paths[1:])
+        )
+
+    @mock.patch.object(rl_config, "invariant", 1)  # no timestamps / random ids
+    def test_streaming_render_matches_full_story(self):
+        features = [f"Feature {i} " + "detail " * (i % 30) for i in range(400)]
+        analysis = {
+            "features": features,
+            "prioritization": [{"feature": f, "score": i} for i, f in enumerate(features)],
+            "roadmap": {"Month 0–2": features[:150], "Month 2–4": features[150:]},
+        }
+
+        rendered = []
+        for streaming in (True, False):
+            export_dir = os.path.join(self.tmp.name, str(streaming))
+            path = RoadmapExporter(export_dir, streaming=streaming).export_full_analysis(analysis)
+            with open(path, "rb") as f:
+                rendered.append(f.read())
+
+        self.assertEqual(rendered[0], rendered[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
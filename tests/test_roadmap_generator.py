@@ -0,0 +1,43 @@
+import unittest
+
+from roadmap.roadmap_generator import FRAMEWORKS, RoadmapGenerator
+
+
+class TestRoadmapGenerator(unittest.TestCase):
+
+    def setUp(self):
+        self.generator = RoadmapGenerator()
+
+    def test_generate_many_matches_generate_per_framework(self):
+        lists = [
+            [{"feature": "Simplify onboarding steps", "score": 9},
+             {"feature": "Run a pilot test", "score": 5},
+             {"feature": "Add progress nudges", "score": 3},
+             {"feature": "Launch partner integrations", "score": 1}],
+            ["Fix crash on startup", "Validate pricing hypothesis"],
+            [],
+        ]
+
+        roadmaps = self.generator.generate_many(lists + lists[:1])
+
+        self.assertEqual(len(roadmaps), 4)
+        for scored, by_framework in zip(lists + lists[:1], roadmaps):
+            self.assertEqual(set(by_framework), set(FRAMEWORKS))
+            for framework in FRAMEWORKS:
+                self.assertEqual(
+                    by_framework[framework],
+                    self.generator.generate(scored, framework=framework)
+                )
+
+    def test_roadmaps_do_not_share_lists(self):
+        rice, kano = (
+            self.generator.generate_many([["Launch partner integrations"]])[0][f]
+            for f in ("RICE", "Kano")
+        )
+
+        rice["Q2 (3–6 months) — Compound Impact"].append("edited")
+        self.assertEqual(kano["Q2 (3–6 months) — Delight & Differentiate"], ["Launch partner integrations"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+import unittest
+
+import numpy as np
+
+from nlp.sentiment import SENTIMENT_FIELDS, SentimentAnalyzer
+
+
+TEXTS = [
+    "payment failed again at checkout",
+    "I love the new dashboard!",
+    "",
+    None,
+    "   ",
+    "search is okay, not great",
+    "the app keeps crashing and support never answers",
+]
+
+
+class TestSentimentAnalyzer(unittest.TestCase):
+
+    def setUp(self):
+        self.analyzer = SentimentAnalyzer()
+
+    def assert_matches_analyze(self, columns, texts):
+        for field in SENTIMENT_FIELDS:
+            self.assertEqual(columns[field].dtype, np.float64)
+            self.assertEqual(len(columns[field]), len(texts))
+
+        for i, text in enumerate(texts):
+            expected = self.analyzer.analyze(text)
+            self.assertEqual({f: columns[f][i] for f in SENTIMENT_FIELDS}, expected)
+
+    def test_empty_texts_default_to_neutral(self):
+        for text in ("", None, "   "):
+            self.assertEqual(
+                self.analyzer.analyze(text),
+                {"neg": 0, "neu": 1, "pos": 0, "compound": 0}
+            )
+
+    def test_in_process_matches_analyze(self):
+        self.assert_matches_analyze(self.analyzer.analyze_many(TEXTS, workers=1), TEXTS)
+        # Fewer texts than one shard also stay in process
+        self.assert_matches_analyze(self.analyzer.analyze_many(TEXTS, workers=2), TEXTS)
+
+    def test_sharded_pool_matches_analyze(self):
+        texts = TEXTS * 3
+        columns = self.analyzer.analyze_many(texts, workers=2, shard_size=4)
+        self.assert_matches_analyze(columns, texts)
+
+    def test_no_texts(self):
+        columns = self.analyzer.analyze_many([])
+        self.assertEqual({f: len(v) for f, v in columns.items()}, dict.fromkeys(SENTIMENT_FIELDS, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+import asyncio
+import json
+import tempfile
+import time
+import unittest
+
+from tornado.httpclient import AsyncHTTPClient
+from tornado.testing import AsyncHTTPTestCase, gen_test
+
+from pipeline.analysis import analyze
+from service import server
+
+
+class TestService(AsyncHTTPTestCase):
+
+    def get_app(self):
+        self.export_dir = tempfile.TemporaryDirectory()
+        self.app = server.make_app(workers=1, batch_window=0.05, export_dir=self.export_dir.name)
+        return self.app
+
+    def tearDown(self):
+        self.app.settings["pool"].shutdown()
+        self.app.settings["batch_pool"].shutdown()
+        self.export_dir.cleanup()
+        super().tearDown()
+
+    def post(self, path, body):
+        return AsyncHTTPClient().fetch(
+            self.get_url(path), method="POST", body=json.dumps(body), raise_error=False
+        )
+
+    @gen_test
+    async def test_concurrent_analyze_requests_share_one_batch(self):
+        batches = []
+        batcher = self.app.settings["batcher"]
+        handler = batcher.handler
+        batcher.handler = lambda items: batches.append(len(items)) or handler(items)
+
+        texts = ["The dashboard is very slow to load", "Users churn after the trial ends"]
+        responses = [
+            await r for r in [self.post("/analyze", {"problem_text": t}) for t in texts]
+        ]
+
+        self.assertEqual(batches, [2])
+        for text, response in zip(texts, responses):
+            self.assertEqual(response.code, 200)
+            self.assertEqual(
+                json.loads(response.body),
+                json.loads(json.dumps(analyze(text).to_payload()))
+            )
+
+    @gen_test
+    async def test_slow_batch_does_not_block_other_requests(self):
+        batcher = self.app.settings["batcher"]
+        handler = batcher.handler
+        batcher.handler = lambda items: time.sleep(1.0) or handler(items)
+
+        slow = self.post("/analyze", {"problem_text": "slow app"})
+        await asyncio.sleep(0.2)  # past the batch window: the handler is now sleeping
+
+        start = time.perf_counter()
+        response = await self.post("/analyze", {"problem_text": "slow app", "framework": "WSJF"})
+
+        self.assertEqual(response.code, 400)
+        self.assertLess(time.perf_counter() - start, 0.5)
+        self.assertEqual((await slow).code, 200)
+
+    @gen_test(timeout=60)
+    async def test_export_streams_pdf(self):
+        response = await self.post("/export", {"problem_text": "Users churn after the trial ends"})
+
+        self.assertEqual(response.code, 200)
+        self.assertEqual(response.headers["Content-Type"], "application/pdf")
+        self.assertIn("attachment", response.headers["Content-Disposition"])
+        self.assertTrue(response.body.startswith(b"%PDF"))
+
+    @gen_test
+    async def test_rejects_unknown_framework(self):
+        response = await self.post("/analyze", {"problem_text": "slow app", "framework": "WSJF"})
+
+        self.assertEqual(response.code, 400)
+        self.assertIn("framework", json.loads(response.body)["error"])
+
+
+if __name__ == "__main__":
+    unittest.main()
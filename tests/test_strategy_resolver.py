@@ -0,0 +1,71 @@
+import unittest
+from unittest import mock
+
+import numpy as np
+
+import product.prioritization_strategy as prioritization_strategy
+from product.prioritization_strategy import BaseStrategy, get_strategy, register_strategy
+from product.strategy_resolver import StrategyResolver
+
+
+FEATURES = [
+    "Reduce non-essential fields before the user reaches first value",
+    "Introduce a progressive onboarding flow that unlocks steps only when required",
+    "Display a clear progress indicator tied to first-value completion",
+    "Add inline microcopy explaining why each required step exists",
+    "Surface a first-success confirmation moment to reinforce completion",
+]
+
+
+class TestStrategyResolver(unittest.TestCase):
+
+    def test_scoring_is_deterministic(self):
+        for framework in ["RICE", "ICE", "MoSCoW", "Kano"]:
+            first = StrategyResolver().resolve(framework, FEATURES)
+            second = StrategyResolver().resolve(framework, list(FEATURES))
+            self.assertEqual(first, second)
+
+    def test_numeric_frameworks_rank_every_feature(self):
+        for framework in ["RICE", "ICE"]:
+            resolved = StrategyResolver().resolve(framework, FEATURES)
+            scores = [item["score"] for item in resolved]
+
+            self.assertEqual(sorted(item["feature"] for item in resolved), sorted(FEATURES))
+            self.assertEqual(scores, sorted(scores, reverse=True))
+
+    def test_registered_strategy_is_resolvable(self):
+        # Keep the module-global registry unchanged for other tests
+        registry = mock.patch.dict(prioritization_strategy._STRATEGIES)
+        registry.start()
+        self.addCleanup(registry.stop)
+
+        @register_strategy("test_positional")
+        class PositionalStrategy(BaseStrategy):
+            def apply_many(self, features):
+                return np.arange(len(features), 0, -1, dtype=float)
+
+        self.assertIsInstance(get_strategy("Test_Positional"), PositionalStrategy)
+
+        resolved = StrategyResolver().resolve("TEST_POSITIONAL", FEATURES)
+        self.assertEqual([item["feature"] for item in resolved], FEATURES)
+
+    def test_unknown_framework_falls_back_to_rice(self):
+        self.assertEqual(
+            StrategyResolver().resolve("unknown", FEATURES),
+            StrategyResolver().resolve("RICE", FEATURES)
+        )
+
+    def test_resolve_many_matches_resolve(self):
+        features = ["Simplify onboarding steps", "Run a pilot test", "Add progress nudges"]
+        items = [("RICE", features), ("Kano", features), ("RICE", list(features)), ("ICE", [])]
+
+        resolver = StrategyResolver()
+        results = resolver.resolve_many(items)
+
+        for (framework, listed), result in zip(items, results):
+            self.assertEqual(result, resolver.resolve(framework, listed))
+        self.assertIs(results[0], results[2])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+import csv
+import json
+import os
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+import pyarrow.parquet as pq
+
+import roadmap.structured_exporter as structured_exporter
+from pipeline.analysis import analyze
+from roadmap.structured_exporter import COLUMNS, StructuredExporter, analysis_columns
+
+
+class TestStructuredExporter(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.exporter = StructuredExporter(self.tmp.name)
+        self.analyses = [
+            analyze("The dashboard is very slow to load", framework="RICE").to_payload(),
+            analyze("Users churn after the trial ends", framework="MoSCoW").to_payload(),
+        ]
+        self.columns = analysis_columns(self.analyses, ["a", "b"])
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_columns_flatten_prioritization(self):
+        first = self.analyses[0]
+        n = len(first["prioritization"])
+
+        self.assertEqual(self.columns["analysis_id"][:n], ["a"] * n)
+        self.assertEqual(self.columns["rank"][:n], list(range(1, n + 1)))
+        self.assertEqual(self.columns["feature"][:n], [r["feature"] for r in first["prioritization"]])
+        self.assertEqual(self.columns["score"][:n], [r["score"] for r in first["prioritization"]])
+        self.assertEqual(self.columns["score_label"][n], "Must Have")
+        self.assertIsNone(self.columns["score"][n])
+
+    def test_formats_round_trip(self):
+        expected = [dict(zip(COLUMNS, row)) for row in zip(*self.columns.values())]
+
+        path = self.exporter.export(self.analyses, "jsonl", ["a", "b"])
+        with open(path, encoding="utf-8") as f:
+            self.assertEqual([json.loads(line) for line in f], expected)
+
+        path = self.exporter.export(self.analyses, "parquet", ["a", "b"])
+        self.assertEqual(pq.read_table(path).to_pylist(), expected)
+
+        self.assertEqual(self.exporter.export(self.analyses, "parquet", ["a", "b"]), path)
+
+    def test_csv_without_pyarrow_matches(self):
+        columns = dict(self.columns)
+        columns["feature"] = list(columns["feature"])
+        columns["feature"][0] = 'Quote "this", then\na new line'
+        columns["score"] = list(columns["score"])
+        columns["score"][1] = 1e-07
+        columns["score"][2] = 10.0
+        columns["phase"] = [""] + list(columns["phase"][1:])
+
+        with_arrow = os.path.join(self.tmp.name, "arrow.csv")
+        fallback = os.path.join(self.tmp.name, "fallback.csv")
+        StructuredExporter.write_csv(columns, with_arrow)
+        with mock.patch.object(structured_exporter, "pa_csv", None):
+            StructuredExporter.write_csv(columns, fallback)
+
+        with open(with_arrow, "rb") as a, open(fallback, "rb") as b:
+            self.assertEqual(a.read(), b.read())
+
+        with open(fallback, encoding="utf-8", newline="") as f:
+            rows = list(csv.DictReader(f))
+        self.assertEqual(len(rows), len(columns["feature"]))
+        self.assertEqual(rows[0]["feature"], columns["feature"][0])
+        self.assertEqual([float(r["score"]) if r["score"] else None for r in rows], columns["score"])
+
+    def test_exports_are_evicted_like_pdfs(self):
+        exporter = StructuredExporter(self.tmp.name, max_files=2)
+        now = time.time()
+
+        paths = []
+        for i in range(3):
+            paths.append(exporter.export(self.analyses, "jsonl", [f"a{i}", "b"]))
+            os.utime(paths[-1], (now + i, now + i))
+
+        exporter.evict()
+
+        self.assertFalse(os.path.exists(paths[0]))
+        self.assertTrue(all(os.path.exists(p) for p in paths[1:]))
+
+
+if __name__ == "__main__":
+    unittest.main()
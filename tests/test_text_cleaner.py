@@ -0,0 +1,40 @@
+import unittest
+from nlp.text_cleaner import TextCleaner
+
+
+class TestTextCleaner(unittest.TestCase):
+
+    def setUp(self):
+        self.cleaner = TextCleaner()
+        self.texts = [
+            "Payment FAILED again!!  I am very frustrated",
+            "  Checkout\tprocess keeps\ncrashing... ",
+            "",
+            None,
+            "Search\x00results are inaccurate",
+        ]
+
+    def test_clean_batch_matches_clean(self):
+        expected = [self.cleaner.clean(t) for t in self.texts]
+        self.assertEqual(self.cleaner.clean_batch(self.texts), expected)
+
+    def test_tokenize_batch_matches_tokenize(self):
+        expected = [self.cleaner.tokenize(t) for t in self.texts]
+        self.assertEqual(self.cleaner.tokenize_batch(self.texts), expected)
+
+    def test_clean_batch_arrow(self):
+        try:
+            import pyarrow as pa
+        except ImportError:
+            self.skipTest("pyarrow not installed")
+
+        texts = [t for t in self.texts if t is None or "\x00" not in t]
+        result = self.cleaner.clean_batch(pa.array(texts))
+        self.assertEqual(result.to_pylist(), [self.cleaner.clean(t) for t in texts])
+
+        tokens = self.cleaner.tokenize_batch(pa.array(texts))
+        self.assertEqual(tokens.to_pylist(), [self.cleaner.tokenize(t) for t in texts])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import nltk
+from nltk.sentiment.vader import SentimentIntensityAnalyzer
+
+import nlp.vader_lexicon as vader_lexicon
+
+
+SENTENCES = [
+    "payment failed again at checkout",
+    "I LOVE the new dashboard!!! :)",
+    "search is not great, but not terrible either",
+    "the app keeps crashing and support never answers",
+]
+
+
+class TestVaderLexicon(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        env = mock.patch.dict(os.environ, {"PMGPT_VADER_CACHE": self.tmp.name})
+        env.start()
+
+        self.addCleanup(self.tmp.cleanup)
+        self.addCleanup(env.stop)
+        self.addCleanup(self.clear_caches)
+        self.clear_caches()
+
+    @staticmethod
+    def clear_caches():
+        vader_lexicon.load_lexicon.cache_clear()
+        vader_lexicon.shared_analyzer.cache_clear()
+
+    def test_cache_round_trips(self):
+        source = os.path.join(self.tmp.name, "lexicon.txt")
+        with open(source, "w", encoding="utf-8") as f:
+            f.write("good\t1.9\t0.9434\t[2, 1, 2]\n:)\t2.0\t1.1\t[1]\nbad\t-2.5\t0.6\t[-3]\n\n")
+
+        self.assertEqual(vader_lexicon.build_cache(source), self.tmp.name)
+        self.assertEqual(vader_lexicon.load_lexicon(), {"good": 1.9, ":)": 2.0, "bad": -2.5})
+
+    def test_builds_from_nltk_data_and_matches_stock_vader(self):
+        stock = SentimentIntensityAnalyzer()
+
+        analyzer = vader_lexicon.shared_analyzer()
+
+        self.assertTrue(os.path.exists(os.path.join(self.tmp.name, vader_lexicon.WORDS_FILE)))
+        self.assertIs(vader_lexicon.shared_analyzer(), analyzer)
+        self.assertEqual(analyzer.lexicon, stock.lexicon)
+        for sentence in SENTENCES:
+            self.assertEqual(analyzer.polarity_scores(sentence), stock.polarity_scores(sentence))
+
+    def test_missing_cache_raises_instead_of_downloading(self):
+        with mock.patch.object(nltk.data, "find", side_effect=LookupError("missing")), \
+                mock.patch.object(nltk, "download") as download:
+            with self.assertRaisesRegex(LookupError, "python -m nlp.vader_lexicon"):
+                vader_lexicon.load_lexicon()
+
+        download.assert_not_called()
+        self.assertEqual(os.listdir(self.tmp.name), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
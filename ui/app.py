@@ -3,6 +3,7 @@
 # --------------------------------------------------
 import sys
 import os
+from datetime import date
 
 ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 if ROOT_DIR not in sys.path:
@@ -13,17 +14,12 @@ if ROOT_DIR not in sys.path:
 # --------------------------------------------------
 import streamlit as st
 
-from product.problem_mapper import ProblemMapper
-from product.feature_generator import FeatureGenerator
-from product.framework_selector import FrameworkSelector
-from product.framework_explainer import FrameworkExplainer
+from pipeline.analysis import AnalysisPipeline, DEFAULT_BUSINESS_IMPACT, DEFAULT_CONSTRAINTS
+from product.problem_mapper import normalize_problem_text
 from product.framework_comparison import FrameworkComparison
-from product.strategy_resolver import StrategyResolver
-from product.decision_narrator import DecisionNarrator
-from product.pm_judgment_engine import PMJudgmentEngine
 
-from roadmap.roadmap_generator import RoadmapGenerator
-from roadmap.roadmap_exporter import RoadmapExporter
+from roadmap.export_queue import ExportQueue
+from roadmap.monte_carlo import RoadmapSimulator
 
 
 # --------------------------------------------------
@@ -51,6 +47,12 @@ if "analysis_payload" not in st.session_state:
 if "pdf_path" not in st.session_state:
     st.session_state.pdf_path = None
 
+if "export_job" not in st.session_state:
+    st.session_state.export_job = None
+
+if "export_error" not in st.session_state:
+    st.session_state.export_error = None
+
 
 # --------------------------------------------------
 # SIDEBAR
@@ -69,6 +71,8 @@ if st.session_state.last_decision_mode != decision_mode:
     st.session_state.analysis_ready = False
     st.session_state.analysis_payload = None
     st.session_state.pdf_path = None
+    st.session_state.export_job = None
+    st.session_state.export_error = None
     st.session_state.last_decision_mode = decision_mode
 
 
@@ -87,6 +91,8 @@ if decision_mode == "Manual (I choose framework)":
         st.session_state.analysis_ready = False
         st.session_state.analysis_payload = None
         st.session_state.pdf_path = None
+        st.session_state.export_job = None
+        st.session_state.export_error = None
         st.session_state.last_manual_framework = manual_framework
 
 
@@ -111,160 +117,87 @@ problem_text = st.text_area(
 
 
 # --------------------------------------------------
-# FRAMEWORK-AWARE PROBLEM INSIGHT ADJUSTMENT
+# SHARED PIPELINE & CACHED ANALYSIS
 # --------------------------------------------------
-def adjust_problem_insight(problem_data, framework):
-    adjusted = problem_data.copy()
+# Distinct analyses kept in memory (least recently used are evicted)
+ANALYSIS_CACHE_SIZE = 256
 
-    if framework == "RICE":
-        adjusted["core_problem"] = (
-            "Multiple viable feature options exist, but it is unclear which will deliver the highest impact given limited effort."
-        )
-        adjusted["user_failure_point"] = (
-            "Users are not failing outright; the risk lies in making suboptimal prioritization decisions."
-        )
-        adjusted["success_definition"] = (
-            "Objectively prioritize features to maximize impact relative to effort."
-        )
 
-    elif framework == "ICE":
-        adjusted["core_problem"] = (
-            "There is uncertainty around which ideas will move key metrics, requiring fast validation."
-        )
-        adjusted["user_failure_point"] = (
-            "Users may not benefit if unvalidated ideas are scaled prematurely."
-        )
-        adjusted["success_definition"] = (
-            "Rapidly test assumptions to identify high-confidence opportunities."
-        )
+@st.cache_resource
+def load_pipeline() -> AnalysisPipeline:
+    """
+    Pipeline components are stateless, so one instance is shared by every
+    rerun and session.
+    """
+    return AnalysisPipeline()
 
-    elif framework == "MoSCoW":
-        adjusted["core_problem"] = (
-            "Scope clarity is needed to ensure timely and focused delivery."
-        )
-        adjusted["user_failure_point"] = (
-            "Users may experience delays if priorities are not clearly defined."
-        )
-        adjusted["success_definition"] = (
-            "Clearly define must-haves versus nice-to-haves for delivery."
-        )
 
-    return adjusted
+@st.cache_data(max_entries=ANALYSIS_CACHE_SIZE, show_spinner=False)
+def run_analysis(normalized_text: str, decision_mode: str, manual_framework) -> dict:
+    """
+    Full pipeline payload for one (normalized problem text, mode, framework) key.
 
-def infer_problem_type_from_text(text: str) -> str:
-    t = text.lower()
+    AnalysisPipeline.analyze() normalizes the text the same way before
+    every stage, so near-repeat inputs share a cache entry without
+    changing the result. Streamlit returns a fresh copy
+    on each hit, so callers may mutate the payload.
+    """
+    framework = None if decision_mode == "Auto (PM-GPT decides)" else manual_framework
+    return load_pipeline().analyze(normalized_text, framework=framework).to_payload()
 
-    if any(k in t for k in ["onboarding", "signup", "kyc", "activation", "first value"]):
-        return "onboarding"
-    if any(k in t for k in ["churn", "retention", "drop off", "inactive"]):
-        return "retention"
-    if any(k in t for k in ["latency", "downtime", "failure", "reliability"]):
-        return "performance"
-    if any(k in t for k in ["delivery", "delay", "execution", "roadmap"]):
-        return "delivery"
-    if any(k in t for k in ["satisfaction", "nps", "feedback", "complaints"]):
-        return "satisfaction"
-    if any(k in t for k in ["growth", "conversion", "monetization", "pricing"]):
-        return "growth"
 
-    return "general"
+# Monte Carlo samples behind the Delivery Confidence review
+SIMULATION_SAMPLES = 2000
 
-# --------------------------------------------------
-# MAIN PIPELINE
-# --------------------------------------------------
-if run_clicked and problem_text.strip():
 
-    # 1️⃣ Problem Mapping
-    problem_data = ProblemMapper().map(problem_text)
-    problem_type = problem_data.get("problem_type", "general")
-    if problem_type == "general":
-        problem_type = infer_problem_type_from_text(problem_text)
+@st.cache_data(max_entries=ANALYSIS_CACHE_SIZE, show_spinner=False)
+def run_simulation(features: tuple, framework: str, start_date: str):
+    """
+    Seeded, so the same inputs always give the same result. None for
+    categorical frameworks (MoSCoW, Kano), which have no score distribution.
+    """
+    if not RoadmapSimulator.supports(framework):
+        return None
 
-    problem_summary = problem_data.get("summary", problem_text)
-
-    # ✅ MINIMAL POLISH (RAW SIGNAL)
-    problem_data["raw_signal"] = problem_text.strip()
-
-    business_impact = problem_data.get(
-        "business_impact",
-        [
-            "Negative impact on key product metrics",
-            "Increased risk of user churn",
-            "Long-term business impact if unresolved"
-        ]
-    )
-
-    constraints = problem_data.get(
-        "constraints",
-        [
-            "Limited engineering capacity",
-            "Need to balance speed with quality",
-            "Execution risk must be managed"
-        ]
-    )
-
-    # 2️⃣ Feature Generation
-    features = FeatureGenerator().generate(
-        problem_type=problem_type,
-        summary=problem_summary
-    )
-
-    # 3️⃣ Framework Selection
-    if decision_mode == "Auto (PM-GPT decides)":
-        framework = FrameworkSelector().select(
-            problem_type=problem_type,
-            summary=problem_text
-        )
-    else:
-        framework = manual_framework
+    simulator = RoadmapSimulator(samples=SIMULATION_SAMPLES)
+    return simulator.simulate(list(features), framework, date.fromisoformat(start_date))
 
-    problem_data = adjust_problem_insight(problem_data, framework)
 
-    framework_explanation = FrameworkExplainer().explain(framework, {})
-
-    # 4️⃣ Prioritization
-    scored_features = StrategyResolver().resolve(framework, features)
+# --------------------------------------------------
+# MAIN PIPELINE
+# --------------------------------------------------
+if run_clicked and problem_text.strip():
 
-    # 5️⃣ Roadmap
-    roadmap = RoadmapGenerator().generate(
-        scored_features,
-        framework=framework
+    payload = run_analysis(
+        normalize_problem_text(problem_text),
+        decision_mode,
+        manual_framework
     )
 
-    # 6️⃣ Judgment
-    narrator = DecisionNarrator()
-    judgment = PMJudgmentEngine().generate(
-        problem=problem_data.get("core_problem", problem_summary),
-        constraints=constraints,
-        prioritized_features=scored_features,
-        roadmap=roadmap
+    # ✅ MINIMAL POLISH (RAW SIGNAL)
+    payload["problem"]["raw_signal"] = problem_text.strip()
+    payload["confidence"] = run_simulation(
+        tuple(payload["features"]), payload["framework"], date.today().isoformat()
     )
 
-    def safe_call(fn, *args):
-        try:
-            return fn(*args)
-        except TypeError:
-            return fn(args[0])
-
-    st.session_state.analysis_payload = {
-        "problem": problem_data,
-        "features": features,
-        "framework": framework,
-        "framework_explanation": framework_explanation,
-        "prioritization": scored_features,
-        "roadmap": roadmap,
-        "reasoning": {
-            "framework": safe_call(narrator.explain_framework_choice, framework, problem_type),
-            "prioritization": safe_call(narrator.explain_prioritization, scored_features, problem_type),
-            "roadmap": safe_call(narrator.explain_roadmap, problem_type),
-            "tradeoffs": safe_call(narrator.explain_tradeoffs, problem_type),
-            "metrics": safe_call(narrator.explain_success_metrics, problem_type),
-        },
-        "judgment": judgment
-    }
-
+    problem_data = payload["problem"]
+    problem_summary = problem_data.get("summary", problem_text)
+    features = payload["features"]
+    framework = payload["framework"]
+    framework_explanation = payload["framework_explanation"]
+    scored_features = payload["prioritization"]
+    roadmap = payload["roadmap"]
+    judgment = payload["judgment"]
+    confidence = payload["confidence"]
+
+    business_impact = problem_data.get("business_impact", DEFAULT_BUSINESS_IMPACT)
+    constraints = problem_data.get("constraints", DEFAULT_CONSTRAINTS)
+
+    st.session_state.analysis_payload = payload
     st.session_state.analysis_ready = True
     st.session_state.pdf_path = None
+    st.session_state.export_job = None
+    st.session_state.export_error = None
 
 
     # --------------------------------------------------
@@ -353,17 +286,10 @@ if run_clicked and problem_text.strip():
     # -------------------------
     # TAB 6: DECISION REVIEW
     # -------------------------
-
-    if decision_mode == "Auto (PM-GPT decides)":
-        framework = FrameworkSelector().select(
-            problem_type=problem_type,
-            summary=problem_text
-        )
-    else:
-        framework = manual_framework
-
     with tabs[5]:
-        reasoning_tab, exec_tab = st.tabs(["🧠 PM Reasoning", "🏛 Executive Review"])
+        reasoning_tab, exec_tab, confidence_tab = st.tabs(
+            ["🧠 PM Reasoning", "🏛 Executive Review", "📈 Delivery Confidence"]
+        )
 
         with reasoning_tab:
             st.markdown("### 📌 Why this framework fits the problem")
@@ -402,22 +328,100 @@ if run_clicked and problem_text.strip():
                 )
             )
 
+        with confidence_tab:
+            st.markdown("### 📈 How confident are we in this plan?")
+
+            if confidence is None:
+                st.info(
+                    f"{framework} ranks features into fixed tiers, so there is no score "
+                    f"distribution to simulate. Delivery confidence is available for RICE and ICE."
+                )
+            else:
+                st.caption(
+                    f"Monte Carlo over {confidence['samples']} samples of the {framework} "
+                    f"estimates, at {confidence['capacity_per_period']} "
+                    f"effort points per quarter. Same inputs always give the same result."
+                )
+                st.dataframe(
+                    [
+                        {
+                            "Feature": row["feature"],
+                            "Rank": row["rank"],
+                            "Rank P10–P90": f"{row['rank_p10']}–{row['rank_p90']}",
+                            "Rank stability": f"{row['rank_stability']:.0%}",
+                            "P(Q1)": f"{row['p_q1']:.0%}",
+                            "Delivery P50": row["delivery_p50_date"],
+                            "Delivery P90": row["delivery_p90_date"],
+                        }
+                        for row in confidence["features"]
+                    ],
+                    hide_index=True
+                )
+
 
 # --------------------------------------------------
 # EXPORT
 # --------------------------------------------------
-if st.session_state.analysis_ready:
-    st.divider()
-    st.subheader("📤 Export Full Analysis")
+# How often a pending PDF export is polled
+EXPORT_POLL_SECONDS = 1.0
+
+
+@st.cache_resource
+def load_export_queue() -> ExportQueue:
+    """
+    One background render pool shared by every session.
+    """
+    return ExportQueue()
+
+
+@st.fragment(run_every=EXPORT_POLL_SECONDS)
+def poll_export():
+    """
+    Polls the pending PDF job; when it finishes (or is gone) the app reruns
+    without this fragment, which stops the polling.
+    """
+    job_id = st.session_state.export_job
+    if job_id is None:
+        return
+
+    try:
+        status = load_export_queue().status(job_id)
+    except KeyError:
+        # Pruned from the queue; let the user export again
+        status = {"state": "failed", "error": "the export job expired, please try again"}
+
+    if status["state"] in ("queued", "running"):
+        st.info("⏳ Generating PDF in the background…")
+        return
+
+    st.session_state.export_job = None
+    if status["state"] == "done":
+        st.session_state.pdf_path = status["path"]
+        st.toast("✅ PDF generated successfully", icon="📄")
+    else:
+        st.session_state.export_error = f"PDF export failed: {status['error']}"
+
+    st.rerun()
+
 
-    exporter = RoadmapExporter()
+@st.fragment
+def render_export():
+    """
+    Submits the PDF job and shows the result. Only poll_export() reruns on
+    a timer, and only while a job is pending.
+    """
+    if st.session_state.pdf_path is None and st.session_state.export_job is None:
+        if st.session_state.export_error:
+            st.error(st.session_state.export_error)
 
-    if st.session_state.pdf_path is None:
         if st.button("📄 Generate Full Analysis PDF"):
-            st.session_state.pdf_path = exporter.export_full_analysis(
+            st.session_state.export_error = None
+            st.session_state.export_job = load_export_queue().submit(
                 st.session_state.analysis_payload
             )
-            st.toast("✅ PDF generated successfully", icon="📄")
+
+    if st.session_state.export_job is not None:
+        poll_export()
 
     if st.session_state.pdf_path:
         with open(st.session_state.pdf_path, "rb") as f:
@@ -427,3 +431,10 @@ if st.session_state.analysis_ready:
                 file_name=st.session_state.pdf_path.split("/")[-1],
                 mime="application/pdf"
             )
+
+
+if st.session_state.analysis_ready:
+    st.divider()
+    st.subheader("📤 Export Full Analysis")
+
+    render_export()